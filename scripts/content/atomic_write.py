@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, ContextManager, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes stay atomic, but concurrent runs are not serialized.
+    fcntl = None
+
+# Directories this process has locked, so a caller holding locked() can still call write_text().
+HELD_LOCKS: set[Path] = set()
+
+
+def dump_json(data: Any, indent: int | None = 2, sort_keys: bool = False, ensure_ascii: bool = True) -> str:
+    """The repo's JSON file layout: the same data always serializes to the same bytes."""
+    if indent is None:
+        return json.dumps(data, sort_keys=sort_keys, ensure_ascii=ensure_ascii)
+    return json.dumps(data, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii) + "\n"
+
+
+def locked(path: Path) -> ContextManager[None]:
+    """Hold an advisory lock for path's directory.
+
+    Files are replaced by rename, so the lock is taken on the directory instead of the
+    file. Hold it across a read-modify-write so concurrent runs cannot drop each other's
+    changes; writes made while it is held reuse it.
+    """
+    return locked_directory(path.parent.resolve())
+
+
+def locked_tree(root: Path) -> ContextManager[None]:
+    """Hold the advisory lock for everything under root (the tests root for spec edits).
+
+    Scripts that edit specs all lock the same directory, whether they touch one spec or
+    many, so a bulk import and a single-spec import are serialized with each other.
+    """
+    return locked_directory(root.resolve())
+
+
+@contextmanager
+def locked_directory(directory: Path) -> Iterator[None]:
+    if directory in HELD_LOCKS:
+        yield
+        return
+
+    directory.mkdir(parents=True, exist_ok=True)
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        HELD_LOCKS.add(directory)
+        try:
+            yield
+        finally:
+            HELD_LOCKS.discard(directory)
+    finally:
+        os.close(fd)
+
+
+def unchanged(path: Path, payload: bytes) -> bool:
+    try:
+        return path.stat().st_size == len(payload) and path.read_bytes() == payload
+    except OSError:
+        return False
+
+
+def stage(path: Path, payload: bytes) -> Path:
+    """Write payload to a synced temp file beside path and return the temp file's path."""
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        try:
+            mode = path.stat().st_mode & 0o777
+        except OSError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+    return Path(temp_name)
+
+
+def sync_directory(directory: Path) -> None:
+    """Persist renames in directory; not every platform can open a directory for this."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_files(files: list[tuple[Path, str]]) -> list[Path]:
+    """Write several text files all-or-nothing; returns the paths whose content changed.
+
+    Every changed file is staged and synced before the first one is renamed into place, so a
+    failure while staging leaves all targets untouched. Unchanged files are not rewritten,
+    which keeps their mtimes for tools that cache on them.
+    """
+    pending = [(path, text.encode("utf-8")) for path, text in files]
+    if not pending:
+        return []
+    # Files spread over many directories lock their closest common one. That only serializes
+    # the writes; spec edits also hold locked_tree() across their read-modify-write.
+    directory = Path(os.path.commonpath([path.parent.resolve() for path, _ in pending]))
+    with locked_directory(directory):
+        staged: list[tuple[Path, Path]] = []
+        try:
+            for path, payload in pending:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                if not unchanged(path, payload):
+                    staged.append((stage(path, payload), path))
+        except BaseException:
+            for temp_path, _ in staged:
+                temp_path.unlink(missing_ok=True)
+            raise
+        for temp_path, path in staged:
+            os.replace(temp_path, path)
+        for parent in sorted({path.parent for _, path in staged}):
+            sync_directory(parent)
+    return [path for _, path in staged]
+
+
+def write_text(path: Path, text: str) -> bool:
+    """Atomically replace path with text unless it already has that content; True if written."""
+    return bool(write_files([(path, text)]))
+
+
+def write_json(path: Path, data: Any, **options: Any) -> bool:
+    """write_text() of dump_json(data, **options)."""
+    return write_text(path, dump_json(data, **options))
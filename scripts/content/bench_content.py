@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import lint_locales
+import synth_catalog
+import validate_catalog
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+CONTENT_DIR = ROOT_DIR / "scripts" / "content"
+DEFAULT_OUTPUT_PATH = ROOT_DIR / ".cache" / "bench_content.json"
+VALUES_SOURCE_DIR = ROOT_DIR / "content" / "sources" / "test-values-compass"
+REPORT_VERSION = 1
+MICRO_ITERATIONS = 200
+
+# Spawned children inherit the parent's peak RSS, so each tool is started from this small
+# launcher instead of the harness. It reports wall time and the tool's own ru_maxrss.
+LAUNCHER = """
+import json, os, sys, time
+actions = [(os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_WRONLY, 0) for fd in (1, 2)]
+started = time.perf_counter()
+pid = os.posix_spawn(sys.argv[1], sys.argv[1:], os.environ, file_actions=actions)
+_, status, usage = os.wait4(pid, 0)
+elapsed = time.perf_counter() - started
+print(json.dumps([elapsed, usage.ru_maxrss, os.waitstatus_to_exitcode(status)]))
+"""
+
+
+@dataclass
+class ToolResult:
+    tool: str
+    specs: int | None
+    runs: list[float] = field(default_factory=list)
+    peak_rss_kb: int | None = None
+    exit_code: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["best_seconds"] = min(self.runs) if self.runs else None
+        data["median_seconds"] = statistics.median(self.runs) if self.runs else None
+        return data
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the content scripts against synthetic catalogs of increasing size."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000],
+        help="Catalog sizes (number of specs) to benchmark (default: 100 1000)"
+    )
+    parser.add_argument("--tenants", type=int, default=20, help="Tenants per catalog (default: 20)")
+    parser.add_argument("--questions", type=int, default=20, help="Questions per spec (default: 20)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per tool (default: 3)")
+    parser.add_argument("--seed", type=int, default=1, help="Generator seed (default: 1)")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker count for the parallel validate_catalog and lint_locales runs (default: 0, all CPUs)"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_OUTPUT_PATH,
+        help="JSON report path (default: .cache/bench_content.json)"
+    )
+    parser.add_argument("--compare", type=Path, help="Earlier report to compare against")
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        help="Directory for generated catalogs (default: a temporary directory that is removed)"
+    )
+    args = parser.parse_args(argv)
+    if any(size < 2 for size in args.sizes):
+        parser.error("--sizes must be >= 2 so both spec formats are present")
+    for name in ["tenants", "questions", "repeat"]:
+        if getattr(args, name) < 1:
+            parser.error(f"--{name} must be >= 1")
+    return args
+
+
+def run_measured(argv: list[str]) -> tuple[float, int | None, int]:
+    """Run a command; returns (wall seconds, peak RSS in KiB, exit code)."""
+    if not hasattr(os, "wait4") or not hasattr(os, "posix_spawn"):
+        started = time.perf_counter()
+        exit_code = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode
+        return time.perf_counter() - started, None, exit_code
+
+    completed = subprocess.run(
+        [sys.executable, "-c", LAUNCHER, *argv],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    elapsed, peak_rss, exit_code = json.loads(completed.stdout)
+    if sys.platform == "darwin":
+        peak_rss //= 1024
+    return elapsed, peak_rss, exit_code
+
+
+def measure_tool(tool: str, specs: int | None, argv: list[str], repeat: int) -> ToolResult:
+    result = ToolResult(tool, specs)
+    for _ in range(repeat):
+        elapsed, peak_rss, exit_code = run_measured(argv)
+        result.runs.append(elapsed)
+        if peak_rss is not None:
+            result.peak_rss_kb = max(result.peak_rss_kb or 0, peak_rss)
+        result.exit_code = max(result.exit_code, exit_code)
+    return result
+
+
+def script(name: str) -> list[str]:
+    return [sys.executable, str(CONTENT_DIR / name)]
+
+
+def catalog_commands(catalog_dir: Path, jobs: int) -> dict[str, list[str]]:
+    tests_root = catalog_dir / "content" / "tests"
+    catalog_args = [
+        "--tests-root",
+        str(tests_root),
+        "--tenants-path",
+        str(catalog_dir / "config" / "tenants.json"),
+        "--catalog-path",
+        str(catalog_dir / "config" / "catalog.json")
+    ]
+    lint_args = [
+        "--tests-root",
+        str(tests_root),
+        "--allowlist-path",
+        str(catalog_dir / "config" / "locale_lint_allowlist.json")
+    ]
+    return {
+        "validate_catalog": script("validate_catalog.py") + catalog_args + ["--no-cache"],
+        "validate_catalog_parallel": (
+            script("validate_catalog.py") + catalog_args + ["--no-cache", "--jobs", str(jobs)]
+        ),
+        "validate_catalog_warm_cache": (
+            script("validate_catalog.py")
+            + catalog_args
+            + ["--cache-path", str(catalog_dir / "validate_cache.json")]
+        ),
+        "lint_locales": script("lint_locales.py") + lint_args + ["--no-cache"],
+        "lint_locales_parallel": script("lint_locales.py") + lint_args + ["--no-cache", "--jobs", str(jobs)],
+        "lint_locales_warm_cache": (
+            script("lint_locales.py") + lint_args + ["--cache-path", str(catalog_dir / "lint_cache.json")]
+        ),
+        "import_questions_csv": script("import_questions_csv.py") + [
+            "--tests-root",
+            str(tests_root),
+            "--test-id",
+            synth_catalog.synth_test_id(0),
+            "--csv",
+            str(catalog_dir / "questions.csv"),
+            "--replace"
+        ],
+        "universal_human_md_to_spec": script("universal_human_md_to_spec.py") + [
+            "--source-dir",
+            str(catalog_dir / "content" / "sources" / synth_catalog.synth_test_id(1)),
+            "--out",
+            str(catalog_dir / "universal_out.json")
+        ]
+    }
+
+
+def values_converter_command(out_dir: Path) -> list[str]:
+    return script("values_compass_md_to_spec.py") + [
+        "--test-id",
+        "test-values-compass",
+        "--slug",
+        "values-compass",
+        "--category",
+        "values",
+        "--version",
+        "1",
+        "--en",
+        str(VALUES_SOURCE_DIR / "source.en.md"),
+        "--es",
+        str(VALUES_SOURCE_DIR / "source.es.md"),
+        "--ptbr",
+        str(VALUES_SOURCE_DIR / "source.pt-BR.md"),
+        "--out",
+        str(out_dir / "values_out.json")
+    ]
+
+
+def micro_validate_spec(catalog_dir: Path, questions: int) -> list[dict[str, Any]]:
+    """Time validate_spec in-process on one spec of each format (best of several batches)."""
+    results = []
+    tests_root = catalog_dir / "content" / "tests"
+    for index in [0, 1]:
+        spec_path = tests_root / synth_catalog.synth_test_id(index) / "spec.json"
+        data = json.loads(spec_path.read_text(encoding="utf-8"))
+        best = float("inf")
+        for _ in range(5):
+            started = time.perf_counter()
+            for _ in range(MICRO_ITERATIONS):
+                validate_catalog.validate_spec(spec_path, data, [])
+            best = min(best, (time.perf_counter() - started) / MICRO_ITERATIONS)
+        results.append(
+            {
+                "name": f"validate_spec[{synth_catalog.spec_format(index)}]",
+                "questions": questions,
+                "per_call_us": round(best * 1_000_000, 2)
+            }
+        )
+    return results
+
+
+def collect_locale_pairs(value: Any, pairs: list[tuple[str, str]]) -> None:
+    """Collect normalized (en, other locale) string pairs the way lint_locales compares them."""
+    if isinstance(value, dict):
+        en_value = value.get("en")
+        for key, item in value.items():
+            if isinstance(en_value, str) and key != "en" and isinstance(item, str):
+                pairs.append((lint_locales.normalize_text(en_value), lint_locales.normalize_text(item)))
+            else:
+                collect_locale_pairs(item, pairs)
+        locales = value.get("locales")
+        if isinstance(locales, dict) and isinstance(locales.get("en"), dict):
+            for locale, block in locales.items():
+                if locale == "en" or not isinstance(block, dict):
+                    continue
+                for field_name, en_text in locales["en"].items():
+                    if isinstance(en_text, str) and isinstance(block.get(field_name), str):
+                        pairs.append(
+                            (lint_locales.normalize_text(en_text), lint_locales.normalize_text(block[field_name]))
+                        )
+    elif isinstance(value, list):
+        for item in value:
+            collect_locale_pairs(item, pairs)
+
+
+def micro_similarity(catalog_dir: Path, questions: int) -> list[dict[str, Any]]:
+    """Time the exact ratio against the tiered similarity check on every locale pair of two specs."""
+    pairs: list[tuple[str, str]] = []
+    tests_root = catalog_dir / "content" / "tests"
+    for index in [0, 1]:
+        spec_path = tests_root / synth_catalog.synth_test_id(index) / "spec.json"
+        collect_locale_pairs(json.loads(spec_path.read_text(encoding="utf-8")), pairs)
+    threshold = lint_locales.DEFAULT_SIMILARITY_THRESHOLD
+    variants = {
+        "similarity[exact]": lambda a, b: lint_locales.compute_similarity(a, b),
+        "similarity[tiered]": lambda a, b: lint_locales.similarity_at_least(a, b, threshold)
+    }
+    results = []
+    for name, fn in variants.items():
+        best = float("inf")
+        for _ in range(5):
+            started = time.perf_counter()
+            for a, b in pairs:
+                fn(a, b)
+            best = min(best, (time.perf_counter() - started) / 2)
+        results.append({"name": name, "questions": questions, "per_call_us": round(best * 1_000_000, 2)})
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def run_benchmarks(args: argparse.Namespace, workdir: Path) -> dict[str, Any]:
+    results: list[ToolResult] = []
+    micro: list[dict[str, Any]] = []
+    for size in args.sizes:
+        catalog_dir = workdir / f"specs-{size}"
+        if catalog_dir.exists():
+            shutil.rmtree(catalog_dir)
+        synth_catalog.generate_catalog(
+            catalog_dir,
+            specs=size,
+            tenants=args.tenants,
+            questions=args.questions,
+            seed=args.seed
+        )
+        commands = catalog_commands(catalog_dir, args.jobs)
+        # Prime the caches so the warm runs measure the all-hits path.
+        run_measured(commands["validate_catalog_warm_cache"])
+        run_measured(commands["lint_locales_warm_cache"])
+        for tool, argv in commands.items():
+            print(f"==> {tool} ({size} specs)")
+            sys.stdout.flush()
+            results.append(measure_tool(tool, size, argv, args.repeat))
+        if not micro:
+            micro = micro_validate_spec(catalog_dir, args.questions) + micro_similarity(
+                catalog_dir,
+                args.questions
+            )
+
+    if VALUES_SOURCE_DIR.exists():
+        print("==> values_compass_md_to_spec (repository sources)")
+        results.append(
+            measure_tool("values_compass_md_to_spec", None, values_converter_command(workdir), args.repeat)
+        )
+
+    return {
+        "version": REPORT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "params": {
+            "sizes": args.sizes,
+            "tenants": args.tenants,
+            "questions": args.questions,
+            "repeat": args.repeat,
+            "seed": args.seed,
+            "jobs": args.jobs
+        },
+        "results": [result.to_dict() for result in results],
+        "micro": micro
+    }
+
+
+def print_report(report: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    previous: dict[tuple[str, Any], float] = {}
+    if baseline:
+        for entry in baseline.get("results", []):
+            if entry.get("best_seconds"):
+                previous[(entry["tool"], entry.get("specs"))] = entry["best_seconds"]
+
+    for entry in report["results"]:
+        size = "-" if entry["specs"] is None else str(entry["specs"])
+        rss = "n/a" if entry["peak_rss_kb"] is None else f"{entry['peak_rss_kb'] / 1024:.1f} MiB"
+        line = f"{entry['tool']:<28} {size:>7} specs  best {entry['best_seconds']:.3f}s  peak {rss}"
+        old = previous.get((entry["tool"], entry["specs"]))
+        if old:
+            line += f"  ({entry['best_seconds'] / old:.2f}x baseline)"
+        if entry["exit_code"]:
+            line += f"  exit={entry['exit_code']}"
+        print(line)
+    for entry in report["micro"]:
+        print(f"{entry['name']:<36} {entry['questions']:>3} questions  {entry['per_call_us']:.1f} us/spec")
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    baseline = None
+    if args.compare:
+        errors: list[str] = []
+        baseline = validate_catalog.load_json(args.compare, str(args.compare), errors)
+        if errors:
+            for message in errors:
+                print(f"ERROR: {message}", file=sys.stderr)
+            return 1
+
+    if args.workdir:
+        args.workdir.mkdir(parents=True, exist_ok=True)
+        report = run_benchmarks(args, args.workdir)
+    else:
+        with tempfile.TemporaryDirectory(prefix="bench-content-") as temp_dir:
+            report = run_benchmarks(args, Path(temp_dir))
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    print_report(report, baseline)
+    print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,30 +2,83 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
-import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Iterator
 
+import universal_human_md_to_spec
 import validate_catalog
+import values_compass_md_to_spec
+from atomic_write import dump_json, locked, locked_tree, write_json, write_text
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 CATALOG_PATH = ROOT_DIR / "config" / "catalog.json"
 TESTS_ROOT = ROOT_DIR / "content" / "tests"
 SOURCES_ROOT = ROOT_DIR / "content" / "sources"
-VALUES_CONVERTER_PATH = ROOT_DIR / "scripts" / "content" / "values_compass_md_to_spec.py"
-UNIVERSAL_CONVERTER_PATH = ROOT_DIR / "scripts" / "content" / "universal_human_md_to_spec.py"
+CONTENT_DIR = ROOT_DIR / "scripts" / "content"
+DEFAULT_MANIFEST_PATH = ROOT_DIR / ".cache" / "content_build.json"
 
+# Bump when the build changes in a way the converter fingerprints cannot see.
+BUILD_VERSION = 1
+# A spec is rebuilt when its converter, or dump_json's layout, changes.
+CONVERTER_SOURCE_FILES = {
+    "values_compass_v1": [CONTENT_DIR / "values_compass_md_to_spec.py", CONTENT_DIR / "atomic_write.py"],
+    "universal_human_v1": [CONTENT_DIR / "universal_human_md_to_spec.py", CONTENT_DIR / "atomic_write.py"]
+}
 
-def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Add content sources and update the catalog")
+# Set in each build worker by init_build_worker.
+WORKER_PARSE_CACHE: values_compass_md_to_spec.ParseCache | None = None
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Add content sources and update the catalog (see also: content_add.py build --help)"
+    )
     parser.add_argument("--format", required=True, help="values_compass_v1 or universal_human_v1")
     parser.add_argument("--test-id", required=True)
     parser.add_argument("--tenant-id", required=True)
     parser.add_argument("--slug")
     parser.add_argument("--category")
     parser.add_argument("--version", type=int)
-    return parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def parse_build_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="content_add.py build",
+        description="Rebuild specs from content/sources, skipping those whose sources and converter are unchanged"
+    )
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--all", action="store_true", help="Build every content/sources/<test_id> directory")
+    target.add_argument(
+        "--test-id",
+        action="append",
+        dest="test_ids",
+        metavar="TEST_ID",
+        help="Build one test (repeatable)"
+    )
+    parser.add_argument("--force", action="store_true", help="Rebuild even when the manifest says a spec is fresh")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes for converting sources (default: 0, all CPUs)"
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=DEFAULT_MANIFEST_PATH,
+        help="Build manifest path (default: .cache/content_build.json)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Parse every values_compass source file again")
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    return args
 
 
 def validate_format(format_id: str, errors: list[str]) -> None:
@@ -33,6 +86,20 @@ def validate_format(format_id: str, errors: list[str]) -> None:
         errors.append("format must be values_compass_v1 or universal_human_v1")
 
 
+def detect_source_format(path: Path) -> str | None:
+    """Universal sources open with YAML front matter; values compass sources use numbered sections."""
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if lines and lines[0].strip() == "---":
+        return "universal_human_v1"
+    for line, next_line in zip(lines, lines[1:]):
+        if values_compass_md_to_spec.SECTION_HEADER_RE.match(line) and values_compass_md_to_spec.is_underline(next_line):
+            return "values_compass_v1"
+    return None
+
+
 def resolve_slug(test_id: str, slug: str | None, errors: list[str]) -> str:
     if slug:
         return slug
@@ -50,8 +117,8 @@ def resolve_version(version: int | None) -> int:
     return version if version is not None else 1
 
 
-def ensure_sources(test_id: str, errors: list[str]) -> dict[str, Path]:
-    source_dir = SOURCES_ROOT / test_id
+def ensure_sources(test_id: str, errors: list[str], sources_root: Path = SOURCES_ROOT) -> dict[str, Path]:
+    source_dir = sources_root / test_id
     sources = {
         "en": source_dir / "source.en.md",
         "es": source_dir / "source.es.md",
@@ -72,34 +139,15 @@ def run_values_converter(
     output_path: Path,
     errors: list[str]
 ) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    cmd = [
-        sys.executable,
-        str(VALUES_CONVERTER_PATH),
-        "--test-id",
-        test_id,
-        "--slug",
-        slug,
-        "--category",
-        category,
-        "--version",
-        str(version),
-        "--en",
-        str(sources["en"]),
-        "--es",
-        str(sources["es"]),
-        "--ptbr",
-        str(sources["pt-BR"]),
-        "--out",
-        str(output_path)
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    if result.returncode != 0:
-        errors.append("values_compass_md_to_spec.py failed")
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
+    parse_cache = values_compass_md_to_spec.ParseCache.load(values_compass_md_to_spec.DEFAULT_CACHE_PATH)
+    spec, convert_errors = values_compass_md_to_spec.convert(
+        test_id, slug, category, version, sources, parse_cache
+    )
+    parse_cache.save()
+    errors.extend(convert_errors)
+    if spec is not None:
+        with locked_tree(TESTS_ROOT):
+            write_json(output_path, spec)
 
 
 def run_universal_converter(
@@ -107,32 +155,32 @@ def run_universal_converter(
     output_path: Path,
     errors: list[str]
 ) -> None:
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    source_dir = SOURCES_ROOT / test_id
-    cmd = [
-        sys.executable,
-        str(UNIVERSAL_CONVERTER_PATH),
-        "--source-dir",
-        str(source_dir),
-        "--out",
-        str(output_path)
-    ]
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    if result.returncode != 0:
-        errors.append("universal_human_md_to_spec.py failed")
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-
-
-def run_validate_catalog(errors: list[str]) -> None:
-    result = validate_catalog.main()
-    if result != 0:
-        errors.append("validate_catalog.py failed")
+    spec, convert_errors = universal_human_md_to_spec.convert(SOURCES_ROOT / test_id)
+    errors.extend(convert_errors)
+    if spec is not None:
+        with locked_tree(TESTS_ROOT):
+            write_json(output_path, spec)
+
+
+def run_validate_catalog(test_id: str, errors: list[str]) -> None:
+    # Other specs come from the validation cache; only the new spec and its references are re-checked.
+    validator = validate_catalog.CatalogValidator(
+        tests_root=TESTS_ROOT,
+        catalog_path=CATALOG_PATH,
+        cache=validate_catalog.ValidationCache.load(validate_catalog.DEFAULT_CACHE_PATH)
+    )
+    validator.load(identity_only=True)
+    errors.extend(validator.validate_one(test_id))
+    validator.save_cache()
 
 
 def update_catalog(test_id: str, tenant_id: str, errors: list[str]) -> bool:
+    # The lock spans the read, so a concurrent content_add cannot drop this test or its own.
+    with locked(CATALOG_PATH):
+        return add_catalog_entry(test_id, tenant_id, errors)
+
+
+def add_catalog_entry(test_id: str, tenant_id: str, errors: list[str]) -> bool:
     if not CATALOG_PATH.exists():
         errors.append(f"catalog.json not found at {CATALOG_PATH}")
         return False
@@ -162,14 +210,302 @@ def update_catalog(test_id: str, tenant_id: str, errors: list[str]) -> bool:
         return False
 
     tests.append(test_id)
-    new_raw = json.dumps(catalog, indent=2) + "\n"
-    if new_raw != raw:
-        CATALOG_PATH.write_text(new_raw, encoding="utf-8")
+    write_text(CATALOG_PATH, dump_json(catalog))
     return True
 
 
-def main() -> int:
-    args = parse_args()
+def sha256_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def spec_digest(spec_path: Path) -> str | None:
+    try:
+        return sha256_file(spec_path)
+    except OSError:
+        return None
+
+
+def converter_fingerprint(format_id: str) -> str:
+    digest = hashlib.sha256(f"build-v{BUILD_VERSION}:{format_id}".encode("utf-8"))
+    for source_path in CONVERTER_SOURCE_FILES[format_id]:
+        digest.update(source_path.read_bytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class BuildTask:
+    test_id: str
+    format_id: str
+    sources: dict[str, Path]
+    # values_compass_v1 only: slug, category and version are not part of its sources.
+    params: dict[str, Any]
+    spec_path: Path
+
+
+@dataclass
+class BuildReport:
+    built: list[Path] = field(default_factory=list)
+    fresh: list[Path] = field(default_factory=list)
+    # Specs edited since they were built (CSV imports, translator patches); only --force replaces them.
+    kept: list[Path] = field(default_factory=list)
+    # --all source directories in a layout neither converter reads, such as drafts.
+    skipped: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+
+class BuildManifest:
+    """Per-test source hashes, converter fingerprint and output hash of the last build."""
+
+    def __init__(self, path: Path, entries: dict[str, dict[str, Any]] | None = None):
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = entries or {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> "BuildManifest":
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path)
+        if not isinstance(data, dict) or data.get("version") != BUILD_VERSION:
+            return cls(path)
+        entries = data.get("entries")
+        return cls(path, entries if isinstance(entries, dict) else None)
+
+    def built_output(self, task: BuildTask) -> str | None:
+        entry = self.entries.get(task.test_id)
+        return entry.get("output") if isinstance(entry, dict) else None
+
+    def is_fresh(self, task: BuildTask, inputs: dict[str, Any], current: str | None) -> bool:
+        entry = self.entries.get(task.test_id)
+        if not isinstance(entry, dict) or entry.get("inputs") != inputs:
+            return False
+        # A spec changed by a branch switch or an edit no longer matches its recorded hash.
+        return current is not None and current == entry.get("output")
+
+    def record(self, task: BuildTask, inputs: dict[str, Any], output_digest: str) -> None:
+        self.entries[task.test_id] = {"inputs": inputs, "output": output_digest}
+        self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        write_json(self.path, {"version": BUILD_VERSION, "entries": self.entries}, indent=None, sort_keys=True)
+        self.dirty = False
+
+
+def list_source_test_ids(sources_root: Path = SOURCES_ROOT) -> list[str]:
+    if not sources_root.is_dir():
+        return []
+    return sorted(path.name for path in sources_root.iterdir() if path.is_dir())
+
+
+def read_build_params(test_id: str, spec_path: Path) -> dict[str, Any]:
+    """Keep the slug, category and version of an existing spec; new specs get content_add's defaults."""
+    params: dict[str, Any] = {
+        "slug": test_id[len("test-"):] if test_id.startswith("test-") else test_id,
+        "category": resolve_category(None),
+        "version": resolve_version(None)
+    }
+    try:
+        existing = json.loads(spec_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return params
+    if not isinstance(existing, dict):
+        return params
+    for key, value in params.items():
+        if isinstance(existing.get(key), type(value)):
+            params[key] = existing[key]
+    return params
+
+
+def plan_build(
+    test_ids: list[str],
+    report: BuildReport,
+    skip_unknown: bool = False,
+    tests_root: Path = TESTS_ROOT,
+    sources_root: Path = SOURCES_ROOT
+) -> list[BuildTask]:
+    tasks: list[BuildTask] = []
+    for test_id in test_ids:
+        source_errors: list[str] = []
+        sources = ensure_sources(test_id, source_errors, sources_root)
+        formats = {detect_source_format(path) for path in sources.values() if path.exists()}
+        if skip_unknown and formats == {None}:
+            report.skipped.append(test_id)
+            continue
+        if not source_errors and formats not in ({"values_compass_v1"}, {"universal_human_v1"}):
+            source_errors.append("cannot detect one source format for all locales")
+        if source_errors:
+            report.errors.extend(f"{test_id}: {message}" for message in source_errors)
+            continue
+        format_id = formats.pop()
+        spec_path = tests_root / test_id / "spec.json"
+        params = read_build_params(test_id, spec_path) if format_id == "values_compass_v1" else {}
+        tasks.append(BuildTask(test_id, format_id, sources, params, spec_path))
+    return tasks
+
+
+def build_inputs(task: BuildTask, fingerprints: dict[str, str]) -> dict[str, Any]:
+    return {
+        "format": task.format_id,
+        "converter": fingerprints[task.format_id],
+        "params": task.params,
+        "sources": {locale: sha256_file(path) for locale, path in task.sources.items()}
+    }
+
+
+def convert_task(
+    task: BuildTask,
+    parse_cache: values_compass_md_to_spec.ParseCache | None = None
+) -> tuple[str | None, list[str]]:
+    """Convert one test's sources to spec.json text."""
+    if task.format_id == "values_compass_v1":
+        spec, errors = values_compass_md_to_spec.convert(
+            task.test_id,
+            task.params["slug"],
+            task.params["category"],
+            task.params["version"],
+            task.sources,
+            parse_cache
+        )
+    else:
+        spec, errors = universal_human_md_to_spec.convert(task.sources["en"].parent)
+    return (dump_json(spec) if spec is not None else None), errors
+
+
+def init_build_worker(parse_cache: values_compass_md_to_spec.ParseCache | None) -> None:
+    # Sent once per worker (inherited copy-on-write under fork) instead of with every task.
+    global WORKER_PARSE_CACHE
+    if parse_cache is not None:
+        parse_cache.added = {}
+    WORKER_PARSE_CACHE = parse_cache
+
+
+def convert_task_worker(task: BuildTask) -> tuple[str | None, list[str], dict[str, dict[str, Any]]]:
+    text, errors = convert_task(task, WORKER_PARSE_CACHE)
+    # The worker's cache copy is discarded with the pool; the parent merges what it parsed.
+    return text, errors, WORKER_PARSE_CACHE.take_added() if WORKER_PARSE_CACHE is not None else {}
+
+
+def iter_converted(
+    tasks: list[BuildTask],
+    jobs: int,
+    parse_cache: values_compass_md_to_spec.ParseCache | None = None
+) -> Iterator[tuple[str | None, list[str]]]:
+    jobs = min(validate_catalog.resolve_jobs(jobs), len(tasks))
+    if jobs <= 1:
+        for task in tasks:
+            yield convert_task(task, parse_cache)
+        return
+
+    # Executor.map yields results in submission order, so output matches a serial build.
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=init_build_worker,
+        initargs=(parse_cache,)
+    ) as executor:
+        for text, errors, added in executor.map(convert_task_worker, tasks):
+            if parse_cache is not None:
+                parse_cache.merge(added)
+            yield text, errors
+
+
+def build_specs(
+    test_ids: list[str],
+    manifest: BuildManifest,
+    jobs: int = 0,
+    force: bool = False,
+    skip_unknown: bool = False,
+    tests_root: Path = TESTS_ROOT,
+    sources_root: Path = SOURCES_ROOT,
+    parse_cache: values_compass_md_to_spec.ParseCache | None = None
+) -> BuildReport:
+    """Rebuild the stale specs among test_ids, converting across jobs workers.
+
+    A spec is fresh when its sources, converter fingerprint and build params match the
+    manifest and spec.json still has the hash recorded there. A stale spec is replaced only
+    if it is missing, is the output of the last build, or already equals the new output;
+    anything else was edited after its build and is kept unless force is set. A test whose
+    sources fail to convert keeps its previous spec. With a parse cache, only the changed
+    values_compass source files of a stale test are parsed again.
+    """
+    report = BuildReport()
+    tasks = plan_build(test_ids, report, skip_unknown, tests_root, sources_root)
+    fingerprints = {format_id: converter_fingerprint(format_id) for format_id in {task.format_id for task in tasks}}
+
+    stale: list[tuple[BuildTask, dict[str, Any]]] = []
+    for task in tasks:
+        inputs = build_inputs(task, fingerprints)
+        current = spec_digest(task.spec_path)
+        if not force and manifest.is_fresh(task, inputs, current):
+            report.fresh.append(task.spec_path)
+        else:
+            stale.append((task, inputs))
+
+    converted = iter_converted([task for task, _ in stale], jobs, parse_cache)
+    for (task, inputs), (text, errors) in zip(stale, converted):
+        if text is None:
+            report.errors.extend(f"{task.test_id}: {message}" for message in errors)
+            continue
+        output = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        # Same lock as import_questions_csv; the spec is checked again under it, since an
+        # import may have edited it while the sources were converting.
+        with locked_tree(tests_root):
+            current = spec_digest(task.spec_path)
+            if not force and current not in (None, output, manifest.built_output(task)):
+                report.kept.append(task.spec_path)
+                continue
+            write_text(task.spec_path, text)
+        manifest.record(task, inputs, output)
+        report.built.append(task.spec_path)
+    return report
+
+
+def build_main(argv: list[str]) -> int:
+    args = parse_build_args(argv)
+    test_ids = list_source_test_ids() if args.all else [test_id.strip() for test_id in args.test_ids]
+    manifest = BuildManifest.load(args.manifest)
+    parse_cache = (
+        None if args.no_cache else values_compass_md_to_spec.ParseCache.load(values_compass_md_to_spec.DEFAULT_CACHE_PATH)
+    )
+    report = build_specs(test_ids, manifest, args.jobs, args.force, skip_unknown=args.all, parse_cache=parse_cache)
+    manifest.save()
+    if parse_cache is not None:
+        parse_cache.save()
+
+    if report.built:
+        validator = validate_catalog.CatalogValidator(
+            tests_root=TESTS_ROOT,
+            catalog_path=CATALOG_PATH,
+            cache=validate_catalog.ValidationCache.load(validate_catalog.DEFAULT_CACHE_PATH)
+        )
+        validator.load(identity_only=True)
+        report.errors.extend(validator.revalidate(report.built))
+        validator.save_cache()
+
+    for spec_path in report.built:
+        print(f"Built spec: {spec_path}")
+    for spec_path in report.kept:
+        print(f"Kept spec edited since its last build (rebuild with --force): {spec_path}")
+    if report.skipped:
+        print(f"Skipped sources in no known format: {', '.join(report.skipped)}")
+    print(
+        f"Built {len(report.built)} spec(s), {len(report.fresh)} up to date, {len(report.kept)} kept"
+    )
+    if report.errors:
+        for message in report.errors:
+            print(f"ERROR: {message}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["build"]:
+        return build_main(argv[1:])
+
+    args = parse_args(argv)
     errors: list[str] = []
 
     test_id = args.test_id.strip()
@@ -222,8 +558,7 @@ def main() -> int:
             print(f"ERROR: {message}", file=sys.stderr)
         return 1
 
-    if args.format == "universal_human_v1":
-        run_validate_catalog(errors)
+    run_validate_catalog(test_id, errors)
 
     if errors:
         for message in errors:
@@ -1,4 +1,11 @@
+import contextlib
+import hashlib
+import io
 import json
+import os
+import pickle
+import shutil
+import subprocess
 import sys
 import unittest
 from pathlib import Path
@@ -8,10 +15,21 @@ ROOT_DIR = Path(__file__).resolve().parents[2]
 CONTENT_DIR = ROOT_DIR / "scripts" / "content"
 sys.path.insert(0, str(CONTENT_DIR))
 
+import atomic_write
+import content_add
+import content_watch
+import diagnostics
+import export_questions_csv
 import import_questions_csv
+import language_id
 import lint_locales
+import localized_fields
+import near_duplicates
 import new_test
+import synth_catalog
+import universal_human_md_to_spec
 import validate_catalog
+import values_compass_md_to_spec
 
 
 class ContentFactoryTest(unittest.TestCase):
@@ -81,6 +99,232 @@ class ContentFactoryTest(unittest.TestCase):
             validate_catalog.validate_spec(spec_path, data, validation_errors)
             self.assertEqual(validation_errors, [])
 
+    def test_import_questions_csv_streams_rows_and_reports_progress(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            tests_root = Path(temp_dir) / "content" / "tests"
+            tests_root.mkdir(parents=True)
+            spec_path, errors = new_test.create_test_spec(
+                test_id="test-stream",
+                slug="stream",
+                locales=["en", "es", "pt-BR"],
+                category="daily-habits",
+                tests_root=tests_root
+            )
+            self.assertEqual(errors, [])
+
+            csv_path = Path(temp_dir) / "questions.csv"
+            lines = [
+                "question_id,option_id,prompt_en,prompt_es,prompt_pt_br,"
+                "option_label_en,option_label_es,option_label_pt_br,weight"
+            ]
+            for question, option in [("q1", "a"), ("q1", "b"), ("q2", "a"), ("q2", "b"), ("q1", "c")]:
+                lines.append(
+                    f"{question},{question}-{option},Prompt {question},Pregunta {question},"
+                    f"Pergunta {question},Option {option},Opcion {option},Opcao {option},1"
+                )
+            csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+            progress: list[int] = []
+            import_errors = import_questions_csv.import_questions_from_csv(
+                test_id="test-stream",
+                csv_path=csv_path,
+                replace=True,
+                tests_root=tests_root,
+                progress=progress.append,
+                progress_every=2
+            )
+            self.assertEqual(import_errors, [])
+            self.assertEqual(progress, [2, 4, 5])
+
+            data = json.loads(spec_path.read_text(encoding="utf-8"))
+            self.assertEqual(
+                [[option["id"] for option in question["options"]] for question in data["questions"]],
+                [["q1-a", "q1-b", "q1-c"], ["q2-a", "q2-b"]]
+            )
+
+            # Rows are checked in file order. As in the baseline, the option_id is checked
+            # before the other fields, and a rejected row still reserves it.
+            row = {
+                "prompt_en": "One", "prompt_es": "Uno", "prompt_pt_br": "Um",
+                "option_label_en": "Yes", "option_label_es": "Si", "option_label_pt_br": "Sim",
+                "weight": "1"
+            }
+            errors = []
+            rows = [
+                ("row 2", {**row, "question_id": "q1", "option_id": "q1-a"}),
+                ("row 3", {**row, "question_id": "q2", "option_id": "q1-a", "prompt_en": "Two"}),
+                ("row 4", {**row, "question_id": "q1", "option_id": "q1-b", "prompt_en": "Uno"}),
+                ("row 5", {**row, "question_id": "q2", "option_id": "q2-a", "weight": "x"}),
+                ("row 6", {**row, "question_id": "q3", "option_id": "q1-a", "prompt_es": ""}),
+                ("row 7", {**row, "question_id": "q3", "option_id": "q3-a", "option_label_en": ""}),
+                ("row 8", {**row, "question_id": "q3", "option_id": "q3-a"}),
+                ("row 9", {**row, "question_id": "q1", "option_id": "q1-b"})
+            ]
+            import_questions_csv.build_questions_from_rows(rows, errors)
+            self.assertEqual(
+                errors,
+                [
+                    "row 3 option_id q1-a is duplicated",
+                    "row 4 prompt does not match other rows for q1",
+                    "row 5 weight must be an integer",
+                    "row 6 option_id q1-a is duplicated",
+                    "row 7 option label fields must be non-empty",
+                    "row 8 option_id q3-a is duplicated",
+                    "row 9 option_id q1-b is duplicated"
+                ]
+            )
+
+    def test_bulk_import_routes_rows_and_writes_all_or_nothing(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            tests_root = Path(temp_dir) / "content" / "tests"
+            tests_root.mkdir(parents=True)
+            for slug in ["alpha", "bravo"]:
+                _, errors = new_test.create_test_spec(
+                    test_id=f"test-{slug}",
+                    slug=slug,
+                    locales=["en", "es", "pt-BR"],
+                    category="daily-habits",
+                    tests_root=tests_root
+                )
+                self.assertEqual(errors, [])
+
+            header = (
+                "test_id,question_id,option_id,prompt_en,prompt_es,prompt_pt_br,"
+                "option_label_en,option_label_es,option_label_pt_br,weight\n"
+            )
+            csv_dir = Path(temp_dir) / "batch"
+            csv_dir.mkdir()
+            (csv_dir / "a.csv").write_text(
+                header
+                + "test-alpha,q1,q1-a,Prompt,Pregunta,Pergunta,Yes,Si,Sim,1\n"
+                + "test-bravo,q1,q1-a,Prompt,Pregunta,Pergunta,Yes,Si,Sim,1\n",
+                encoding="utf-8"
+            )
+            (csv_dir / "b.csv").write_text(
+                header + "test-alpha,q1,q1-b,Prompt,Pregunta,Pergunta,No,No,Nao,x\n",
+                encoding="utf-8"
+            )
+            bravo_before = (tests_root / "test-bravo" / "spec.json").read_bytes()
+
+            _, errors = import_questions_csv.import_questions_bulk(csv_dir, replace=True, tests_root=tests_root)
+            self.assertEqual(errors, ["test-alpha: b.csv row 2 weight must be an integer"])
+            self.assertEqual((tests_root / "test-bravo" / "spec.json").read_bytes(), bravo_before)
+
+            (csv_dir / "b.csv").write_text(
+                header + "test-alpha,q1,q1-b,Prompt,Pregunta,Pergunta,No,No,Nao,0\n",
+                encoding="utf-8"
+            )
+            report, errors = import_questions_csv.import_questions_bulk(csv_dir, replace=True, tests_root=tests_root)
+            self.assertEqual(errors, [])
+            self.assertEqual(
+                [(test.test_id, test.rows, test.questions) for test in report.tests],
+                [("test-alpha", 2, 1), ("test-bravo", 1, 1)]
+            )
+            alpha = json.loads((tests_root / "test-alpha" / "spec.json").read_text(encoding="utf-8"))
+            self.assertEqual([option["id"] for option in alpha["questions"][0]["options"]], ["q1-a", "q1-b"])
+            self.assertEqual(sorted(path.name for path in (tests_root / "test-bravo").iterdir()), ["spec.json"])
+
+            # Single and bulk imports both hold the tests-root lock while reading rows.
+            fcntl = atomic_write.fcntl
+            if fcntl is None:
+                return
+            probes: list[bool] = []
+
+            def probe_lock(_rows: int) -> None:
+                fd = os.open(tests_root, os.O_RDONLY)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    probes.append(False)
+                except BlockingIOError:
+                    probes.append(True)
+                finally:
+                    os.close(fd)
+
+            import_questions_csv.import_questions_bulk(
+                csv_dir, replace=True, tests_root=tests_root, progress=probe_lock, progress_every=1
+            )
+            import_questions_csv.import_questions_from_csv(
+                "test-bravo",
+                csv_dir / "a.csv",
+                replace=True,
+                tests_root=tests_root,
+                progress=probe_lock,
+                progress_every=1
+            )
+            self.assertTrue(probes)
+            self.assertTrue(all(probes))
+            probe_lock(0)
+            self.assertFalse(probes[-1])
+
+    def test_atomic_write_skips_unchanged_files_and_writes_all_or_nothing(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            first = root / "a" / "first.json"
+            self.assertTrue(atomic_write.write_json(first, {"b": 1, "a": [1, 2]}))
+            self.assertEqual(first.read_text(encoding="utf-8"), '{\n  "b": 1,\n  "a": [\n    1,\n    2\n  ]\n}\n')
+            mtime = first.stat().st_mtime_ns
+            self.assertFalse(atomic_write.write_json(first, {"b": 1, "a": [1, 2]}))
+            self.assertEqual(first.stat().st_mtime_ns, mtime)
+
+            (root / "blocked").write_text("not a directory", encoding="utf-8")
+            with self.assertRaises(OSError):
+                atomic_write.write_files([
+                    (first, atomic_write.dump_json({"b": 2})),
+                    (root / "blocked" / "second.json", atomic_write.dump_json({}))
+                ])
+            self.assertEqual(json.loads(first.read_text(encoding="utf-8")), {"b": 1, "a": [1, 2]})
+            self.assertEqual([path.name for path in (root / "a").iterdir()], ["first.json"])
+
+    def test_exported_csv_patch_reimport_changes_only_edited_cells(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            tests_root = Path(temp_dir) / "tests"
+            for test_id in ["test-focus-rhythm", "test-universal-mini"]:
+                shutil.copytree(ROOT_DIR / "content" / "tests" / test_id, tests_root / test_id)
+            csv_path = Path(temp_dir) / "focus.csv"
+            spec_path = tests_root / "test-focus-rhythm" / "spec.json"
+            before = spec_path.read_text(encoding="utf-8")
+
+            self.assertEqual(
+                export_questions_csv.export_questions_to_csv("test-focus-rhythm", csv_path, tests_root),
+                []
+            )
+            self.assertEqual(
+                import_questions_csv.patch_questions_from_csv("test-focus-rhythm", csv_path, tests_root),
+                ([], [])
+            )
+
+            lines = csv_path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual(lines[0], ",".join(import_questions_csv.CSV_COLUMNS))
+            self.assertTrue(lines[1].endswith(",2,tempo"))
+            lines[1] = lines[1].replace("Jump in immediately,Jump in immediately,", "Jump in immediately,Empezar ya,", 1)
+            lines[1] = lines[1][:-len(",2,tempo")] + ",1,tempo"
+            csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+            changed, errors = import_questions_csv.patch_questions_from_csv("test-focus-rhythm", csv_path, tests_root)
+            self.assertEqual(errors, [])
+            self.assertEqual(changed, ["questions.q1.options.q1-a.label.es", "scoring.option_weights.q1-a"])
+            after = spec_path.read_text(encoding="utf-8")
+            changed_lines = [
+                (old, new) for old, new in zip(before.splitlines(), after.splitlines()) if old != new
+            ]
+            self.assertEqual(
+                changed_lines,
+                [
+                    ('            "es": "Jump in immediately",', '            "es": "Empezar ya",'),
+                    ('        "tempo": 2', '        "tempo": 1')
+                ]
+            )
+
+            universal_csv = Path(temp_dir) / "universal.csv"
+            self.assertEqual(
+                export_questions_csv.export_questions_to_csv("test-universal-mini", universal_csv, tests_root),
+                []
+            )
+            self.assertEqual(
+                import_questions_csv.patch_questions_from_csv("test-universal-mini", universal_csv, tests_root),
+                ([], [])
+            )
+
     def test_import_questions_csv_rejects_duplicate_question_ids(self) -> None:
         with TemporaryDirectory() as temp_dir:
             tests_root = Path(temp_dir) / "content" / "tests"
@@ -148,6 +392,167 @@ class ContentFactoryTest(unittest.TestCase):
         validate_catalog.validate_spec(spec_path, data, validation_errors)
         self.assertEqual(validation_errors, [])
 
+    def test_converters_run_in_process_and_match_cli_output(self) -> None:
+        fixtures_dir = CONTENT_DIR / "fixtures" / "values_compass"
+        sources = {locale: fixtures_dir / f"{locale}.md" for locale in ("en", "es", "pt-BR")}
+        spec, errors = values_compass_md_to_spec.convert(
+            "test-values-compass", "values-compass", "values", 1, sources
+        )
+        self.assertEqual(errors, [])
+        self.assertEqual(len(spec["questions"]), 30)
+
+        with TemporaryDirectory() as temp_dir:
+            cli_path = Path(temp_dir) / "cli.json"
+            subprocess.run(
+                [
+                    sys.executable, str(CONTENT_DIR / "values_compass_md_to_spec.py"),
+                    "--test-id", "test-values-compass", "--slug", "values-compass",
+                    "--category", "values", "--version", "1",
+                    "--en", str(sources["en"]), "--es", str(sources["es"]),
+                    "--ptbr", str(sources["pt-BR"]), "--out", str(cli_path)
+                ],
+                check=True
+            )
+            self.assertEqual(cli_path.read_text(encoding="utf-8"), atomic_write.dump_json(spec))
+
+        spec, errors = values_compass_md_to_spec.convert(
+            "test-other", "values-compass", "values", 1, {**sources, "es": fixtures_dir / "missing.md"}
+        )
+        self.assertIsNone(spec)
+        self.assertIn("test_id must align with slug", errors)
+        self.assertTrue(any("source file not found" in error for error in errors))
+
+        spec, errors = universal_human_md_to_spec.convert(ROOT_DIR / "content" / "sources" / "test-universal-mini")
+        self.assertEqual(errors, [])
+        self.assertEqual(spec["test_id"], "test-universal-mini")
+        validation_errors: list[str] = []
+        validate_catalog.validate_spec(Path("spec.json"), spec, validation_errors)
+        self.assertEqual(validation_errors, [])
+
+    def test_values_lexer_classifies_lines_and_errors_carry_line_numbers(self) -> None:
+        tokens = values_compass_md_to_spec.lex_lines([
+            "2. Values",
+            "---------",
+            "1) FREEDOM (Freedom) - Choosing my own path.",
+            "FREEDOM vs SECURITY",
+            "| FREEDOM | 1, 11, 21 |",
+            "- 3 = Neutral",
+            "",
+            "4) Next steps"
+        ])
+        self.assertEqual(
+            [token.kind for token in tokens],
+            ["section_header", "underline", "value", "pair", "table_row", "bullet", "blank", "item"]
+        )
+        self.assertEqual(tokens[2].item, "FREEDOM (Freedom) - Choosing my own path.")
+        self.assertEqual(tokens[5].scale, (3, "Neutral"))
+
+        source_path = CONTENT_DIR / "fixtures" / "values_compass" / "en.md"
+        lines = source_path.read_text(encoding="utf-8").splitlines()
+        value_line = next(index for index, line in enumerate(lines) if line.lstrip().startswith("1) FREEDOM"))
+        lines.insert(value_line + 1, "11) WEALTH (Wealth) - Money.")
+        errors: list[str] = []
+        values_compass_md_to_spec.parse_locale_text("\n".join(lines), "en", "en (en.md)", errors)
+        self.assertEqual(errors, [f"en (en.md) line {value_line + 2} has unknown value id WEALTH"])
+
+    def test_values_parse_cache_reparses_only_changed_locales(self) -> None:
+        fixtures_dir = CONTENT_DIR / "fixtures" / "values_compass"
+        with TemporaryDirectory() as temp_dir:
+            sources = {}
+            for locale in ["en", "es", "pt-BR"]:
+                sources[locale] = Path(temp_dir) / f"source.{locale}.md"
+                shutil.copyfile(fixtures_dir / f"{locale}.md", sources[locale])
+            cache_path = Path(temp_dir) / "cache.json"
+
+            def convert() -> tuple[dict | None, list[str], set[Path]]:
+                cache = values_compass_md_to_spec.ParseCache.load(cache_path)
+                cache.added = {}
+                spec, errors = values_compass_md_to_spec.convert(
+                    "test-values-compass", "values-compass", "values", 1, sources, cache
+                )
+                parsed = {Path(key) for key in cache.take_added()}
+                cache.save()
+                return spec, errors, parsed
+
+            spec, errors, parsed = convert()
+            self.assertEqual((errors, parsed), ([], set(sources.values())))
+            cached_spec, errors, parsed = convert()
+            self.assertEqual((cached_spec, errors, parsed), (spec, [], set()))
+            self.assertEqual(atomic_write.dump_json(cached_spec), atomic_write.dump_json(spec))
+
+            with sources["es"].open("a", encoding="utf-8") as handle:
+                handle.write("\n")
+            cached_spec, _, parsed = convert()
+            self.assertEqual((cached_spec, parsed), (spec, {sources["es"]}))
+
+            # Parse errors are cached with the data and reported again on a hit.
+            sources["pt-BR"].write_text("Empty\n", encoding="utf-8")
+            _, first_errors, _ = convert()
+            cached_spec, errors, parsed = convert()
+            self.assertIsNone(cached_spec)
+            self.assertEqual((errors, parsed), (first_errors, set()))
+            self.assertTrue(any("missing section 4" in error for error in errors))
+
+    def test_build_all_rebuilds_only_stale_specs(self) -> None:
+        fixtures_dir = CONTENT_DIR / "fixtures" / "values_compass"
+        with TemporaryDirectory() as temp_dir:
+            sources_root = Path(temp_dir) / "sources"
+            tests_root = Path(temp_dir) / "tests"
+            for test_id in ["test-alpha", "test-beta"]:
+                for locale in ["en", "es", "pt-BR"]:
+                    source_path = sources_root / test_id / f"source.{locale}.md"
+                    source_path.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(fixtures_dir / f"{locale}.md", source_path)
+            (sources_root / "test-draft").mkdir()
+            (sources_root / "test-draft" / "source.en.md").write_text("Draft\n", encoding="utf-8")
+            manifest_path = Path(temp_dir) / "manifest.json"
+            alpha_spec = tests_root / "test-alpha" / "spec.json"
+            beta_spec = tests_root / "test-beta" / "spec.json"
+
+            def build(force: bool = False) -> content_add.BuildReport:
+                manifest = content_add.BuildManifest.load(manifest_path)
+                report = content_add.build_specs(
+                    content_add.list_source_test_ids(sources_root),
+                    manifest,
+                    jobs=2,
+                    force=force,
+                    skip_unknown=True,
+                    tests_root=tests_root,
+                    sources_root=sources_root
+                )
+                manifest.save()
+                return report
+
+            report = build()
+            self.assertEqual(report.errors, [])
+            self.assertEqual(report.built, [alpha_spec, beta_spec])
+            self.assertEqual(report.skipped, ["test-draft"])
+            self.assertEqual(json.loads(alpha_spec.read_text(encoding="utf-8"))["slug"], "alpha")
+
+            report = build()
+            self.assertEqual((report.built, report.fresh), ([], [alpha_spec, beta_spec]))
+
+            # Only the test whose source changed is converted again.
+            with (sources_root / "test-alpha" / "source.es.md").open("a", encoding="utf-8") as handle:
+                handle.write("\n")
+            report = build()
+            self.assertEqual((report.built, report.fresh), ([alpha_spec], [beta_spec]))
+
+            # An edited spec is only replaced with force; its slug, category and version are kept.
+            data = json.loads(beta_spec.read_text(encoding="utf-8"))
+            data["category"] = "edited"
+            data["questions"][0]["prompt"]["es"] = "Editado"
+            beta_spec.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+            edited = beta_spec.read_bytes()
+            report = build()
+            self.assertEqual((report.built, report.kept), ([], [beta_spec]))
+            self.assertEqual(beta_spec.read_bytes(), edited)
+            report = build(force=True)
+            self.assertEqual(report.built, [alpha_spec, beta_spec])
+            data = json.loads(beta_spec.read_text(encoding="utf-8"))
+            self.assertEqual(data["category"], "edited")
+            self.assertNotEqual(data["questions"][0]["prompt"]["es"], "Editado")
+
     def test_universal_spec_rejects_unknown_scale(self) -> None:
         spec_path = ROOT_DIR / "content" / "tests" / "test-universal-mini" / "spec.json"
         data = json.loads(spec_path.read_text(encoding="utf-8"))
@@ -156,6 +561,886 @@ class ContentFactoryTest(unittest.TestCase):
         validate_catalog.validate_spec(spec_path, data, validation_errors)
         self.assertTrue(any("scale_id must be listed in scales" in error for error in validation_errors))
 
+    def test_values_spec_errors_use_full_paths(self) -> None:
+        spec_path = ROOT_DIR / "content" / "tests" / "test-focus-rhythm" / "spec.json"
+        data = json.loads(spec_path.read_text(encoding="utf-8"))
+        data["slug"] = "other"
+        data["locales"]["pt-br"] = data["locales"].pop("pt-BR")
+        data["questions"][0]["type"] = "multi"
+        data["questions"][0]["options"][1]["label"]["es"] = "  "
+        data["scoring"]["option_weights"]["q1-a"] = {"score": "1", " ": 2}
+        data["result_bands"][0]["copy"]["en"]["bullets"] = "none"
+        validation_errors: list[str] = []
+        spec_info = validate_catalog.validate_spec(spec_path, data, validation_errors)
+
+        self.assertEqual(spec_info.locales, ["en", "es"])
+        self.assertEqual(
+            validation_errors,
+            [
+                f"{spec_path}.test_id must align with slug",
+                f"{spec_path}.locales.pt-br must be pt-BR",
+                f"{spec_path}.questions[0].type must be single_choice",
+                f"{spec_path}.questions[0].options[1].label.es must be a non-empty string",
+                f"{spec_path}.scoring.option_weights.q1-a.score must be an integer",
+                f"{spec_path}.scoring.option_weights.q1-a.key must be a non-empty string",
+                f"{spec_path}.result_bands[0].copy.en.bullets must be an array",
+                f"{spec_path}.scoring.option_weights.q1-a.score must be listed in scoring.scales"
+            ]
+        )
+
+    def test_values_spec_cross_references_option_weights(self) -> None:
+        spec_path = ROOT_DIR / "content" / "tests" / "test-focus-rhythm" / "spec.json"
+        data = json.loads(spec_path.read_text(encoding="utf-8"))
+        weights = data["scoring"]["option_weights"]
+        del weights["q2-a"]
+        weights["q99-z"] = {"tempo": 1}
+        weights["q1-b"]["speed"] = 1
+        data["questions"][3]["options"][2]["id"] = "q4-a"
+        validation_errors: list[str] = []
+        validate_catalog.validate_spec(spec_path, data, validation_errors)
+
+        self.assertEqual(
+            validation_errors,
+            [
+                f"{spec_path}.questions[3].options[2].id q4-a is duplicated",
+                f"{spec_path}.scoring.option_weights.q1-b.speed must be listed in scoring.scales",
+                f"{spec_path}.scoring.option_weights.q4-c does not match any question option",
+                f"{spec_path}.scoring.option_weights.q99-z does not match any question option",
+                f"{spec_path}.questions[1].options[0].id has no scoring.option_weights entry"
+            ]
+        )
+
+    def test_values_spec_result_bands_cover_score_range(self) -> None:
+        spec_path = ROOT_DIR / "content" / "tests" / "test-focus-rhythm" / "spec.json"
+        data = json.loads(spec_path.read_text(encoding="utf-8"))
+        steady, balanced, fast = data["result_bands"]
+        balanced["min_score_inclusive"] = 6
+        fast["min_score_inclusive"] = 18
+        fast["max_score_inclusive"] = 17
+        data["result_bands"] = [fast, balanced, steady]
+        validation_errors: list[str] = []
+        validate_catalog.validate_spec(spec_path, data, validation_errors)
+
+        self.assertEqual(
+            validation_errors,
+            [
+                f"{spec_path}.result_bands[0].min_score_inclusive must be <= max_score_inclusive",
+                f"{spec_path}.result_bands[1] overlaps result_bands[2] on scores 6..7"
+            ]
+        )
+
+        fast["min_score_inclusive"] = 16
+        fast["max_score_inclusive"] = 19
+        validation_errors = []
+        validate_catalog.validate_spec(spec_path, data, validation_errors)
+        self.assertEqual(
+            validation_errors,
+            [
+                f"{spec_path}.result_bands[1] overlaps result_bands[2] on scores 6..7",
+                f"{spec_path}.result_bands do not cover score 15",
+                f"{spec_path}.result_bands do not cover score 20"
+            ]
+        )
+
+    def test_universal_spec_reports_question_id_problems(self) -> None:
+        spec_path = ROOT_DIR / "content" / "tests" / "test-universal-mini" / "spec.json"
+        data = json.loads(spec_path.read_text(encoding="utf-8"))
+        data["questions"][1]["question_id"] = data["questions"][0]["question_id"]
+        data["questions"][2]["question_id"] = "q99"
+        validation_errors: list[str] = []
+        validate_catalog.validate_spec(spec_path, data, validation_errors)
+
+        self.assertEqual(
+            validation_errors,
+            [
+                f"{spec_path}.questions[1].question_id q01 is duplicated",
+                f"{spec_path}.questions[2].question_id must match q01..qNN",
+                f"{spec_path}.questions missing ids: q02, q03"
+            ]
+        )
+
+    def test_spec_file_errors_include_line_and_column(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            spec_path = Path(temp_dir) / "spec.json"
+            data = json.loads(
+                (ROOT_DIR / "content" / "tests" / "test-universal-mini" / "spec.json").read_text(encoding="utf-8")
+            )
+            data["questions"][1]["scale_id"] = "unknown"
+            del data["questions"][2]["prompt"]["es"]
+            spec_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+            lines = spec_path.read_text(encoding="utf-8").splitlines()
+
+            spec_info, validation_errors = validate_catalog.validate_spec_file(spec_path)
+
+            self.assertEqual(spec_info.test_id, "test-universal-mini")
+            self.assertEqual(len(validation_errors), 2)
+            scale_error, prompt_error = validation_errors
+            location, detail = scale_error[len(f"{spec_path}:"):].split(": ", 1)
+            line, column = (int(part) for part in location.split(":"))
+            self.assertEqual(detail, "questions[1].scale_id must be listed in scales")
+            self.assertEqual(lines[line - 1][column - 1:], '"unknown",')
+            location, detail = prompt_error[len(f"{spec_path}:"):].split(": ", 1)
+            line, column = (int(part) for part in location.split(":"))
+            self.assertEqual(detail, "questions[2].prompt.es must be a non-empty string")
+            self.assertEqual(lines[line - 1][column - 1:], "{")
+            self.assertIn('"prompt"', lines[line - 1])
+
+    def test_parallel_spec_validation_matches_serial_order(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            tests_root = Path(temp_dir) / "content" / "tests"
+            tests_root.mkdir(parents=True)
+            for slug in ["alpha", "bravo", "charlie"]:
+                spec_path, errors = new_test.create_test_spec(
+                    test_id=f"test-{slug}",
+                    slug=slug,
+                    locales=["en", "es"],
+                    category="daily-habits",
+                    tests_root=tests_root
+                )
+                self.assertEqual(errors, [])
+            broken_path = tests_root / "test-bravo" / "spec.json"
+            data = json.loads(broken_path.read_text(encoding="utf-8"))
+            data["version"] = 0
+            broken_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+            (tests_root / "test-delta").mkdir()
+            (tests_root / "test-delta" / "spec.json").write_text("{", encoding="utf-8")
+
+            spec_paths = validate_catalog.iter_spec_paths(tests_root)
+            serial_errors: list[str] = []
+            serial = validate_catalog.collect_specs(spec_paths, serial_errors, jobs=1)
+            parallel_errors: list[str] = []
+            parallel = validate_catalog.collect_specs(spec_paths, parallel_errors, jobs=2)
+
+            self.assertEqual(parallel_errors, serial_errors)
+            self.assertEqual(list(parallel.keys()), ["test-alpha", "test-bravo", "test-charlie"])
+            self.assertEqual(
+                [(info.test_id, info.slug, info.locales) for info in parallel.values()],
+                [(info.test_id, info.slug, info.locales) for info in serial.values()]
+            )
+            self.assertEqual(len(serial_errors), 2)
+            self.assertIn("version must be >= 1", serial_errors[0])
+            self.assertIn("is not valid JSON", serial_errors[1])
+
+    def test_diagnostics_parse_paths_and_emit_sarif(self) -> None:
+        located = diagnostics.parse_message("content/tests/test-a/spec.json:12:7: questions[0].id is duplicated")
+        self.assertEqual(
+            (located.file, located.json_path, located.line, located.column, located.code),
+            ("content/tests/test-a/spec.json", "questions[0].id", 12, 7, "duplicate")
+        )
+        root_level = diagnostics.parse_message("content/tests/test-a/spec.json:1:1: must be a JSON object")
+        self.assertEqual((root_level.json_path, root_level.message), (None, "must be a JSON object"))
+        relative = diagnostics.parse_message("tenants[1].domains must be a non-empty array", "config/tenants.json")
+        self.assertEqual(
+            (relative.file, relative.json_path, relative.code),
+            ("config/tenants.json", "tenants[1].domains", "array")
+        )
+
+        stream = io.StringIO()
+        sink = diagnostics.DiagnosticSink(
+            "validate_tenants",
+            output_format="sarif",
+            max_errors=2,
+            default_file="config/tenants.json",
+            locate=lambda segments: (3, 5) if segments == ("tenants", 0, "tenant_id") else None,
+            stream=stream
+        )
+        sink.append("tenants[0].tenant_id must be a non-empty string")
+        with self.assertRaises(diagnostics.DiagnosticLimitReached):
+            sink.append("tenants.json must contain a tenants array")
+        sink.close()
+
+        run = json.loads(stream.getvalue())["runs"][0]
+        self.assertTrue(run["properties"]["truncated"])
+        self.assertEqual([result["ruleId"] for result in run["results"]], ["non-empty-string", "array"])
+        first_location = run["results"][0]["locations"][0]
+        self.assertEqual(first_location["physicalLocation"]["region"], {"startLine": 3, "startColumn": 5})
+        self.assertEqual(first_location["logicalLocations"], [{"fullyQualifiedName": "tenants[0].tenant_id"}])
+
+    def test_validators_attach_diagnostics_that_survive_cache_and_pickle(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            synth_catalog.generate_catalog(root, specs=2, tenants=1, questions=3, untranslated_rate=0)
+            tests_root = root / "content" / "tests"
+            spec_path = tests_root / synth_catalog.synth_test_id(0) / "spec.json"
+            data = json.loads(spec_path.read_text(encoding="utf-8"))
+            data["version"] = 0
+            data["slug"] = ""
+            spec_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+            broken_path = tests_root / synth_catalog.synth_test_id(1) / "spec.json"
+            broken_path.write_text("{\n  \"test_id\": ", encoding="utf-8")
+
+            cache = validate_catalog.ValidationCache.load(root / "cache.json")
+            errors: list[str] = []
+            validate_catalog.collect_specs([spec_path, broken_path], errors, cache=cache)
+            self.assertGreaterEqual(len(errors), 3)
+            # Same fields the legacy parser recovers from the text, except decode errors,
+            # whose position the parser cannot see.
+            for error in errors[:-1]:
+                structured = error.diagnostic
+                parsed = diagnostics.parse_message(str(error))
+                self.assertEqual(
+                    (structured.code, structured.file, structured.json_path, structured.line, structured.column),
+                    (parsed.code, parsed.file, parsed.json_path, parsed.line, parsed.column)
+                )
+                self.assertEqual((structured.message, structured.text), (parsed.message, parsed.text))
+            decode_error = errors[-1].diagnostic
+            self.assertEqual((decode_error.code, decode_error.line, decode_error.column), ("invalid-json", 2, 14))
+
+            cache.save()
+            warm_errors: list[str] = []
+            validate_catalog.collect_specs(
+                [spec_path, broken_path],
+                warm_errors,
+                cache=validate_catalog.ValidationCache.load(root / "cache.json")
+            )
+            self.assertEqual(warm_errors, errors)
+            self.assertEqual([error.diagnostic for error in warm_errors], [error.diagnostic for error in errors])
+            copied = pickle.loads(pickle.dumps(errors[0]))
+            self.assertEqual((copied, copied.diagnostic), (errors[0], errors[0].diagnostic))
+
+            stream = io.StringIO()
+            sink = diagnostics.DiagnosticSink("validate_catalog", output_format="json", stream=stream)
+            sink.append(errors[0])
+            sink.append("tenants[0].tenant_id must be a non-empty string")
+            records = [json.loads(line) for line in stream.getvalue().splitlines()]
+            self.assertEqual(records[0], errors[0].diagnostic.to_dict())
+            self.assertEqual(
+                (records[1]["json_path"], records[1]["code"]),
+                ("tenants[0].tenant_id", "non-empty-string")
+            )
+
+    def test_validate_tenants_tags_unexpected_keys_apart_from_missing_ones(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            tenants_path = Path(temp_dir) / "tenants.json"
+            tenant = {"tenant_id": "tenant-a", "domains": ["a.example"], "default_locale": "en", "theme": "dark"}
+            tenants_path.write_text(json.dumps({"tenants": [tenant, {"tenant_id": "tenant-b"}]}), encoding="utf-8")
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    str(ROOT_DIR / "scripts" / "tenants" / "validate_tenants.py"),
+                    "--file",
+                    str(tenants_path),
+                    "--format",
+                    "json"
+                ],
+                capture_output=True,
+                text=True
+            )
+            self.assertEqual(result.returncode, 1)
+            records = [json.loads(line) for line in result.stdout.splitlines()]
+            self.assertEqual(
+                [(record["json_path"], record["code"]) for record in records[:2]],
+                [("tenants[0]", "unexpected-key"), ("tenants[1]", "missing")]
+            )
+        self.assertEqual(diagnostics.classify("has unexpected keys: theme"), "unexpected-key")
+
+    def test_validate_catalog_fail_fast_reports_one_json_diagnostic(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            synth_catalog.generate_catalog(root, specs=6, tenants=1, questions=3, untranslated_rate=0)
+            tests_root = root / "content" / "tests"
+            for index in [1, 4]:
+                spec_path = tests_root / synth_catalog.synth_test_id(index) / "spec.json"
+                data = json.loads(spec_path.read_text(encoding="utf-8"))
+                data["version"] = 0
+                spec_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+            args = [
+                "--tests-root",
+                str(tests_root),
+                "--tenants-path",
+                str(root / "config" / "tenants.json"),
+                "--catalog-path",
+                str(root / "config" / "catalog.json"),
+                "--no-cache",
+                "--format",
+                "json"
+            ]
+            for extra in [[], ["--fail-fast", "--jobs", "2"]]:
+                stdout = io.StringIO()
+                original_stdout = sys.stdout
+                sys.stdout = stdout
+                try:
+                    exit_code = validate_catalog.main(args + extra)
+                finally:
+                    sys.stdout = original_stdout
+                records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+                self.assertEqual(exit_code, 1)
+                self.assertEqual(len(records), 1 if extra else 2)
+                self.assertEqual(records[0]["json_path"], "version")
+                self.assertIn(synth_catalog.synth_test_id(1), records[0]["file"])
+                self.assertEqual(records[0]["severity"], "error")
+
+    def test_validation_cache_skips_unchanged_specs(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            tests_root = Path(temp_dir) / "content" / "tests"
+            tests_root.mkdir(parents=True)
+            for slug in ["alpha", "bravo"]:
+                _, errors = new_test.create_test_spec(
+                    test_id=f"test-{slug}",
+                    slug=slug,
+                    locales=["en"],
+                    category="daily-habits",
+                    tests_root=tests_root
+                )
+                self.assertEqual(errors, [])
+
+            cache_path = Path(temp_dir) / "cache.json"
+            spec_paths = validate_catalog.iter_spec_paths(tests_root)
+            cold_cache = validate_catalog.ValidationCache.load(cache_path)
+            cold_errors: list[str] = []
+            validate_catalog.collect_specs(spec_paths, cold_errors, cache=cold_cache)
+            cold_cache.save()
+            self.assertEqual(cold_errors, [])
+
+            warm_cache = validate_catalog.ValidationCache.load(cache_path)
+            warm_errors: list[str] = []
+            warm = validate_catalog.collect_specs(spec_paths, warm_errors, cache=warm_cache)
+            self.assertFalse(warm_cache.dirty)
+            self.assertEqual(warm["test-alpha"].slug, "alpha")
+
+            bravo_path = tests_root / "test-bravo" / "spec.json"
+            data = json.loads(bravo_path.read_text(encoding="utf-8"))
+            data["category"] = ""
+            bravo_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+            changed_errors: list[str] = []
+            validate_catalog.collect_specs(spec_paths, changed_errors, cache=warm_cache)
+            self.assertTrue(warm_cache.dirty)
+            self.assertEqual(changed_errors, [f"{bravo_path}:5:15: category must be a non-empty string"])
+
+    def test_identity_pass_matches_full_validation_and_can_skip_reads(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            tests_root = Path(temp_dir) / "content" / "tests"
+            tests_root.mkdir(parents=True)
+            _, errors = new_test.create_test_spec(
+                test_id="test-alpha",
+                slug="alpha",
+                locales=["en", "es"],
+                category="daily-habits",
+                tests_root=tests_root
+            )
+            self.assertEqual(errors, [])
+            spec_path = tests_root / "test-alpha" / "spec.json"
+            data = json.loads(spec_path.read_text(encoding="utf-8"))
+            data["test_id"] = " test-alpha "
+            data["locales"]["PT-br"] = data["locales"]["en"]
+            spec_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+            full, _ = validate_catalog.validate_spec_file(spec_path)
+            identity = validate_catalog.read_spec_info(spec_path)
+            self.assertEqual(identity.to_dict(), full.to_dict())
+            self.assertEqual(identity.locales, ["en", "es"])
+            self.assertEqual(identity.checksum, hashlib.sha256(spec_path.read_bytes()).hexdigest())
+
+            cache = validate_catalog.ValidationCache.load(Path(temp_dir) / "cache.json")
+            list(validate_catalog.iter_spec_results([spec_path], cache=cache))
+            self.assertIsNone(validate_catalog.read_spec_info(spec_path, cache, checksum=False).checksum)
+
+            # Same size and mtime: without checksums the cached identity is used unread.
+            before = spec_path.stat()
+            spec_path.write_bytes(spec_path.read_bytes().replace(b"test-alpha", b"test-bravo"))
+            os.utime(spec_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+            self.assertEqual(validate_catalog.read_spec_info(spec_path, cache, checksum=False).test_id, "test-alpha")
+            self.assertEqual(validate_catalog.read_spec_info(spec_path, cache).test_id, "test-bravo")
+
+    def test_changed_since_limits_checks_to_affected_specs(self) -> None:
+        def git(*args: str) -> None:
+            subprocess.run(
+                ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                cwd=root,
+                check=True,
+                capture_output=True
+            )
+
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            synth_catalog.generate_catalog(root, specs=4, tenants=1, questions=4)
+            tests_root = root / "content" / "tests"
+            allowlist_path = root / "allowlist.json"
+            allowlist_path.write_text(json.dumps({"spec_exceptions": []}), encoding="utf-8")
+            git("init", "-q")
+            git("add", ".")
+            git("commit", "-q", "-m", "base")
+
+            first, second, third = [path.parent.name for path in validate_catalog.iter_spec_paths(tests_root)[:3]]
+            first_path = tests_root / first / "spec.json"
+            data = json.loads(first_path.read_text(encoding="utf-8"))
+            data["category"] = ""
+            first_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+            (tests_root / second / "spec.json").unlink()
+            allowlist_path.write_text(
+                json.dumps({"spec_exceptions": [f"content/tests/{third}/spec.json"]}),
+                encoding="utf-8"
+            )
+
+            errors: list[str] = []
+            changed = validate_catalog.changed_spec_dirs("HEAD", tests_root, errors)
+            self.assertEqual(changed, {first, second})
+            specs = validate_catalog.collect_specs(
+                validate_catalog.iter_spec_paths(tests_root), errors, changed=changed
+            )
+            self.assertEqual(len(errors), 1)
+            self.assertIn(f"{first_path}:", errors[0])
+            self.assertEqual(len(specs), 3)
+
+            allowlist, _ = lint_locales.load_allowlist(allowlist_path)
+            affected, error = lint_locales.changed_lint_specs(
+                "HEAD", tests_root, allowlist_path, allowlist, lint_locales.LINT_SOURCE_FILES
+            )
+            self.assertIsNone(error)
+            self.assertEqual(affected, {first, second, third})
+
+            allowlist_path.write_text(json.dumps({"terms": ["okr"]}), encoding="utf-8")
+            allowlist, _ = lint_locales.load_allowlist(allowlist_path)
+            affected, _ = lint_locales.changed_lint_specs(
+                "HEAD", tests_root, allowlist_path, allowlist, lint_locales.LINT_SOURCE_FILES
+            )
+            self.assertIsNone(affected)
+
+    def test_catalog_index_maps_tests_slugs_and_tenants(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            tests_root = Path(temp_dir) / "content" / "tests"
+            tests_root.mkdir(parents=True)
+            for slug in ["bravo", "alpha"]:
+                _, errors = new_test.create_test_spec(
+                    test_id=f"test-{slug}",
+                    slug=slug,
+                    locales=["en", "es"],
+                    category="daily-habits",
+                    tests_root=tests_root
+                )
+                self.assertEqual(errors, [])
+
+            errors: list[str] = []
+            specs = validate_catalog.collect_specs(validate_catalog.iter_spec_paths(tests_root), errors)
+            index = validate_catalog.build_catalog_index(
+                specs,
+                {"tenant-b": "es", "tenant-a": "en"},
+                {"tenant-a": ["test-bravo", "test-alpha"]},
+                tests_root=tests_root
+            )
+
+            alpha_bytes = (tests_root / "test-alpha" / "spec.json").read_bytes()
+            self.assertEqual(index["version"], validate_catalog.CATALOG_INDEX_VERSION)
+            self.assertEqual(index["tests"]["test-alpha"]["sha256"], hashlib.sha256(alpha_bytes).hexdigest())
+            self.assertEqual(index["slugs"], {"alpha": "test-alpha", "bravo": "test-bravo"})
+            self.assertEqual(
+                index["tenants"],
+                {
+                    "tenant-a": {"default_locale": "en", "tests": ["test-bravo", "test-alpha"]},
+                    "tenant-b": {"default_locale": "es", "tests": []}
+                }
+            )
+            payload = {key: value for key, value in index.items() if key != "checksum"}
+            canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+            self.assertEqual(index["checksum"], hashlib.sha256(canonical.encode("utf-8")).hexdigest())
+
+    def test_catalog_validator_rechecks_only_touched_specs(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            tests_root = root / "content" / "tests"
+            tests_root.mkdir(parents=True)
+            for slug in ["alpha", "bravo", "charlie"]:
+                _, errors = new_test.create_test_spec(
+                    test_id=f"test-{slug}",
+                    slug=slug,
+                    locales=["en"],
+                    category="daily-habits",
+                    tests_root=tests_root
+                )
+                self.assertEqual(errors, [])
+            charlie_path = tests_root / "test-charlie" / "spec.json"
+            charlie = json.loads(charlie_path.read_text(encoding="utf-8"))
+            charlie["version"] = 0
+            charlie_path.write_text(json.dumps(charlie, indent=2) + "\n", encoding="utf-8")
+            tenants_path = root / "tenants.json"
+            tenants_path.write_text(
+                json.dumps({"tenants": [{"tenant_id": "tenant-a", "default_locale": "en"}]}),
+                encoding="utf-8"
+            )
+            catalog_path = root / "catalog.json"
+            catalog_path.write_text(json.dumps({"tenants": {"tenant-a": ["test-alpha"]}}), encoding="utf-8")
+
+            validator = validate_catalog.CatalogValidator(tests_root, tenants_path, catalog_path)
+            validator.load()
+            self.assertEqual(len(validator.errors()), 1)
+            self.assertEqual(validator.validate_one("test-alpha"), [])
+
+            bravo_path = tests_root / "test-bravo" / "spec.json"
+            bravo = json.loads(bravo_path.read_text(encoding="utf-8"))
+            bravo["slug"] = "alpha"
+            self.assertEqual(
+                validator.validate_data("test-bravo", bravo),
+                [
+                    f"{bravo_path}.test_id must align with slug",
+                    f"duplicate slug alpha in {tests_root / 'test-alpha'} and {tests_root / 'test-bravo'}"
+                ]
+            )
+            self.assertEqual(validator.specs()["test-bravo"].slug, "bravo")
+
+            catalog_path.write_text(
+                json.dumps({"tenants": {"tenant-a": ["test-alpha", "test-missing"]}}),
+                encoding="utf-8"
+            )
+            self.assertEqual(
+                validator.revalidate([catalog_path]),
+                ["catalog.json tenant tenant-a references missing test test-missing"]
+            )
+
+            # identity_only reads the untouched specs' identity; errors() validates them on demand.
+            light = validate_catalog.CatalogValidator(tests_root, tenants_path, catalog_path)
+            light.load(identity_only=True)
+            self.assertEqual(light.spec_results[charlie_path][1], [])
+            self.assertEqual(light.validate_data("test-bravo", bravo), validator.validate_data("test-bravo", bravo))
+            self.assertEqual(light.errors(), validator.errors())
+            self.assertEqual(light.unchecked, set())
+
+    def test_watch_session_rechecks_only_changed_specs(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            tests_root = root / "content" / "tests"
+            tests_root.mkdir(parents=True)
+            for slug in ["alpha", "bravo"]:
+                _, errors = new_test.create_test_spec(
+                    test_id=f"test-{slug}",
+                    slug=slug,
+                    locales=["en"],
+                    category="daily-habits",
+                    tests_root=tests_root
+                )
+                self.assertEqual(errors, [])
+            tenants_path = root / "tenants.json"
+            tenants_path.write_text(
+                json.dumps({"tenants": [{"tenant_id": "tenant-a", "default_locale": "en"}]}),
+                encoding="utf-8"
+            )
+            catalog_path = root / "catalog.json"
+            catalog_path.write_text(json.dumps({"tenants": {"tenant-a": ["test-alpha"]}}), encoding="utf-8")
+
+            session = content_watch.ContentSession(
+                tests_root=tests_root,
+                sources_root=root / "content" / "sources",
+                tenants_path=tenants_path,
+                catalog_path=catalog_path,
+                allowlist_path=root / "allowlist.json"
+            )
+            session.load_all()
+            self.assertEqual(session.report().errors, [])
+
+            alpha_path = tests_root / "test-alpha" / "spec.json"
+            bravo_path = tests_root / "test-bravo" / "spec.json"
+            alpha_result = session.spec_results[alpha_path]
+            data = json.loads(bravo_path.read_text(encoding="utf-8"))
+            data["slug"] = "alpha"
+            bravo_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+            self.assertEqual(session.apply_changes([bravo_path, root / "notes.txt"]), 1)
+            self.assertIs(session.spec_results[alpha_path], alpha_result)
+            self.assertEqual(
+                session.report().errors,
+                [
+                    f"{bravo_path}:2:14: test_id must align with slug",
+                    f"duplicate slug alpha in {tests_root / 'test-alpha'} and {tests_root / 'test-bravo'}"
+                ]
+            )
+
+            # lint_locales --watch: the same session without validation or sources.
+            lint_session = content_watch.ContentSession(
+                tests_root=tests_root,
+                sources_root=root / "content" / "sources",
+                tenants_path=tenants_path,
+                catalog_path=catalog_path,
+                allowlist_path=root / "allowlist.json",
+                validate=False,
+                sources=False,
+                memo_path=None
+            )
+            lint_session.load_all()
+            self.assertEqual(lint_session.watch_roots, [tests_root, root / "allowlist.json"])
+            self.assertEqual(lint_session.checked_count(), 2)
+            self.assertEqual(lint_session.apply_changes([catalog_path, bravo_path]), 1)
+            self.assertEqual(lint_session.report().errors, [])
+            with contextlib.redirect_stderr(io.StringIO()):
+                for parse_args, extra in [
+                    (validate_catalog.parse_args, ["--emit-index", "index.json"]),
+                    (lint_locales.parse_args, ["--format", "json"])
+                ]:
+                    with self.assertRaises(SystemExit):
+                        parse_args(["--watch", *extra])
+
+    def test_polling_watcher_reports_changed_and_removed_files(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            kept = root / "a" / "spec.json"
+            removed = root / "b" / "spec.json"
+            for path in [kept, removed]:
+                path.parent.mkdir()
+                path.write_text("{}", encoding="utf-8")
+            (root / "notes.txt").write_text("ignored", encoding="utf-8")
+
+            watcher = content_watch.PollingWatcher([root], interval=0.01)
+            self.assertEqual(watcher.poll(), set())
+
+            kept.write_text('{"changed": true}', encoding="utf-8")
+            removed.unlink()
+            (root / "notes.txt").write_text("still ignored", encoding="utf-8")
+            self.assertEqual(watcher.poll(), {kept, removed})
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux-only")
+    def test_inotify_watcher_skips_batches_without_watched_files(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            spec = root / "a" / "spec.json"
+            spec.parent.mkdir()
+            try:
+                watcher = content_watch.InotifyWatcher([root])
+            except (OSError, AttributeError) as error:
+                self.skipTest(f"inotify unavailable: {error}")
+            try:
+                (root / "notes.txt").write_text("ignored", encoding="utf-8")
+                spec.write_text("{}", encoding="utf-8")
+                self.assertEqual(watcher.wait(), {spec})
+
+                # A long run of unrelated batches must not grow the stack.
+                notes = root / "notes.txt"
+                batches = [{notes}, set()] * (sys.getrecursionlimit() + 10) + [{spec}, set()]
+                watcher.read_events = lambda timeout: batches.pop(0)
+                self.assertEqual(watcher.wait(), {spec})
+                self.assertEqual(batches, [])
+            finally:
+                watcher.close()
+
+    def test_synthetic_catalog_is_valid(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            summary = synth_catalog.generate_catalog(
+                root,
+                specs=4,
+                tenants=2,
+                questions=12,
+                tests_per_tenant=3,
+                untranslated_rate=0
+            )
+            self.assertEqual(summary["formats"], {"values_compass_v1": 2, "universal_human_v1": 2})
+
+            tests_root = root / "content" / "tests"
+            errors: list[str] = []
+            specs = validate_catalog.collect_specs(validate_catalog.iter_spec_paths(tests_root), errors)
+            tenants = validate_catalog.load_tenants(
+                json.loads((root / "config" / "tenants.json").read_text(encoding="utf-8")),
+                errors
+            )
+            catalog = validate_catalog.load_catalog(
+                json.loads((root / "config" / "catalog.json").read_text(encoding="utf-8")),
+                errors
+            )
+            validate_catalog.check_cross_references(specs, tenants, catalog, errors, tests_root)
+            self.assertEqual(errors, [])
+            self.assertEqual(sorted(tenants), ["tenant-synth-0000", "tenant-synth-0001"])
+
+            issues, lint_errors = lint_locales.lint_locales(
+                tests_root,
+                ["en", "es", "pt-BR"],
+                lint_locales.DEFAULT_SIMILARITY_THRESHOLD,
+                root / "allowlist.json"
+            )
+            self.assertEqual((issues, lint_errors), ([], []))
+
+            import_errors = import_questions_csv.import_questions_from_csv(
+                synth_catalog.synth_test_id(0),
+                root / "questions.csv",
+                replace=True,
+                tests_root=tests_root
+            )
+            self.assertEqual(import_errors, [])
+
+    def test_parallel_locale_lint_matches_serial_order(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            synth_catalog.generate_catalog(root, specs=6, tenants=1, questions=6, untranslated_rate=0.3)
+            tests_root = root / "content" / "tests"
+            (tests_root / "test-broken").mkdir()
+            (tests_root / "test-broken" / "spec.json").write_text("{", encoding="utf-8")
+
+            serial = lint_locales.lint_locales(
+                tests_root,
+                ["en", "es", "pt-BR"],
+                lint_locales.DEFAULT_SIMILARITY_THRESHOLD,
+                root / "allowlist.json"
+            )
+            parallel = lint_locales.lint_locales(
+                tests_root,
+                ["en", "es", "pt-BR"],
+                lint_locales.DEFAULT_SIMILARITY_THRESHOLD,
+                root / "allowlist.json",
+                jobs=3
+            )
+            self.assertEqual(parallel, serial)
+            self.assertGreater(len(serial[0]), 0)
+            self.assertEqual(len(serial[1]), 1)
+
+    def test_locale_lint_tiered_similarity_matches_exact_ratio(self) -> None:
+        pairs = [
+            ("plan the weekly review", "plan the weekly reviews"),
+            ("plan the weekly review", "planifica la revision semanal"),
+            ("short", "a much longer translated sentence"),
+            ("abcd", "dcba")
+        ]
+        for threshold in [0.5, 0.9, 0.95]:
+            for a, b in pairs:
+                exact = lint_locales.compute_similarity(a, b)
+                tiered = lint_locales.similarity_at_least(a, b, threshold)
+                if exact >= threshold:
+                    self.assertEqual(tiered, exact)
+                else:
+                    self.assertTrue(tiered is None or tiered == exact)
+        self.assertIsNone(lint_locales.similarity_at_least("abcd", "abxy", 0.9))
+        self.assertIsNone(lint_locales.similarity_at_least("ab", "abcdef", 0.9))
+
+    def test_locale_lint_covers_registered_fields_per_format(self) -> None:
+        allowlist = lint_locales.Allowlist(set(), set(lint_locales.DEFAULT_TECHNICAL_TERMS), 4)
+        universal = {
+            "format_id": "universal_human_v1",
+            "locales": {
+                "en": {"title": "Focus Mini", "paywall_hook": "Unlock your full focus report today."},
+                "es": {"title": "Mini de Enfoque", "paywall_hook": "Unlock your full focus report today."}
+            },
+            "questions": [
+                {"question_id": "q01", "prompt": {"en": "I plan my week.", "es": "I plan my week."}}
+            ]
+        }
+        issues, errors = lint_locales.lint_spec_data("spec.json", universal, ["es"], 0.95, allowlist)
+        self.assertEqual(errors, [])
+        self.assertEqual(
+            [issue.key for issue in issues],
+            ["locales.es.paywall_hook", "questions.q01.prompt.es"]
+        )
+
+        values = {
+            "locales": {"en": {"title": "Values"}, "es": {"title": "Valores"}},
+            "value_profiles": {
+                "freedom": {
+                    "preview": {"en": "You thrive on choice.", "es": "Prosperas con libertad."},
+                    "paid": {"en": ["Freedom is self-direction."], "es": ["Freedom is self-direction."]}
+                }
+            },
+            "conflicts": [
+                {"pair_id": "freedom_vs_security", "copy": {"level": {"en": "High tension", "es": "High tension"}}}
+            ],
+            "templates": {"paywall_copy": {"en": {"cta": "Unlock my report"}, "es": {"cta": "Desbloquear"}}}
+        }
+        issues, _ = lint_locales.lint_spec_data("spec.json", values, ["es"], 0.95, allowlist)
+        self.assertEqual(
+            [issue.key for issue in issues],
+            ["value_profiles.freedom.paid.es[0]", "conflicts.freedom_vs_security.copy.level.es"]
+        )
+
+        with self.assertRaises(ValueError):
+            localized_fields.compile_fields(["locales.title"])
+
+    def test_language_id_flags_confident_locale_mismatches(self) -> None:
+        languages, error = language_id.load_identifier(language_id.DEFAULT_PROFILES_PATH)
+        self.assertIsNone(error)
+        spec = {
+            "format_id": "universal_human_v1",
+            "locales": {"en": {"title": "Focus Mini"}},
+            "questions": [
+                {
+                    "question_id": "q01",
+                    "prompt": {
+                        "en": "I like to stay with one task until it is done.",
+                        "es": "Me gusta mantenerme en una sola tarea hasta terminarla.",
+                        "pt-BR": "Me gusta mantenerme en una sola tarea hasta terminarla."
+                    }
+                },
+                {
+                    "question_id": "q02",
+                    "prompt": {
+                        "en": "I prefer a clear plan before I start.",
+                        "es": "I usually prefer having a clear plan before starting.",
+                        "pt-BR": "Prefiro ter um plano claro antes de começar."
+                    }
+                }
+            ]
+        }
+        allowlist = lint_locales.Allowlist(set(), set(lint_locales.DEFAULT_TECHNICAL_TERMS), 4)
+        issues, _ = lint_locales.lint_spec_data(
+            "spec.json", spec, ["es", "pt-BR"], 0.95, allowlist, languages=languages
+        )
+        self.assertEqual(
+            [(issue.key, issue.detected) for issue in issues],
+            [("questions.q01.prompt.pt-BR", "es"), ("questions.q02.prompt.es", "en")]
+        )
+        self.assertEqual(lint_locales.issue_diagnostic(issues[0]).code, "locale-language")
+        self.assertIsNone(languages.mismatch("Totalmente de acuerdo", "pt-BR"))
+
+    def test_similarity_memo_reapplies_thresholds_without_recomputing(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            synth_catalog.generate_catalog(root, specs=4, tenants=1, questions=6, untranslated_rate=0.3)
+            tests_root = root / "content" / "tests"
+            memo_path = root / "memo.json"
+            expected = {
+                threshold: lint_locales.lint_locales(tests_root, ["en", "es", "pt-BR"], threshold, root / "allowlist.json")
+                for threshold in [0.95, 0.5]
+            }
+
+            memo = lint_locales.SimilarityMemo.load(memo_path)
+            lint_locales.lint_locales(tests_root, ["en", "es", "pt-BR"], 0.5, root / "allowlist.json", memo=memo)
+            memo.save()
+            self.assertGreater(len(memo.entries), 0)
+
+            # Any exact ratio computed from here on would fail.
+            original = lint_locales.SequenceMatcher
+            lint_locales.SequenceMatcher = None
+            try:
+                for threshold, result in expected.items():
+                    memo = lint_locales.SimilarityMemo.load(memo_path)
+                    self.assertEqual(
+                        lint_locales.lint_locales(
+                            tests_root, ["en", "es", "pt-BR"], threshold, root / "allowlist.json", memo=memo
+                        ),
+                        result
+                    )
+            finally:
+                lint_locales.SequenceMatcher = original
+
+            memo_path.write_text(json.dumps({"fingerprint": "old-rules", "entries": memo.entries}), encoding="utf-8")
+            self.assertEqual(len(lint_locales.SimilarityMemo.load(memo_path).entries), 0)
+
+        memo = lint_locales.SimilarityMemo(Path("unused.json"), "fingerprint", max_entries=2)
+        for key in ["a", "b", "c"]:
+            memo.put(key, [0.5, True])
+        self.assertEqual(list(memo.entries), ["b", "c"])
+
+    def test_near_duplicates_cluster_edited_prompts_across_specs(self) -> None:
+        def spec(prompt: str, label: str) -> dict:
+            return {
+                "questions": [
+                    {
+                        "id": "q01",
+                        "prompt": {"en": prompt},
+                        "options": [{"id": "agree", "label": {"en": label}}]
+                    }
+                ]
+            }
+
+        specs = [
+            ("test-a/spec.json", spec("I usually plan my week before Monday morning starts.", "Agree")),
+            ("test-b/spec.json", spec("I usually plan my week before the Monday morning starts!", "Agree")),
+            ("test-c/spec.json", spec("Teamwork matters more to me than individual credit.", "Agree"))
+        ]
+        clusters = near_duplicates.find_near_duplicates(specs)
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(clusters[0].locale, "en")
+        self.assertEqual(
+            [(ref.spec_path, ref.key) for ref in clusters[0].members],
+            [("test-a/spec.json", "questions.q01.prompt.en"), ("test-b/spec.json", "questions.q01.prompt.en")]
+        )
+        self.assertGreaterEqual(clusters[0].min_jaccard, near_duplicates.DEFAULT_JACCARD_THRESHOLD)
+        self.assertEqual(near_duplicates.find_near_duplicates(specs[:1] + specs[2:]), [])
+
     def test_locale_lint_short_multiword_phrase_is_not_trivial(self) -> None:
         allowlist = lint_locales.Allowlist(set(), {"epc", "rfid"}, 4)
         self.assertFalse(
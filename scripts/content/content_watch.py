@@ -0,0 +1,439 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+import lint_locales
+import universal_human_md_to_spec
+import validate_catalog
+import values_compass_md_to_spec
+from content_add import detect_source_format
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+TESTS_ROOT = ROOT_DIR / "content" / "tests"
+SOURCES_ROOT = ROOT_DIR / "content" / "sources"
+TENANTS_PATH = ROOT_DIR / "config" / "tenants.json"
+CATALOG_PATH = ROOT_DIR / "config" / "catalog.json"
+ALLOWLIST_PATH = ROOT_DIR / "config" / "locale_lint_allowlist.json"
+
+WATCHED_SUFFIXES = {".json", ".md"}
+DEFAULT_POLL_INTERVAL = 0.5
+# Editors save in several steps (truncate, write, rename); changes that land within this
+# window are handled as one batch.
+DEBOUNCE_SECONDS = 0.05
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_ISDIR = 0x40000000
+IN_IGNORED = 0x00008000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Watch content sources and specs, re-checking only the files that change."
+    )
+    parser.add_argument("--once", action="store_true", help="Run a single full check and exit.")
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Use mtime polling even when inotify is available."
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f"Polling interval in seconds (default: {DEFAULT_POLL_INTERVAL})."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=lint_locales.DEFAULT_SIMILARITY_THRESHOLD,
+        help="Locale lint similarity threshold."
+    )
+    args = parser.parse_args(argv)
+    if args.interval <= 0:
+        parser.error("--interval must be positive")
+    return args
+
+
+def is_watched(path: Path) -> bool:
+    return path.suffix in WATCHED_SUFFIXES
+
+
+@dataclass
+class CheckReport:
+    errors: list[str] = field(default_factory=list)
+    issues: list[lint_locales.LintIssue] = field(default_factory=list)
+
+
+class ContentSession:
+    """In-memory results for every spec and source file, updated one file at a time.
+
+    validate, lint and sources select the checks: validate_catalog --watch and
+    lint_locales --watch each run only their own.
+    """
+
+    def __init__(
+        self,
+        tests_root: Path = TESTS_ROOT,
+        sources_root: Path = SOURCES_ROOT,
+        tenants_path: Path = TENANTS_PATH,
+        catalog_path: Path = CATALOG_PATH,
+        allowlist_path: Path = ALLOWLIST_PATH,
+        required_locales: list[str] | None = None,
+        threshold: float = lint_locales.DEFAULT_SIMILARITY_THRESHOLD,
+        validate: bool = True,
+        lint: bool = True,
+        sources: bool = True,
+        jobs: int = 1,
+        cache: validate_catalog.ValidationCache | None = None,
+        memo_path: Path | None = lint_locales.DEFAULT_CACHE_PATH
+    ):
+        self.tests_root = tests_root
+        self.sources_root = sources_root
+        self.tenants_path = tenants_path
+        self.catalog_path = catalog_path
+        self.allowlist_path = allowlist_path
+        required = required_locales or lint_locales.DEFAULT_REQUIRED_LOCALES
+        self.target_locales = [locale for locale in required if locale != "en"]
+        self.threshold = threshold
+        self.validate = validate
+        self.lint = lint
+        self.sources = sources
+
+        self.validator = validate_catalog.CatalogValidator(tests_root, tenants_path, catalog_path, jobs, cache)
+        self.allowlist = lint_locales.Allowlist(
+            set(),
+            set(lint_locales.DEFAULT_TECHNICAL_TERMS),
+            lint_locales.DEFAULT_SHORT_TOKEN_LENGTH
+        )
+        self.allowlist_error: str | None = None
+        # Read-only warm start from lint_locales' memo; allowlist edits re-lint every spec,
+        # and unchanged pairs are then answered from memory.
+        self.memo = lint_locales.SimilarityMemo.load(memo_path) if memo_path is not None else None
+        self.lint_results: dict[Path, tuple[list[lint_locales.LintIssue], list[str]]] = {}
+        self.source_errors: dict[Path, list[str]] = {}
+
+    @property
+    def spec_results(self) -> dict[Path, tuple[validate_catalog.SpecInfo | None, list[str]]]:
+        return self.validator.spec_results
+
+    @property
+    def watch_roots(self) -> list[Path]:
+        roots = [self.tests_root]
+        if self.sources:
+            roots.append(self.sources_root)
+        if self.validate:
+            roots.extend([self.tenants_path, self.catalog_path])
+        if self.lint:
+            roots.append(self.allowlist_path)
+        return roots
+
+    def load_all(self) -> None:
+        if self.validate:
+            self.validator.load()
+            self.validator.save_cache()
+        if self.lint:
+            self.load_allowlist()
+            spec_paths = self.spec_results if self.validate else validate_catalog.iter_spec_paths(self.tests_root)
+            for spec_path in spec_paths:
+                self.lint_spec(spec_path)
+        if self.sources:
+            for source_path in sorted(self.sources_root.glob("*/source.*.md")):
+                self.update_source(source_path)
+
+    def checked_count(self) -> int:
+        specs = len(self.spec_results) if self.validate else len(self.lint_results)
+        return specs + len(self.source_errors)
+
+    def load_allowlist(self) -> None:
+        self.allowlist, self.allowlist_error = lint_locales.load_allowlist(self.allowlist_path)
+        # Allowlist entries can silence or expose issues in any spec.
+        for spec_path in list(self.lint_results):
+            self.lint_spec(spec_path)
+
+    def update_spec(self, spec_path: Path) -> None:
+        if self.validate:
+            self.validator.update_spec(spec_path)
+        if not self.lint:
+            return
+        exists = spec_path in self.spec_results if self.validate else spec_path.exists()
+        if exists:
+            self.lint_spec(spec_path)
+        else:
+            self.lint_results.pop(spec_path, None)
+
+    def lint_spec(self, spec_path: Path) -> None:
+        self.lint_results[spec_path] = lint_locales.lint_spec_file(
+            spec_path,
+            self.target_locales,
+            self.threshold,
+            self.allowlist,
+            self.memo
+        )
+
+    def update_source(self, source_path: Path) -> None:
+        if not source_path.exists():
+            self.source_errors.pop(source_path, None)
+            return
+        format_id = detect_source_format(source_path)
+        if format_id is None:
+            # Drafts in a layout neither converter reads are not checked.
+            self.source_errors.pop(source_path, None)
+            return
+        locale = source_path.name[len("source."):-len(".md")]
+        errors: list[str] = []
+        if format_id == "universal_human_v1":
+            universal_human_md_to_spec.load_locale_source(locale, source_path, errors)
+        else:
+            values_compass_md_to_spec.parse_locale_file(source_path, locale, errors)
+        self.source_errors[source_path] = errors
+
+    def apply_changes(self, changed_paths: Iterable[Path]) -> int:
+        """Re-check the given paths; returns how many of them were relevant."""
+        handled = 0
+        for path in sorted(set(changed_paths)):
+            if self.validate and path in (self.tenants_path, self.catalog_path):
+                self.validator.load_config()
+            elif self.lint and path == self.allowlist_path:
+                self.load_allowlist()
+            elif path.name == "spec.json" and path.parent.parent == self.tests_root:
+                self.update_spec(path)
+            elif (
+                self.sources
+                and path.suffix == ".md"
+                and path.name.startswith("source.")
+                and path.parent.parent == self.sources_root
+            ):
+                self.update_source(path)
+            else:
+                continue
+            handled += 1
+        return handled
+
+    def report(self) -> CheckReport:
+        # Spec results are cached per file; only the cross-spec checks are recomputed here.
+        report = CheckReport(errors=self.validator.errors() if self.validate else [])
+
+        if self.allowlist_error:
+            report.errors.append(self.allowlist_error)
+        for spec_path in sorted(self.lint_results):
+            issues, lint_errors = self.lint_results[spec_path]
+            report.issues.extend(issues)
+            report.errors.extend(lint_errors)
+
+        for source_path in sorted(self.source_errors):
+            report.errors.extend(self.source_errors[source_path])
+        return report
+
+
+class PollingWatcher:
+    """Detects changes by comparing (mtime, size) snapshots of the watched roots."""
+
+    def __init__(self, roots: list[Path], interval: float):
+        self.roots = roots
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self) -> dict[Path, tuple[int, int]]:
+        snapshot: dict[Path, tuple[int, int]] = {}
+        for root in self.roots:
+            if root.is_file():
+                paths: Iterable[Path] = [root]
+            else:
+                paths = (path for path in root.rglob("*") if path.is_file())
+            for path in paths:
+                if not is_watched(path):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self) -> set[Path]:
+        current = self.scan()
+        previous = self.snapshot
+        self.snapshot = current
+        changed = {path for path, state in current.items() if previous.get(path) != state}
+        changed.update(path for path in previous if path not in current)
+        return changed
+
+    def wait(self) -> set[Path]:
+        while True:
+            time.sleep(self.interval)
+            changed = self.poll()
+            if changed:
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify through libc; watches every directory under the roots."""
+
+    def __init__(self, roots: list[Path]):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self.libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories: dict[int, Path] = {}
+        for root in roots:
+            if root.is_file():
+                self.add_tree(root.parent, recursive=False)
+            elif root.is_dir():
+                self.add_tree(root)
+
+    def add_watch(self, directory: Path) -> None:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd >= 0:
+            self.directories[wd] = directory
+
+    def add_tree(self, root: Path, recursive: bool = True) -> list[Path]:
+        """Watch root (and subdirectories); returns the files found in new directories."""
+        self.add_watch(root)
+        if not recursive:
+            return []
+        found: list[Path] = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            for name in dirnames:
+                self.add_watch(Path(dirpath) / name)
+            found.extend(Path(dirpath) / name for name in filenames)
+        return found
+
+    def read_events(self, timeout: float | None) -> set[Path]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: set[Path] = set()
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, name_length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + name_length].rstrip(b"\0")
+            offset += name_length
+
+            directory = self.directories.get(wd)
+            if mask & IN_IGNORED:
+                self.directories.pop(wd, None)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    changed.update(self.add_tree(path))
+                continue
+            changed.add(path)
+        return changed
+
+    def wait(self) -> set[Path]:
+        while True:
+            changed = self.read_events(None)
+            # Keep draining until the burst of events from a single save settles.
+            while True:
+                more = self.read_events(DEBOUNCE_SECONDS)
+                if not more:
+                    break
+                changed.update(more)
+            watched = {path for path in changed if is_watched(path)}
+            if watched:
+                return watched
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def create_watcher(roots: list[Path], force_poll: bool, interval: float) -> PollingWatcher | InotifyWatcher:
+    if not force_poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(roots, interval)
+
+
+def print_report(report: CheckReport, changed: int, elapsed_ms: float) -> None:
+    stamp = time.strftime("%H:%M:%S")
+    print(
+        f"[{stamp}] {changed} file(s) checked in {elapsed_ms:.0f} ms: "
+        f"{len(report.errors)} error(s), {len(report.issues)} locale issue(s)"
+    )
+    for message in report.errors:
+        print(f"ERROR: {message}")
+    for issue in report.issues:
+        print(f"- {issue.spec_path}: {issue.key} [{issue.locale}] -> {issue.reason}")
+    sys.stdout.flush()
+
+
+def watch(
+    session: ContentSession,
+    force_poll: bool = False,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    once: bool = False
+) -> int:
+    """Run a full check, then re-check changed files until Ctrl+C.
+
+    This is the loop behind content_watch.py and the --watch flag of validate_catalog
+    and lint_locales.
+    """
+    started = time.perf_counter()
+    session.load_all()
+    report = session.report()
+    print_report(report, session.checked_count(), (time.perf_counter() - started) * 1000)
+    if once:
+        return 1 if report.errors or report.issues else 0
+
+    watcher = create_watcher(session.watch_roots, force_poll, interval)
+    mode = "inotify" if isinstance(watcher, InotifyWatcher) else f"polling every {interval}s"
+    print(f"Watching content ({mode}); press Ctrl+C to stop.")
+    sys.stdout.flush()
+    try:
+        while True:
+            changed = watcher.wait()
+            started = time.perf_counter()
+            handled = session.apply_changes(changed)
+            if handled:
+                print_report(session.report(), handled, (time.perf_counter() - started) * 1000)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        watcher.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    session = ContentSession(threshold=args.threshold)
+    return watch(session, args.poll, args.interval, args.once)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
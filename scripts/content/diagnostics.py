@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Iterable, TextIO
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+OUTPUT_FORMATS = ["text", "json", "sarif"]
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+LOCATED_RE = re.compile(r"^(?P<file>.+?):(?P<line>\d+):(?P<column>\d+): (?P<rest>.*)$", re.DOTALL)
+# "<file>.json<json path> <message>" as produced by the spec validators and loaders.
+FILE_PATH_RE = re.compile(r"^(?P<file>\S*?\.json)(?:\.(?P<path>\S+?)|(?P<index>\[\S*?))?(?: (?P<rest>.*))?$", re.DOTALL)
+# "<json path> <message>" relative to the tool's default file, e.g. "tenants[0].tenant_id ...".
+JSON_PATH_RE = re.compile(r"^(?P<path>[A-Za-z_][\w-]*(?:\[\d+\]|\.[\w-]+)*) (?P<rest>.*)$", re.DOTALL)
+PATH_SEGMENT_RE = re.compile(r"\[(\d+)\]|\.?([^.\[\]]+)")
+# Located messages omit the JSON path at the document root; these words start a message.
+MESSAGE_VERBS = {"must", "is", "has", "does", "do", "overlaps"}
+
+# Codes are stable identifiers for editors and CI annotations. The validators attach them
+# to their errors directly (diagnostic_error); this table classifies plain-string messages
+# from older callers, and the first match wins.
+MESSAGE_CODES: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(r"is not valid JSON"), "invalid-json"),
+    (re.compile(r"\bnot found\b"), "not-found"),
+    (re.compile(r"not deterministically sorted"), "not-canonical"),
+    (re.compile(r"must be a non-empty string|entries must be non-empty strings"), "non-empty-string"),
+    (re.compile(r"must be an integer"), "integer"),
+    (re.compile(r"must be an object|must contain a top-level object"), "object"),
+    (re.compile(r"must be (?:a non-empty |an )?array|must contain a \w+ array"), "array"),
+    (re.compile(r"is duplicated|^duplicate |duplicates |has duplicate |already assigned"), "duplicate"),
+    (re.compile(r"must align with slug"), "slug-alignment"),
+    (re.compile(r"overlaps result_bands|do not cover"), "band-coverage"),
+    (
+        re.compile(r"does not match any question option|has no scoring\.option_weights entry|must be listed in"),
+        "unknown-reference"
+    ),
+    (re.compile(r"does not exist in|references missing test|missing default locale"), "cross-reference"),
+    (re.compile(r"unexpected keys"), "unexpected-key"),
+    (re.compile(r"missing keys|missing ids|must include|missing"), "missing"),
+]
+DEFAULT_CODE = "invalid"
+
+
+@dataclass(frozen=True)
+class Diagnostic:
+    code: str
+    message: str
+    file: str | None = None
+    json_path: str | None = None
+    line: int | None = None
+    column: int | None = None
+    severity: str = "error"
+    # Line printed in text mode; defaults to "ERROR: <original message>".
+    text: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data.pop("text")
+        return data
+
+
+class ErrorMessage(str):
+    """An error string that also carries its Diagnostic.
+
+    Validators append these to the same error lists as plain strings, so callers that
+    print or compare errors see the usual text. DiagnosticSink takes the code, file and
+    JSON path from .diagnostic instead of parsing the text.
+    """
+
+    diagnostic: Diagnostic
+
+    def __new__(cls, text: str, diagnostic: Diagnostic) -> "ErrorMessage":
+        error = super().__new__(cls, text)
+        error.diagnostic = diagnostic
+        return error
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Spec results cross process boundaries with --jobs.
+        return ErrorMessage, (str(self), self.diagnostic)
+
+
+def diagnostic_error(
+    code: str,
+    message: str,
+    json_path: str | None = None,
+    file: str | None = None,
+    text: str | None = None,
+    line: int | None = None,
+    column: int | None = None
+) -> ErrorMessage:
+    """Build a structured error. text defaults to "<json path> <message>", or to
+    "<file> <message>" for an error about a whole file."""
+    if text is None:
+        head = json_path or file
+        text = f"{head} {message}" if head else message
+    return ErrorMessage(
+        text,
+        Diagnostic(
+            code=code,
+            message=message,
+            file=file,
+            json_path=json_path,
+            line=line,
+            column=column,
+            text=f"ERROR: {text}"
+        )
+    )
+
+
+def error_to_json(error: str) -> Any:
+    """Cache form of an error: structured errors keep their Diagnostic fields."""
+    if isinstance(error, ErrorMessage):
+        return {"text": str(error), **error.diagnostic.to_dict()}
+    return error
+
+
+def error_from_json(value: Any) -> str:
+    if not isinstance(value, dict):
+        return str(value)
+    fields = {key: value.get(key) for key in ["code", "message", "file", "json_path", "line", "column"]}
+    return diagnostic_error(text=value.get("text"), **fields)
+
+
+class DiagnosticLimitReached(Exception):
+    """Raised by the sink once --max-errors / --fail-fast says to stop."""
+
+
+def classify(message: str) -> str:
+    for pattern, code in MESSAGE_CODES:
+        if pattern.search(message):
+            return code
+    return DEFAULT_CODE
+
+
+def parse_json_path(json_path: str) -> tuple[str | int, ...]:
+    segments: list[str | int] = []
+    for index, key in PATH_SEGMENT_RE.findall(json_path):
+        segments.append(int(index) if index else key)
+    return tuple(segments)
+
+
+def to_root_relative(path: str) -> str:
+    try:
+        return Path(path).resolve().relative_to(ROOT_DIR).as_posix()
+    except (ValueError, OSError):
+        return path
+
+
+def parse_message(message: str, default_file: str | None = None) -> Diagnostic:
+    """Split a formatted error string into file, JSON path, line and column."""
+    file = default_file
+    json_path = None
+    line = None
+    column = None
+    detail = message
+
+    located = LOCATED_RE.match(message)
+    if located:
+        file = located.group("file")
+        line = int(located.group("line"))
+        column = int(located.group("column"))
+        rest = located.group("rest")
+        head, _, tail = rest.partition(" ")
+        if tail and head not in MESSAGE_VERBS and JSON_PATH_RE.match(rest):
+            json_path, detail = head, tail
+        else:
+            detail = rest
+    else:
+        with_file = FILE_PATH_RE.match(message)
+        if with_file and with_file.group("rest"):
+            file = with_file.group("file")
+            # Tools label their own input by its file name ("tenants.json ...").
+            if default_file and Path(default_file).name == file:
+                file = default_file
+            json_path = with_file.group("path") or with_file.group("index")
+            detail = with_file.group("rest")
+        else:
+            relative = JSON_PATH_RE.match(message)
+            if relative and ("." in relative.group("path") or "[" in relative.group("path")):
+                json_path = relative.group("path")
+                detail = relative.group("rest")
+
+    return Diagnostic(
+        code=classify(detail),
+        message=detail,
+        file=file,
+        json_path=json_path,
+        line=line,
+        column=column,
+        text=f"ERROR: {message}"
+    )
+
+
+def add_diagnostic_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        default="text",
+        help="Diagnostics format: text (default), json (one record per line) or sarif"
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        help="Stop after reporting this many diagnostics"
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first diagnostic (same as --max-errors 1)"
+    )
+
+
+def check_diagnostic_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    if args.max_errors is not None and args.max_errors < 1:
+        parser.error("--max-errors must be >= 1")
+
+
+def check_watch_arguments(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    one_shot: list[str]
+) -> None:
+    """--watch prints text reports for the whole tree, so one-shot options do not apply."""
+    for name in one_shot:
+        if getattr(args, name):
+            parser.error(f"--{name.replace('_', '-')} cannot be used with --watch")
+    if args.output_format != "text" or args.max_errors is not None or args.fail_fast:
+        parser.error("--watch prints text reports; --format, --max-errors and --fail-fast do not apply")
+
+
+Locator = Callable[[tuple[str | int, ...]], "tuple[int, int] | None"]
+
+
+class DiagnosticSink:
+    """Streams diagnostics as they are reported instead of buffering formatted strings.
+
+    It accepts the same append/extend calls as the error lists the validators already
+    use, so it can be passed anywhere an errors list is expected. Text and JSON output
+    are written immediately; SARIF is written by close() since it is a single document.
+    """
+
+    def __init__(
+        self,
+        tool: str,
+        output_format: str = "text",
+        max_errors: int | None = None,
+        fail_fast: bool = False,
+        default_file: str | None = None,
+        locate: Locator | None = None,
+        stream: TextIO | None = None
+    ):
+        self.tool = tool
+        self.output_format = output_format
+        self.max_errors = 1 if fail_fast else max_errors
+        self.default_file = default_file
+        self.locate = locate
+        self.stream = stream
+        self.count = 0
+        self.error_count = 0
+        self.truncated = False
+        self.sarif_results: list[Diagnostic] = []
+
+    @classmethod
+    def from_args(
+        cls,
+        tool: str,
+        args: argparse.Namespace,
+        default_file: str | None = None
+    ) -> "DiagnosticSink":
+        return cls(
+            tool,
+            output_format=args.output_format,
+            max_errors=args.max_errors,
+            fail_fast=args.fail_fast,
+            default_file=default_file
+        )
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __bool__(self) -> bool:
+        return self.count > 0
+
+    @property
+    def has_errors(self) -> bool:
+        return self.error_count > 0
+
+    def append(self, message: str) -> None:
+        if not isinstance(message, ErrorMessage):
+            # Plain strings from callers that do not build diagnostics yet.
+            self.add(parse_message(message, self.default_file))
+            return
+        diagnostic = message.diagnostic
+        # Tools label their own input by its file name ("tenants.json ...").
+        if self.default_file and diagnostic.file in (None, Path(self.default_file).name):
+            diagnostic = replace(diagnostic, file=self.default_file)
+        self.add(diagnostic)
+
+    def extend(self, messages: Iterable[str]) -> None:
+        for message in messages:
+            self.append(message)
+
+    def add(self, diagnostic: Diagnostic, echo: bool = True) -> None:
+        """Report one diagnostic; echo=False counts it without writing (the caller prints it)."""
+        if self.truncated:
+            raise DiagnosticLimitReached()
+        if (
+            diagnostic.line is None
+            and diagnostic.json_path
+            and self.locate is not None
+            and diagnostic.file == self.default_file
+        ):
+            position = self.locate(parse_json_path(diagnostic.json_path))
+            if position is not None:
+                line, column = position
+                diagnostic = replace(diagnostic, line=line, column=column)
+
+        self.count += 1
+        if diagnostic.severity == "error":
+            self.error_count += 1
+        if echo:
+            self.write(diagnostic)
+
+        if self.max_errors is not None and self.count >= self.max_errors:
+            self.truncated = True
+            raise DiagnosticLimitReached()
+
+    def write(self, diagnostic: Diagnostic) -> None:
+        if self.output_format == "sarif":
+            self.sarif_results.append(diagnostic)
+        elif self.output_format == "json":
+            print(json.dumps(diagnostic.to_dict(), ensure_ascii=False), file=self.stream or sys.stdout)
+        else:
+            text = diagnostic.text or f"ERROR: {diagnostic.message}"
+            default_stream = sys.stderr if diagnostic.severity == "error" else sys.stdout
+            print(text, file=self.stream or default_stream)
+
+    def close(self) -> None:
+        if self.output_format == "sarif":
+            json.dump(self.build_sarif(), self.stream or sys.stdout, indent=2, ensure_ascii=False)
+            (self.stream or sys.stdout).write("\n")
+        elif self.output_format == "text" and self.truncated:
+            print(
+                f"ERROR: stopped after {self.count} diagnostic(s) (--max-errors/--fail-fast)",
+                file=self.stream or sys.stderr
+            )
+
+    def build_sarif(self) -> dict[str, Any]:
+        rule_ids = sorted({diagnostic.code for diagnostic in self.sarif_results})
+        results = []
+        for diagnostic in self.sarif_results:
+            result: dict[str, Any] = {
+                "ruleId": diagnostic.code,
+                "level": "error" if diagnostic.severity == "error" else "warning",
+                "message": {"text": diagnostic.message}
+            }
+            if diagnostic.file:
+                physical: dict[str, Any] = {"artifactLocation": {"uri": to_root_relative(diagnostic.file)}}
+                if diagnostic.line is not None:
+                    physical["region"] = {"startLine": diagnostic.line, "startColumn": diagnostic.column or 1}
+                location: dict[str, Any] = {"physicalLocation": physical}
+                if diagnostic.json_path:
+                    location["logicalLocations"] = [{"fullyQualifiedName": diagnostic.json_path}]
+                result["locations"] = [location]
+            results.append(result)
+        return {
+            "$schema": SARIF_SCHEMA,
+            "version": "2.1.0",
+            "runs": [
+                {
+                    "tool": {
+                        "driver": {
+                            "name": self.tool,
+                            "rules": [{"id": rule_id} for rule_id in rule_ids]
+                        }
+                    },
+                    "results": results,
+                    "properties": {"truncated": self.truncated}
+                }
+            ]
+        }
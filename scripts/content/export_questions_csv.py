@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import sys
+from pathlib import Path
+from typing import Any
+
+from atomic_write import write_text
+from import_questions_csv import CSV_COLUMNS, LOCALE_SUFFIXES, load_spec_data
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+TESTS_ROOT = ROOT_DIR / "content" / "tests"
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Export a test spec's questions to a CSV for translators."
+    )
+    parser.add_argument("--test-id", required=True, help="Test id in the form test-<slug>")
+    parser.add_argument("--out", required=True, type=Path, help="CSV file to write")
+    parser.add_argument(
+        "--tests-root",
+        type=Path,
+        default=TESTS_ROOT,
+        help="Root directory containing test specs (default: content/tests)"
+    )
+    return parser.parse_args(argv)
+
+
+def localized_cells(prefix: str, value: Any) -> dict[str, str]:
+    values = value if isinstance(value, dict) else {}
+    return {
+        f"{prefix}_{suffix}": values[locale] if isinstance(values.get(locale), str) else ""
+        for locale, suffix in LOCALE_SUFFIXES.items()
+    }
+
+
+def export_rows(spec_data: dict[str, Any], errors: list[str]) -> list[dict[str, str]]:
+    """One row per option, or per question for formats without options (universal_human_v1).
+
+    Rows use the import_questions_csv layout, so the file can be re-imported with --patch.
+    """
+    questions = spec_data.get("questions")
+    if not isinstance(questions, list):
+        errors.append("spec.json questions must be an array")
+        return []
+    scoring = spec_data.get("scoring")
+    option_weights = scoring.get("option_weights") if isinstance(scoring, dict) else None
+    if not isinstance(option_weights, dict):
+        option_weights = {}
+
+    rows: list[dict[str, str]] = []
+    for index, question in enumerate(questions):
+        if not isinstance(question, dict):
+            errors.append(f"spec.json questions[{index}] must be an object")
+            continue
+        question_id = question.get("id") or question.get("question_id")
+        if not isinstance(question_id, str) or not question_id:
+            errors.append(f"spec.json questions[{index}] has no id")
+            continue
+        question_cells = {"question_id": question_id, **localized_cells("prompt", question.get("prompt"))}
+
+        options = question.get("options")
+        if not isinstance(options, list) or not options:
+            scale_id = question.get("scale_id")
+            rows.append({**question_cells, "scale_id": scale_id if isinstance(scale_id, str) else ""})
+            continue
+
+        for option in options:
+            option_id = option.get("id") if isinstance(option, dict) else None
+            if not isinstance(option_id, str) or not option_id:
+                errors.append(f"spec.json questions[{index}] has an option without id")
+                continue
+            row = {
+                **question_cells,
+                "option_id": option_id,
+                **localized_cells("option_label", option.get("label"))
+            }
+            weights = option_weights.get(option_id)
+            if isinstance(weights, dict) and len(weights) == 1:
+                (scale_id, weight), = weights.items()
+                row["weight"] = str(weight)
+                if scale_id != "score":
+                    row["scale_id"] = scale_id
+            elif weights is not None:
+                errors.append(f"scoring.option_weights.{option_id} must have one scale to fit the weight column")
+            rows.append(row)
+    return rows
+
+
+def render_csv(rows: list[dict[str, str]]) -> str:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def export_questions_to_csv(test_id: str, out_path: Path, tests_root: Path = TESTS_ROOT) -> list[str]:
+    spec_data, spec_error = load_spec_data(tests_root / test_id / "spec.json", test_id)
+    if spec_data is None:
+        return [spec_error]
+    errors: list[str] = []
+    rows = export_rows(spec_data, errors)
+    if errors:
+        return errors
+    write_text(out_path, render_csv(rows))
+    return []
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    errors = export_questions_to_csv(args.test_id, args.out, args.tests_root)
+    if errors:
+        for message in errors:
+            print(f"ERROR: {message}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
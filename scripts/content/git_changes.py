@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class ChangeSet:
+    """Files that differ between the merge base with a git ref and the working tree.
+
+    Deleted and renamed-away paths are included, so callers can tell a spec was removed.
+    """
+
+    root: Path
+    base: str
+    paths: frozenset[Path]
+
+    def touches(self, path: Path) -> bool:
+        return path.resolve() in self.paths
+
+    def changed_spec_dirs(self, tests_root: Path) -> set[str]:
+        """Directory names of tests_root/<dir>/spec.json files in the change set."""
+        tests_root = tests_root.resolve()
+        return {
+            path.parent.name
+            for path in self.paths
+            if path.name == "spec.json" and path.parent.parent == tests_root
+        }
+
+    def read_base(self, path: Path) -> bytes | None:
+        """The file's content at the merge base, or None when it did not exist there."""
+        try:
+            relative = path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        result = run_git(["show", f"{self.base}:{relative}"], self.root)
+        return result.stdout if result.returncode == 0 else None
+
+
+def run_git(args: list[str], cwd: Path) -> subprocess.CompletedProcess[bytes]:
+    return subprocess.run(["git", *args], cwd=cwd, capture_output=True, check=False)
+
+
+def load_change_set(ref: str, cwd: Path) -> tuple[ChangeSet | None, str | None]:
+    """Diff the working tree against the merge base of ref and HEAD, plus untracked files.
+
+    Using the merge base means a PR is compared with the commit it branched from, so
+    commits that landed on the target branch since then do not count as changes.
+    """
+    while not cwd.exists() and cwd != cwd.parent:
+        cwd = cwd.parent
+    try:
+        toplevel = run_git(["rev-parse", "--show-toplevel"], cwd)
+    except OSError as exc:
+        return None, f"--changed-since needs git: {exc}"
+    if toplevel.returncode != 0:
+        return None, f"--changed-since needs a git work tree: {cwd}"
+    root = Path(toplevel.stdout.decode("utf-8").strip()).resolve()
+
+    merge_base = run_git(["merge-base", ref, "HEAD"], root)
+    if merge_base.returncode != 0:
+        return None, f"--changed-since could not resolve {ref}: {merge_base.stderr.decode('utf-8').strip()}"
+    base = merge_base.stdout.decode("utf-8").strip()
+
+    paths: set[Path] = set()
+    for args in (
+        ["diff", "--name-only", "--no-renames", "-z", base, "--"],
+        ["ls-files", "--others", "--exclude-standard", "-z"]
+    ):
+        result = run_git(args, root)
+        if result.returncode != 0:
+            return None, f"git {args[0]} failed: {result.stderr.decode('utf-8').strip()}"
+        paths.update(root / name for name in result.stdout.decode("utf-8").split("\0") if name)
+    return ChangeSet(root, base, frozenset(paths)), None
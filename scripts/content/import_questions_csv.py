@@ -5,9 +5,13 @@ import argparse
 import csv
 import json
 import sys
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
 
 import validate_catalog
+from atomic_write import dump_json, locked_tree, write_files, write_json
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 TESTS_ROOT = ROOT_DIR / "content" / "tests"
@@ -23,20 +27,122 @@ REQUIRED_COLUMNS = {
     "option_label_pt_br",
     "weight"
 }
-
-
-def parse_args() -> argparse.Namespace:
+# Column order written by export_questions_csv; scale_id is optional on import.
+CSV_COLUMNS = [
+    "question_id",
+    "option_id",
+    "prompt_en",
+    "prompt_es",
+    "prompt_pt_br",
+    "option_label_en",
+    "option_label_es",
+    "option_label_pt_br",
+    "weight",
+    "scale_id"
+]
+LOCALE_SUFFIXES = {"en": "en", "es": "es", "pt-BR": "pt_br"}
+# --patch only needs the ids; any other column that is missing or empty is left unchanged.
+PATCH_REQUIRED_COLUMNS = {"question_id", "option_id"}
+# Bulk CSVs carry the target test in every row.
+BULK_REQUIRED_COLUMNS = REQUIRED_COLUMNS | {"test_id"}
+DEFAULT_PROGRESS_EVERY = 10_000
+
+
+@dataclass
+class QuestionRow:
+    question_id: str
+    option_id: str
+    prompt: dict[str, str]
+    label: dict[str, str]
+    weight: int
+    # Empty keeps the importer's default "score" scale.
+    scale_id: str = ""
+    row_label: str = ""
+
+
+@dataclass
+class ImportedTest:
+    test_id: str
+    rows: int
+    questions: int
+    seconds: float
+
+
+@dataclass
+class BulkImportReport:
+    tests: list[ImportedTest] = field(default_factory=list)
+    read_seconds: float = 0.0
+    validate_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+    @property
+    def rows(self) -> int:
+        return sum(test.rows for test in self.tests)
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Import questions from a CSV file into a test spec."
     )
-    parser.add_argument("--test-id", required=True, help="Test id in the form test-<slug>")
-    parser.add_argument("--csv", required=True, help="Path to CSV file")
     parser.add_argument(
+        "--test-id",
+        help="Test id in the form test-<slug>; omit to bulk import rows by their test_id column"
+    )
+    parser.add_argument(
+        "--csv",
+        required=True,
+        help="Path to CSV file, or with bulk import a directory of CSV files"
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
         "--replace",
         action="store_true",
         help="Replace existing questions instead of appending"
     )
-    return parser.parse_args()
+    mode.add_argument(
+        "--patch",
+        action="store_true",
+        help="Update only changed prompts, labels and weights of existing questions"
+    )
+    parser.add_argument(
+        "--tests-root",
+        type=Path,
+        default=TESTS_ROOT,
+        help="Root directory containing test specs (default: content/tests)"
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        help=(
+            "Path to the validation cache (default: .cache/validate_catalog.json for "
+            "content/tests, none for another --tests-root)"
+        )
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the validation cache"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for validating bulk-imported specs (default: 1, 0 uses all CPUs)"
+    )
+    parser.add_argument(
+        "--progress-every",
+        type=int,
+        default=DEFAULT_PROGRESS_EVERY,
+        help=f"Report progress on stderr every N rows (default: {DEFAULT_PROGRESS_EVERY}, 0 disables)"
+    )
+    args = parser.parse_args(argv)
+    if args.patch and not args.test_id:
+        parser.error("--patch needs --test-id")
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    if args.progress_every < 0:
+        parser.error("--progress-every must be >= 0")
+    return args
 
 
 def parse_weight(raw: str, row_label: str, errors: list[str]) -> int | None:
@@ -48,144 +154,199 @@ def parse_weight(raw: str, row_label: str, errors: list[str]) -> int | None:
     return weight
 
 
-def load_csv_rows(csv_path: Path, errors: list[str]) -> list[dict[str, str]]:
+def iter_csv_rows(
+    csv_path: Path,
+    errors: list[str],
+    required_columns: set[str] = REQUIRED_COLUMNS,
+    label_prefix: str = ""
+) -> Iterator[tuple[str, dict[str, str]]]:
+    """Yield (row label, row) as the file is read; the header is row 1."""
     if not csv_path.exists():
         errors.append(f"csv file not found: {csv_path}")
-        return []
+        return
 
     with csv_path.open(newline="", encoding="utf-8") as handle:
         reader = csv.DictReader(handle)
         fieldnames = set(reader.fieldnames or [])
-        missing = REQUIRED_COLUMNS - fieldnames
+        missing = required_columns - fieldnames
         if missing:
             errors.append(
-                "csv file missing required columns: "
+                f"{label_prefix}csv file missing required columns: "
                 + ", ".join(sorted(missing))
             )
-            return []
-        rows = list(reader)
+            return
+        row_count = 0
+        for row_count, row in enumerate(reader, start=1):
+            yield f"{label_prefix}row {row_count + 1}", row
+
+    if not row_count:
+        errors.append(f"{label_prefix}csv file must include at least one data row")
+
+
+def report_progress(
+    rows: Iterable[tuple[str, dict[str, str]]],
+    every: int,
+    callback: Callable[[int], None]
+) -> Iterator[tuple[str, dict[str, str]]]:
+    """Pass rows through, calling callback(rows read) every `every` rows and once at the end."""
+    count = 0
+    for count, item in enumerate(rows, start=1):
+        if count % every == 0:
+            callback(count)
+        yield item
+    if count > every and count % every:
+        callback(count)
+
+
+def check_row(
+    row_label: str,
+    row: dict[str, str],
+    seen_option_ids: set[str],
+    errors: list[str]
+) -> QuestionRow | None:
+    """Check one row's fields in file order; QuestionBuilder checks the prompt across rows.
+
+    The option_id is reserved before the other fields are checked, so a row rejected
+    later still makes a repeat of its option_id a duplicate.
+    """
+    question_id = (row.get("question_id") or "").strip()
+    option_id = (row.get("option_id") or "").strip()
+
+    if not question_id:
+        errors.append(f"{row_label} question_id is required")
+        return None
+    if not option_id:
+        errors.append(f"{row_label} option_id is required")
+        return None
+    if option_id in seen_option_ids:
+        errors.append(f"{row_label} option_id {option_id} is duplicated")
+        return None
+    seen_option_ids.add(option_id)
+
+    prompt = {
+        "en": (row.get("prompt_en") or "").strip(),
+        "es": (row.get("prompt_es") or "").strip(),
+        "pt-BR": (row.get("prompt_pt_br") or "").strip()
+    }
+    label = {
+        "en": (row.get("option_label_en") or "").strip(),
+        "es": (row.get("option_label_es") or "").strip(),
+        "pt-BR": (row.get("option_label_pt_br") or "").strip()
+    }
+
+    if not all(prompt.values()):
+        errors.append(f"{row_label} prompt fields must be non-empty")
+        return None
+    if not all(label.values()):
+        errors.append(f"{row_label} option label fields must be non-empty")
+        return None
 
-    if not rows:
-        errors.append("csv file must include at least one data row")
-    return rows
+    weight = parse_weight(row.get("weight", "").strip(), row_label, errors)
+    if weight is None:
+        return None
 
+    scale_id = (row.get("scale_id") or "").strip()
+    return QuestionRow(question_id, option_id, prompt, label, weight, scale_id, row_label)
 
-def build_questions_from_rows(
-    rows: list[dict[str, str]],
-    errors: list[str]
-) -> tuple[list[dict[str, object]], dict[str, dict[str, int]]]:
-    questions_by_id: dict[str, dict[str, object]] = {}
-    question_order: list[str] = []
-    option_weights: dict[str, dict[str, int]] = {}
-    seen_option_ids: set[str] = set()
 
-    for index, row in enumerate(rows, start=2):
-        row_label = f"row {index}"
-        question_id = (row.get("question_id") or "").strip()
-        option_id = (row.get("option_id") or "").strip()
+@dataclass
+class QuestionBuilder:
+    """Questions and option weights built up one row at a time.
 
-        if not question_id:
-            errors.append(f"{row_label} question_id is required")
-            continue
-        if not option_id:
-            errors.append(f"{row_label} option_id is required")
-            continue
-        if option_id in seen_option_ids:
-            errors.append(f"{row_label} option_id {option_id} is duplicated")
-            continue
-        seen_option_ids.add(option_id)
-
-        prompt = {
-            "en": (row.get("prompt_en") or "").strip(),
-            "es": (row.get("prompt_es") or "").strip(),
-            "pt-BR": (row.get("prompt_pt_br") or "").strip()
-        }
-        label = {
-            "en": (row.get("option_label_en") or "").strip(),
-            "es": (row.get("option_label_es") or "").strip(),
-            "pt-BR": (row.get("option_label_pt_br") or "").strip()
-        }
-
-        if not all(prompt.values()):
-            errors.append(f"{row_label} prompt fields must be non-empty")
-            continue
-        if not all(label.values()):
-            errors.append(f"{row_label} option label fields must be non-empty")
-            continue
+    Prompts that differ between rows of a question are checked against the questions
+    built so far. Apart from the result itself, the only state is the set of option ids
+    seen: memory grows with the imported questions and options, not with the file.
+    """
 
-        weight = parse_weight(row.get("weight", "").strip(), row_label, errors)
-        if weight is None:
-            continue
+    questions_by_id: dict[str, dict[str, object]] = field(default_factory=dict)
+    option_weights: dict[str, dict[str, int]] = field(default_factory=dict)
+    # Includes the option ids of rejected rows, as the duplicate check did before.
+    seen_option_ids: set[str] = field(default_factory=set)
+
+    def add_row(self, row_label: str, row: dict[str, str], errors: list[str]) -> None:
+        question_row = check_row(row_label, row, self.seen_option_ids, errors)
+        if question_row is not None:
+            self.add(question_row, errors)
 
-        if question_id not in questions_by_id:
-            questions_by_id[question_id] = {
-                "id": question_id,
+    def add(self, question_row: QuestionRow, errors: list[str]) -> None:
+        # Rows of one question are usually contiguous; a later run is merged into the
+        # question it continues.
+        question = self.questions_by_id.get(question_row.question_id)
+        if question is None:
+            question = {
+                "id": question_row.question_id,
                 "type": "single_choice",
-                "prompt": prompt,
+                "prompt": question_row.prompt,
                 "options": []
             }
-            question_order.append(question_id)
-        else:
-            existing_prompt = questions_by_id[question_id]["prompt"]
-            if existing_prompt != prompt:
-                errors.append(f"{row_label} prompt does not match other rows for {question_id}")
-                continue
+            self.questions_by_id[question_row.question_id] = question
+        elif question["prompt"] != question_row.prompt:
+            errors.append(
+                f"{question_row.row_label} prompt does not match other rows for {question_row.question_id}"
+            )
+            return
 
-        questions_by_id[question_id]["options"].append(
+        question["options"].append(
             {
-                "id": option_id,
-                "label": label
+                "id": question_row.option_id,
+                "label": question_row.label
             }
         )
-        option_weights[option_id] = {"score": weight}
+        self.option_weights[question_row.option_id] = {question_row.scale_id or "score": question_row.weight}
+
+    def questions(self) -> list[dict[str, object]]:
+        return list(self.questions_by_id.values())
 
-    questions = [questions_by_id[qid] for qid in question_order]
+
+def build_questions_from_rows(
+    rows: Iterable[tuple[str, dict[str, str]]],
+    errors: list[str]
+) -> tuple[list[dict[str, object]], dict[str, dict[str, int]]]:
+    """Build questions as the CSV is read, checking rows in file order."""
+    builder = QuestionBuilder()
+    for row_label, row in rows:
+        builder.add_row(row_label, row, errors)
+
+    questions = builder.questions()
     if not questions and not errors:
         errors.append("csv file did not produce any questions")
-    return questions, option_weights
+    return questions, builder.option_weights
 
 
-def import_questions_from_csv(
-    test_id: str,
-    csv_path: Path,
-    replace: bool = False,
-    tests_root: Path = TESTS_ROOT
-) -> list[str]:
-    errors: list[str] = []
-
-    spec_path = tests_root / test_id / "spec.json"
+def load_spec_data(spec_path: Path, test_id: str) -> tuple[dict[str, Any] | None, str | None]:
     if not spec_path.exists():
-        return [f"spec.json not found for {test_id}: {spec_path}"]
+        return None, f"spec.json not found for {test_id}: {spec_path}"
 
     try:
         spec_data = json.loads(spec_path.read_text(encoding="utf-8"))
     except json.JSONDecodeError as exc:
-        return [f"spec.json is not valid JSON: {exc}"]
+        return None, f"spec.json is not valid JSON: {exc}"
 
     if not isinstance(spec_data, dict):
-        return ["spec.json must contain a JSON object"]
+        return None, "spec.json must contain a JSON object"
+    return spec_data, None
 
-    rows = load_csv_rows(csv_path, errors)
-    if errors:
-        return errors
-
-    questions, option_weights = build_questions_from_rows(rows, errors)
-    if errors:
-        return errors
 
+def merge_questions(
+    spec_data: dict[str, Any],
+    questions: list[dict[str, object]],
+    option_weights: dict[str, dict[str, int]],
+    replace: bool
+) -> str | None:
+    """Add (or with replace, swap in) imported questions and weights; returns the first problem."""
     existing_questions = spec_data.get("questions")
     if not isinstance(existing_questions, list):
-        return ["spec.json questions must be an array"]
+        return "spec.json questions must be an array"
 
     existing_question_ids: set[str] = set()
     for index, question in enumerate(existing_questions):
         if not isinstance(question, dict):
-            return [f"spec.json questions[{index}] must be an object"]
+            return f"spec.json questions[{index}] must be an object"
         question_id = question.get("id")
         if not isinstance(question_id, str) or not question_id.strip():
-            return [f"spec.json questions[{index}].id must be a non-empty string"]
+            return f"spec.json questions[{index}].id must be a non-empty string"
         if question_id in existing_question_ids:
-            return [f"spec.json questions[{index}].id {question_id} is duplicated"]
+            return f"spec.json questions[{index}].id {question_id} is duplicated"
         existing_question_ids.add(question_id)
 
     if replace:
@@ -194,47 +355,429 @@ def import_questions_from_csv(
         for question in questions:
             question_id = question.get("id")
             if isinstance(question_id, str) and question_id in existing_question_ids:
-                return [f"question_id {question_id} already exists in spec.json"]
+                return f"question_id {question_id} already exists in spec.json"
         spec_data["questions"] = existing_questions + questions
 
     scoring = spec_data.get("scoring")
     if not isinstance(scoring, dict):
-        return ["spec.json scoring must be an object"]
+        return "spec.json scoring must be an object"
 
     scales = scoring.get("scales")
     if not isinstance(scales, list):
-        return ["spec.json scoring.scales must be an array"]
-    if "score" not in scales:
-        scales.append("score")
+        return "spec.json scoring.scales must be an array"
+    for weights in option_weights.values():
+        for scale_id in weights:
+            if scale_id not in scales:
+                scales.append(scale_id)
 
     option_weights_map = scoring.get("option_weights")
     if not isinstance(option_weights_map, dict):
-        return ["spec.json scoring.option_weights must be an object"]
+        return "spec.json scoring.option_weights must be an object"
 
     if replace:
         scoring["option_weights"] = option_weights
     else:
         for option_id, weights in option_weights.items():
             if option_id in option_weights_map:
-                return [f"option_id {option_id} already exists in scoring.option_weights"]
+                return f"option_id {option_id} already exists in scoring.option_weights"
             option_weights_map[option_id] = weights
+    return None
 
-    validation_errors: list[str] = []
-    validate_catalog.validate_spec(spec_path, spec_data, validation_errors)
-    if validation_errors:
-        return validation_errors
 
-    spec_path.write_text(json.dumps(spec_data, indent=2) + "\n", encoding="utf-8")
-    return []
+def import_questions_from_csv(
+    test_id: str,
+    csv_path: Path,
+    replace: bool = False,
+    tests_root: Path = TESTS_ROOT,
+    validator: validate_catalog.CatalogValidator | None = None,
+    progress: Callable[[int], None] | None = None,
+    progress_every: int = DEFAULT_PROGRESS_EVERY
+) -> list[str]:
+    """Stream the CSV into questions and merge them into the spec.
+
+    Rows are checked and added to their question as they are read, so the whole file is
+    never held in memory; progress(rows read) is called every progress_every rows.
+    """
+    # Held from the spec read to its write, so concurrent imports cannot drop each other's edits.
+    with locked_tree(tests_root):
+        errors: list[str] = []
+
+        spec_path = tests_root / test_id / "spec.json"
+        spec_data, spec_error = load_spec_data(spec_path, test_id)
+        if spec_data is None:
+            return [spec_error]
+
+        rows = iter_csv_rows(csv_path, errors)
+        if progress is not None:
+            rows = report_progress(rows, progress_every, progress)
+        questions, option_weights = build_questions_from_rows(rows, errors)
+        if errors:
+            return errors
+
+        merge_error = merge_questions(spec_data, questions, option_weights, replace)
+        if merge_error:
+            return [merge_error]
+
+        if validator is None:
+            validator = validate_catalog.CatalogValidator(tests_root)
+            validator.load(identity_only=True)
+        # Checks the updated spec and the catalog references to it before anything is written.
+        validation_errors = validator.validate_data(test_id, spec_data)
+        if validation_errors:
+            return validation_errors
+
+        write_json(spec_path, spec_data)
+        return []
+
 
+def patch_spec(
+    spec_data: dict[str, Any],
+    rows: Iterable[tuple[str, dict[str, str]]],
+    errors: list[str]
+) -> list[str]:
+    """Apply changed prompts, labels, weights and scales from rows to spec_data in place.
 
-def main() -> int:
-    args = parse_args()
-    errors = import_questions_from_csv(
-        test_id=args.test_id,
-        csv_path=Path(args.csv),
-        replace=args.replace
+    Rows address existing questions and options by id; a row without option_id addresses
+    the question itself (formats without options). Returns the JSON paths that changed.
+    """
+    questions = spec_data.get("questions")
+    scoring = spec_data.get("scoring")
+    if not isinstance(questions, list):
+        errors.append("spec.json questions must be an array")
+        return []
+    questions_by_id: dict[str, dict[str, Any]] = {}
+    for question in questions:
+        if isinstance(question, dict):
+            question_id = question.get("id") or question.get("question_id")
+            if isinstance(question_id, str):
+                questions_by_id.setdefault(question_id, question)
+    option_weights = scoring.get("option_weights") if isinstance(scoring, dict) else None
+
+    changed: list[str] = []
+    # Values as they were before the patch, per changed JSON path: a row that still carries
+    # the old value (a prompt repeated on every option row) is not an edit.
+    originals: dict[str, Any] = {}
+
+    def set_text(container: dict[str, Any], field: str, cells: dict[str, str], path: str) -> bool:
+        values = container.get(field)
+        if not isinstance(values, dict):
+            values = container[field] = {}
+        for locale, text in cells.items():
+            key = f"{path}.{field}.{locale}"
+            if key in originals:
+                if text != values.get(locale) and text != originals[key]:
+                    return False
+            elif values.get(locale) != text:
+                originals[key] = values.get(locale)
+                values[locale] = text
+                changed.append(key)
+        return True
+
+    def cells(row: dict[str, str], prefix: str) -> dict[str, str]:
+        found = {}
+        for locale, suffix in LOCALE_SUFFIXES.items():
+            text = (row.get(f"{prefix}_{suffix}") or "").strip()
+            if text:
+                found[locale] = text
+        return found
+
+    for row_label, row in rows:
+        question_id = (row.get("question_id") or "").strip()
+        option_id = (row.get("option_id") or "").strip()
+        if not question_id:
+            errors.append(f"{row_label} question_id is required")
+            continue
+        question = questions_by_id.get(question_id)
+        if question is None:
+            errors.append(f"{row_label} question_id {question_id} is not in spec.json")
+            continue
+
+        path = f"questions.{question_id}"
+        if not set_text(question, "prompt", cells(row, "prompt"), path):
+            errors.append(f"{row_label} prompt does not match other rows for {question_id}")
+            continue
+
+        scale_id = (row.get("scale_id") or "").strip()
+        if not option_id:
+            if scale_id and question.get("scale_id") != scale_id:
+                question["scale_id"] = scale_id
+                changed.append(f"{path}.scale_id")
+            continue
+
+        options = question.get("options")
+        option = next(
+            (item for item in options if isinstance(item, dict) and item.get("id") == option_id),
+            None
+        ) if isinstance(options, list) else None
+        if option is None:
+            errors.append(f"{row_label} option_id {option_id} is not in question {question_id}")
+            continue
+        if not set_text(option, "label", cells(row, "option_label"), f"{path}.options.{option_id}"):
+            errors.append(f"{row_label} option_id {option_id} is listed twice with different labels")
+            continue
+
+        raw_weight = (row.get("weight") or "").strip()
+        if not raw_weight:
+            continue
+        weight = parse_weight(raw_weight, row_label, errors)
+        if weight is None:
+            continue
+        if not isinstance(option_weights, dict):
+            errors.append("spec.json scoring.option_weights must be an object")
+            continue
+        weights = option_weights.get(option_id)
+        if isinstance(weights, dict) and len(weights) > 1:
+            errors.append(f"{row_label} option_id {option_id} has several scales; edit its weights in spec.json")
+            continue
+        if not scale_id:
+            scale_id = next(iter(weights), "score") if isinstance(weights, dict) else "score"
+        if weights != {scale_id: weight}:
+            option_weights[option_id] = {scale_id: weight}
+            changed.append(f"scoring.option_weights.{option_id}")
+    return changed
+
+
+def patch_questions_from_csv(
+    test_id: str,
+    csv_path: Path,
+    tests_root: Path = TESTS_ROOT,
+    validator: validate_catalog.CatalogValidator | None = None
+) -> tuple[list[str], list[str]]:
+    """Update only the cells that differ from the spec; returns (changed JSON paths, errors).
+
+    The spec is rewritten in place with its layout unchanged, so the git diff shows only
+    the edited values. Nothing is written when no value changed.
+    """
+    # Held from the spec read to its write, so concurrent imports cannot drop each other's edits.
+    with locked_tree(tests_root):
+        errors: list[str] = []
+        spec_path = tests_root / test_id / "spec.json"
+        spec_data, spec_error = load_spec_data(spec_path, test_id)
+        if spec_data is None:
+            return [], [spec_error]
+        # Keep the file's escaping, so untouched non-ASCII text does not show up in the diff.
+        ensure_ascii = spec_path.read_bytes().isascii()
+
+        changed = patch_spec(spec_data, iter_csv_rows(csv_path, errors, PATCH_REQUIRED_COLUMNS), errors)
+        if errors or not changed:
+            return changed, errors
+
+        if validator is None:
+            validator = validate_catalog.CatalogValidator(tests_root)
+            validator.load(identity_only=True)
+        validation_errors = validator.validate_data(test_id, spec_data)
+        if validation_errors:
+            return changed, validation_errors
+
+        write_json(spec_path, spec_data, ensure_ascii=ensure_ascii)
+        return changed, []
+
+
+def list_bulk_csv_paths(path: Path, errors: list[str]) -> list[Path]:
+    if path.is_dir():
+        csv_paths = sorted(path.glob("*.csv"))
+        if not csv_paths:
+            errors.append(f"no .csv files found in {path}")
+        return csv_paths
+    if not path.exists():
+        errors.append(f"csv file not found: {path}")
+        return []
+    return [path]
+
+
+@dataclass
+class TestRows:
+    """One test's share of a bulk import, built while the rows are read."""
+
+    builder: QuestionBuilder = field(default_factory=QuestionBuilder)
+    errors: list[str] = field(default_factory=list)
+    rows: int = 0
+    seconds: float = 0.0
+
+
+def route_rows_by_test(
+    rows: Iterable[tuple[str, dict[str, str]]],
+    errors: list[str]
+) -> dict[str, TestRows]:
+    """Route bulk rows by their test_id column into each test's QuestionBuilder.
+
+    Rows are folded into questions as they are read and not kept, so a test's rows may be
+    spread over the input in any order.
+    """
+    tests: dict[str, TestRows] = {}
+    for row_label, row in rows:
+        test_id = (row.get("test_id") or "").strip()
+        if not test_id:
+            errors.append(f"{row_label} test_id is required")
+            continue
+        if not validate_catalog.TEST_ID_PATTERN.match(test_id):
+            errors.append(f"{row_label} test_id {test_id} must look like test-<slug>")
+            continue
+        started = time.perf_counter()
+        test = tests.get(test_id)
+        if test is None:
+            test = tests[test_id] = TestRows()
+        test.rows += 1
+        test.builder.add_row(row_label, row, test.errors)
+        test.seconds += time.perf_counter() - started
+    return tests
+
+
+def import_questions_bulk(
+    csv_path: Path,
+    replace: bool = False,
+    tests_root: Path = TESTS_ROOT,
+    validator: validate_catalog.CatalogValidator | None = None,
+    progress: Callable[[int], None] | None = None,
+    progress_every: int = DEFAULT_PROGRESS_EVERY
+) -> tuple[BulkImportReport, list[str]]:
+    """Import one CSV, or every CSV in a directory, routing rows by their test_id column.
+
+    Each spec is loaded once, all updated specs are validated together (in parallel with
+    the validator's jobs), and nothing is written unless every test imports cleanly.
+    """
+    # One lock for the whole tree: every spec is read, validated and written under it.
+    with locked_tree(tests_root):
+        report = BulkImportReport()
+        errors: list[str] = []
+        started = time.perf_counter()
+
+        def iter_rows() -> Iterator[tuple[str, dict[str, str]]]:
+            for path in list_bulk_csv_paths(csv_path, errors):
+                yield from iter_csv_rows(path, errors, BULK_REQUIRED_COLUMNS, f"{path.name} ")
+
+        rows: Iterable[tuple[str, dict[str, str]]] = iter_rows()
+        if progress is not None:
+            rows = report_progress(rows, progress_every, progress)
+        tests = route_rows_by_test(rows, errors)
+        report.read_seconds = time.perf_counter() - started - sum(test.seconds for test in tests.values())
+
+        updated: dict[str, dict[str, Any]] = {}
+        for test_id in sorted(tests):
+            test_started = time.perf_counter()
+            test = tests.pop(test_id)
+            spec_data, spec_error = load_spec_data(tests_root / test_id / "spec.json", test_id)
+            if spec_data is None:
+                test_errors = [spec_error]
+            else:
+                test_errors = test.errors
+                questions = test.builder.questions()
+                if not test_errors:
+                    merge_error = merge_questions(spec_data, questions, test.builder.option_weights, replace)
+                    if merge_error:
+                        test_errors.append(merge_error)
+                    else:
+                        updated[test_id] = spec_data
+                report.tests.append(
+                    ImportedTest(
+                        test_id,
+                        test.rows,
+                        len(questions),
+                        test.seconds + time.perf_counter() - test_started
+                    )
+                )
+            errors.extend(f"{test_id}: {message}" for message in test_errors)
+
+        if not updated or errors:
+            if not errors:
+                errors.append("csv input did not produce any questions")
+            return report, errors
+
+        validate_started = time.perf_counter()
+        if validator is None:
+            validator = validate_catalog.CatalogValidator(tests_root)
+            validator.load(identity_only=True)
+        errors.extend(validator.validate_many(updated))
+        report.validate_seconds = time.perf_counter() - validate_started
+        if errors:
+            return report, errors
+
+        write_started = time.perf_counter()
+        try:
+            # All specs are staged before any is replaced, so a failed write leaves none changed.
+            write_files([
+                (tests_root / test_id / "spec.json", dump_json(spec_data)) for test_id, spec_data in updated.items()
+            ])
+        except OSError as exc:
+            return report, [f"could not write specs: {exc}"]
+        report.write_seconds = time.perf_counter() - write_started
+        return report, []
+
+
+def print_progress(rows_read: int) -> None:
+    print(f"Read {rows_read} rows", file=sys.stderr)
+
+
+def print_bulk_report(report: BulkImportReport) -> None:
+    for test in report.tests:
+        print(f"{test.test_id}: {test.rows} rows, {test.questions} questions ({test.seconds:.3f}s)")
+    total = (
+        report.read_seconds
+        + sum(test.seconds for test in report.tests)
+        + report.validate_seconds
+        + report.write_seconds
+    )
+    print(
+        f"Imported {report.rows} rows into {len(report.tests)} tests in {total:.2f}s "
+        f"(read {report.read_seconds:.2f}s, validate {report.validate_seconds:.2f}s, "
+        f"write {report.write_seconds:.2f}s)."
     )
+
+
+def load_validation_cache(args: argparse.Namespace) -> validate_catalog.ValidationCache | None:
+    cache_path = args.cache_path
+    if cache_path is None and args.tests_root == TESTS_ROOT:
+        cache_path = validate_catalog.DEFAULT_CACHE_PATH
+    if args.no_cache or cache_path is None:
+        return None
+    return validate_catalog.ValidationCache.load(cache_path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    # The validator's view of the other specs is read under the same lock as the import.
+    with locked_tree(args.tests_root):
+        validator = validate_catalog.CatalogValidator(
+            args.tests_root,
+            jobs=args.jobs,
+            cache=load_validation_cache(args)
+        )
+        validator.load(identity_only=True)
+        progress = print_progress if args.progress_every else None
+        progress_every = args.progress_every or DEFAULT_PROGRESS_EVERY
+        if args.patch:
+            changed, errors = patch_questions_from_csv(
+                test_id=args.test_id,
+                csv_path=Path(args.csv),
+                tests_root=args.tests_root,
+                validator=validator
+            )
+            if not errors:
+                print(f"Patched {len(changed)} value(s) in {args.test_id}.")
+                for path in changed:
+                    print(f"- {path}")
+        elif args.test_id:
+            errors = import_questions_from_csv(
+                test_id=args.test_id,
+                csv_path=Path(args.csv),
+                replace=args.replace,
+                tests_root=args.tests_root,
+                validator=validator,
+                progress=progress,
+                progress_every=progress_every
+            )
+        else:
+            report, errors = import_questions_bulk(
+                csv_path=Path(args.csv),
+                replace=args.replace,
+                tests_root=args.tests_root,
+                validator=validator,
+                progress=progress,
+                progress_every=progress_every
+            )
+            if not errors:
+                print_bulk_report(report)
+        validator.save_cache()
     if errors:
         for message in errors:
             print(f"ERROR: {message}", file=sys.stderr)
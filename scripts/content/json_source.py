@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import bisect
+import json
+import re
+from json.decoder import scanstring
+from pathlib import Path
+from typing import Any
+
+WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+SCALAR_RE = re.compile(r"[^\s{}\[\],:\"]+")
+
+# Position tree mirroring the document: (offset, children) where children is a dict for
+# objects, a list for arrays, and None for scalars.
+Position = tuple[int, Any]
+
+
+def format_decode_error(label: str, exc: json.JSONDecodeError) -> str:
+    return f"{label} is not valid JSON: {exc}"
+
+
+class JsonSource:
+    """A parsed JSON file that can map JSON paths back to line/column positions.
+
+    Only the decoded document is kept in memory. The position index is built on the
+    first lookup by re-reading the file, so clean files never pay for it.
+    """
+
+    def __init__(self, path: Path, data: Any):
+        self.path = path
+        self.data = data
+        self._positions: Position | None = None
+        self._line_starts: list[int] | None = None
+        self._index_failed = False
+
+    def locate(self, segments: tuple[str | int, ...]) -> tuple[int, int] | None:
+        """Return the 1-based (line, column) of the deepest existing value on the path."""
+        if not self._ensure_index():
+            return None
+        node = self._positions
+        offset = node[0]
+        for segment in segments:
+            children = node[1]
+            if isinstance(children, dict) and isinstance(segment, str) and segment in children:
+                node = children[segment]
+            elif isinstance(children, list) and isinstance(segment, int) and 0 <= segment < len(children):
+                node = children[segment]
+            else:
+                break
+            offset = node[0]
+        line_index = bisect.bisect_right(self._line_starts, offset) - 1
+        return line_index + 1, offset - self._line_starts[line_index] + 1
+
+    def _ensure_index(self) -> bool:
+        if self._positions is not None:
+            return True
+        if self._index_failed:
+            return False
+        try:
+            text = self.path.read_text(encoding="utf-8")
+            start = WHITESPACE_RE.match(text, 0).end()
+            self._positions, _ = _scan_value(text, start)
+        except (OSError, ValueError, IndexError):
+            self._index_failed = True
+            return False
+        self._line_starts = [0] + [match.end() for match in re.finditer("\n", text)]
+        return True
+
+
+def _scan_value(text: str, pos: int) -> tuple[Position, int]:
+    char = text[pos]
+    if char == "{":
+        children: dict[str, Position] = {}
+        start = pos
+        pos = WHITESPACE_RE.match(text, pos + 1).end()
+        if text[pos] == "}":
+            return (start, children), pos + 1
+        while True:
+            if text[pos] != '"':
+                raise ValueError(f"expected key at {pos}")
+            key, pos = scanstring(text, pos + 1)
+            pos = WHITESPACE_RE.match(text, pos).end()
+            if text[pos] != ":":
+                raise ValueError(f"expected ':' at {pos}")
+            pos = WHITESPACE_RE.match(text, pos + 1).end()
+            children[key], pos = _scan_value(text, pos)
+            pos = WHITESPACE_RE.match(text, pos).end()
+            if text[pos] == "}":
+                return (start, children), pos + 1
+            if text[pos] != ",":
+                raise ValueError(f"expected ',' at {pos}")
+            pos = WHITESPACE_RE.match(text, pos + 1).end()
+    if char == "[":
+        items: list[Position] = []
+        start = pos
+        pos = WHITESPACE_RE.match(text, pos + 1).end()
+        if text[pos] == "]":
+            return (start, items), pos + 1
+        while True:
+            item, pos = _scan_value(text, pos)
+            items.append(item)
+            pos = WHITESPACE_RE.match(text, pos).end()
+            if text[pos] == "]":
+                return (start, items), pos + 1
+            if text[pos] != ",":
+                raise ValueError(f"expected ',' at {pos}")
+            pos = WHITESPACE_RE.match(text, pos + 1).end()
+    if char == '"':
+        _, end = scanstring(text, pos + 1)
+        return (pos, None), end
+    match = SCALAR_RE.match(text, pos)
+    if not match:
+        raise ValueError(f"unexpected character at {pos}")
+    return (pos, None), match.end()
+
+
+def load_json_source(path: Path, raw: bytes | None = None) -> JsonSource:
+    """Parse a JSON file once; raises OSError or json.JSONDecodeError."""
+    if raw is None:
+        raw = path.read_bytes()
+    return JsonSource(path, json.loads(raw.decode("utf-8")))
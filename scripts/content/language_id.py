@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import re
+import sys
+from collections import Counter
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Iterable
+
+from atomic_write import write_json
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_SOURCES_ROOT = ROOT_DIR / "content" / "sources"
+DEFAULT_PROFILES_PATH = ROOT_DIR / "config" / "locale_language_profiles.json"
+
+PROFILE_VERSION = 1
+NGRAM_SIZE = 3
+LANGUAGES = ["en", "es", "pt-BR"]
+# N-grams seen fewer times in a locale's sources are left out of its profile.
+MIN_NGRAM_COUNT = 2
+SMOOTHING = 0.5
+# Shorter strings do not carry enough n-grams to be judged reliably.
+DEFAULT_MIN_LETTERS = 24
+# Average log-likelihood gap per n-gram between the detected language and the slot's.
+DEFAULT_MIN_MARGIN = 0.5
+
+NON_LETTER_RE = re.compile(r"[\W\d_]+")
+SOURCE_NAME_RE = re.compile(r"^source\.(?P<locale>[A-Za-z]{2}(?:-[A-Za-z]{2})?)\.md$")
+# Setext underlines and "key: value" metadata lines are not prose.
+SKIP_LINE_RE = re.compile(r"^\s*(?:[=-]{3,}|[a-z_]+:\s*\S*)\s*$")
+
+
+def normalize_words(value: str) -> list[str]:
+    return NON_LETTER_RE.sub(" ", value.lower()).split()
+
+
+def word_ngrams(word: str) -> list[str]:
+    """N-grams of one space-padded word; n-grams never span two words."""
+    padded = f" {word} "
+    return [padded[start:start + NGRAM_SIZE] for start in range(len(padded) - NGRAM_SIZE + 1)]
+
+
+def iter_source_texts(sources_root: Path) -> Iterable[tuple[str, str]]:
+    """Yield (locale, prose line) from every content/sources/<test_id>/source.<locale>.md.
+
+    Lines that also appear in the same test's English source (IDs, untranslated drafts)
+    are left out of the other locales.
+    """
+    for source_path in sorted(sources_root.glob("*/source.*.md")):
+        match = SOURCE_NAME_RE.match(source_path.name)
+        if not match:
+            continue
+        locale = match.group("locale")
+        en_lines: set[str] = set()
+        en_path = source_path.with_name("source.en.md")
+        if locale != "en" and en_path.exists():
+            en_lines = set(en_path.read_text(encoding="utf-8").splitlines())
+        for line in source_path.read_text(encoding="utf-8").splitlines():
+            if line.strip() and not SKIP_LINE_RE.match(line) and line not in en_lines:
+                yield locale, line
+
+
+def build_profiles(texts: Iterable[tuple[str, str]]) -> dict[str, Any]:
+    counts: dict[str, Counter[str]] = {locale: Counter() for locale in LANGUAGES}
+    for locale, text in texts:
+        if locale in counts:
+            for word in normalize_words(text):
+                counts[locale].update(word_ngrams(word))
+
+    languages: dict[str, Any] = {}
+    for locale in LANGUAGES:
+        kept = {ngram: count for ngram, count in counts[locale].items() if count >= MIN_NGRAM_COUNT}
+        languages[locale] = {"total": sum(kept.values()), "ngrams": kept}
+    return {"version": PROFILE_VERSION, "ngram_size": NGRAM_SIZE, "languages": languages}
+
+
+class LanguageIdentifier:
+    """Scores strings against per-locale character n-gram profiles.
+
+    Each n-gram maps to a tuple of log-probabilities, one per language, so a string is
+    scored for every language in one pass by summing rows column-wise. Rows are summed
+    once per distinct word and scores are cached per normalized string, since words and
+    labels repeat across specs.
+    """
+
+    def __init__(
+        self,
+        languages: list[str],
+        table: dict[str, tuple[float, ...]],
+        unseen: tuple[float, ...],
+        min_letters: int = DEFAULT_MIN_LETTERS,
+        min_margin: float = DEFAULT_MIN_MARGIN
+    ):
+        self.languages = languages
+        self.table = table
+        self.unseen = unseen
+        self.min_letters = min_letters
+        self.min_margin = min_margin
+        self.cache: dict[str, tuple[float, ...] | None] = {}
+        # Per word: summed log-probabilities per language, then the n-gram count.
+        self.word_rows: dict[str, tuple[float, ...]] = {}
+
+    @classmethod
+    def from_profiles(cls, data: dict[str, Any], **options: Any) -> "LanguageIdentifier":
+        profiles = data["languages"]
+        languages = [locale for locale in LANGUAGES if locale in profiles]
+        vocabulary = sorted({ngram for locale in languages for ngram in profiles[locale]["ngrams"]})
+        denominators = [profiles[locale]["total"] + SMOOTHING * len(vocabulary) for locale in languages]
+        table = {
+            ngram: tuple(
+                math.log((profiles[locale]["ngrams"].get(ngram, 0) + SMOOTHING) / denominator)
+                for locale, denominator in zip(languages, denominators)
+            )
+            for ngram in vocabulary
+        }
+        unseen = tuple(math.log(SMOOTHING / denominator) for denominator in denominators)
+        return cls(languages, table, unseen, **options)
+
+    def word_row(self, word: str) -> tuple[float, ...]:
+        row = self.word_rows.get(word)
+        if row is None:
+            ngrams = word_ngrams(word)
+            row = (*map(sum, zip(*map(self.table.get, ngrams, repeat(self.unseen)))), len(ngrams))
+            self.word_rows[word] = row
+        return row
+
+    def scores(self, value: str) -> tuple[float, ...] | None:
+        """Average log-likelihood per n-gram for each language, or None for short strings."""
+        words = normalize_words(value)
+        normalized = " ".join(words)
+        if normalized in self.cache:
+            return self.cache[normalized]
+        result = None
+        if sum(map(len, words)) >= self.min_letters:
+            *totals, count = map(sum, zip(*map(self.word_row, words)))
+            result = tuple(total / count for total in totals)
+        self.cache[normalized] = result
+        return result
+
+    def mismatch(self, value: str, locale: str) -> tuple[str, float] | None:
+        """(detected language, margin) when value confidently reads as another language."""
+        if locale not in self.languages:
+            return None
+        scores = self.scores(value)
+        if scores is None:
+            return None
+        best = max(range(len(scores)), key=scores.__getitem__)
+        margin = scores[best] - scores[self.languages.index(locale)]
+        if self.languages[best] == locale or margin < self.min_margin:
+            return None
+        return self.languages[best], margin
+
+
+def load_identifier(
+    path: Path,
+    min_margin: float = DEFAULT_MIN_MARGIN
+) -> tuple[LanguageIdentifier | None, str | None]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except OSError:
+        return None, f"language profiles not found: {path}"
+    except json.JSONDecodeError as exc:
+        return None, f"{path.name} is not valid JSON: {exc.msg}"
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != PROFILE_VERSION
+        or data.get("ngram_size") != NGRAM_SIZE
+        or not isinstance(data.get("languages"), dict)
+    ):
+        return None, f"{path.name} must be rebuilt with scripts/content/language_id.py"
+    return LanguageIdentifier.from_profiles(data, min_margin=min_margin), None
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Rebuild the character n-gram language profiles from content/sources."
+    )
+    parser.add_argument(
+        "--sources-root",
+        type=Path,
+        default=DEFAULT_SOURCES_ROOT,
+        help="Path to content sources (default: content/sources)"
+    )
+    parser.add_argument(
+        "--out",
+        type=Path,
+        default=DEFAULT_PROFILES_PATH,
+        help="Profiles file to write (default: config/locale_language_profiles.json)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if not args.sources_root.exists():
+        print(f"ERROR: sources root not found: {args.sources_root}", file=sys.stderr)
+        return 1
+    profiles = build_profiles(iter_source_texts(args.sources_root))
+    write_json(args.out, profiles, sort_keys=True, ensure_ascii=False)
+    sizes = ", ".join(f"{locale}={len(profiles['languages'][locale]['ngrams'])}" for locale in LANGUAGES)
+    print(f"Wrote {args.out} ({sizes} n-grams).")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
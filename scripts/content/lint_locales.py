@@ -2,17 +2,40 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import inspect
 import json
+import os
 import re
 import sys
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
+
+import language_id
+import near_duplicates
+from atomic_write import write_json
+from diagnostics import (
+    Diagnostic,
+    DiagnosticLimitReached,
+    DiagnosticSink,
+    add_diagnostic_arguments,
+    check_diagnostic_arguments,
+    check_watch_arguments,
+    diagnostic_error
+)
+from git_changes import load_change_set
+from json_source import format_decode_error, load_json_source
+from localized_fields import iter_localized_fields
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 DEFAULT_TESTS_ROOT = ROOT_DIR / "content" / "tests"
 DEFAULT_ALLOWLIST_PATH = ROOT_DIR / "config" / "locale_lint_allowlist.json"
+DEFAULT_CACHE_PATH = ROOT_DIR / ".cache" / "lint_locales.json"
+DEFAULT_CACHE_MAX_ENTRIES = 200_000
 
 DEFAULT_REQUIRED_LOCALES = ["en", "es", "pt-BR"]
 DEFAULT_SIMILARITY_THRESHOLD = 0.95
@@ -22,9 +45,24 @@ DEFAULT_TECHNICAL_TERMS = {
     "rfid"
 }
 
+# Bump when normalization or scoring changes in a way the source fingerprint cannot see.
+NORMALIZATION_VERSION = 1
+# A change to any of these can change the verdict for every spec (see --changed-since).
+LINT_SOURCE_FILES = [
+    Path(__file__).resolve(),
+    Path(__file__).resolve().with_name("localized_fields.py"),
+    Path(__file__).resolve().with_name("near_duplicates.py"),
+    Path(__file__).resolve().with_name("json_source.py")
+]
+
 WHITESPACE_RE = re.compile(r"\s+")
 TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
 
+# Per-process lint settings for pool workers, set once by init_lint_worker.
+WORKER_SETTINGS: tuple[
+    list[str], float, "Allowlist", "SimilarityMemo | None", "language_id.LanguageIdentifier | None"
+] | None = None
+
 
 @dataclass(frozen=True)
 class LintIssue:
@@ -33,6 +71,8 @@ class LintIssue:
     locale: str
     reason: str
     similarity: float | None = None
+    # Set when the language check flagged the string as another language.
+    detected: str | None = None
 
 
 @dataclass(frozen=True)
@@ -54,6 +94,138 @@ def compute_similarity(a: str, b: str) -> float:
     return SequenceMatcher(None, a, b).ratio()
 
 
+def similarity_or_bound(a: str, b: str, threshold: float) -> tuple[float, bool]:
+    """Return (compute_similarity(a, b), True), or (upper bound, False) when it cannot reach threshold.
+
+    Two cheap upper bounds on SequenceMatcher.ratio() run first. The length bound is
+    real_quick_ratio(). The character-multiset overlap is quick_ratio(), computed with
+    Counter so no matcher is built for pruned pairs. Both use the same 2*M/T formula
+    as ratio() with M >= matches, so pruning never drops an issue.
+    """
+    total = len(a) + len(b)
+    if not total:
+        return compute_similarity(a, b), True
+    bound = 2.0 * min(len(a), len(b)) / total
+    if bound < threshold:
+        return bound, False
+    bound = 2.0 * sum((Counter(a) & Counter(b)).values()) / total
+    if bound < threshold:
+        return bound, False
+    return compute_similarity(a, b), True
+
+
+def similarity_at_least(a: str, b: str, threshold: float) -> float | None:
+    """Return compute_similarity(a, b) if it can reach threshold, otherwise None."""
+    value, exact = similarity_or_bound(a, b, threshold)
+    return value if exact else None
+
+
+def memo_fingerprint() -> str:
+    digest = hashlib.sha256(f"normalization-v{NORMALIZATION_VERSION}".encode("utf-8"))
+    digest.update(WHITESPACE_RE.pattern.encode("utf-8"))
+    for function in [collapse_whitespace, normalize_text, compute_similarity, similarity_or_bound]:
+        digest.update(inspect.getsource(function).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class SimilarityMemo:
+    """Similarity scores for normalized (en, locale) pairs, kept across runs with LRU eviction.
+
+    An entry is [score, exact]. Pruned pairs store the upper bound that ruled them out
+    (exact=False), which answers any threshold above it without recomputing. Entries do
+    not depend on the threshold or the allowlist, so both can change between runs.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fingerprint: str,
+        entries: dict[str, list[Any]] | None = None,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES
+    ):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        # Least recently used first; the saved file keeps this order.
+        self.entries: OrderedDict[str, list[Any]] = OrderedDict(entries or {})
+        self.dirty = False
+        # Entries read or written since the last take_recent(), when tracking is on (pool workers).
+        self.recent: dict[str, list[Any]] | None = None
+        self.evict()
+
+    @classmethod
+    def load(cls, path: Path, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES) -> "SimilarityMemo":
+        fingerprint = memo_fingerprint()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path, fingerprint, max_entries=max_entries)
+        if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+            return cls(path, fingerprint, max_entries=max_entries)
+        entries = data.get("entries")
+        return cls(path, fingerprint, entries if isinstance(entries, dict) else None, max_entries)
+
+    @staticmethod
+    def key(en_normalized: str, locale_normalized: str) -> str:
+        data = f"{en_normalized}\0{locale_normalized}".encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def similarity(self, en_normalized: str, locale_normalized: str, threshold: float) -> float | None:
+        """similarity_at_least() answered from the memo when possible."""
+        total = len(en_normalized) + len(locale_normalized)
+        # The length bound is cheaper than a lookup, so those pairs are never stored.
+        if total and 2.0 * min(len(en_normalized), len(locale_normalized)) / total < threshold:
+            return None
+        key = self.key(en_normalized, locale_normalized)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            if self.recent is not None:
+                self.recent[key] = entry
+            score, exact = entry
+            if exact:
+                return score
+            if score < threshold:
+                return None
+        value, exact = similarity_or_bound(en_normalized, locale_normalized, threshold)
+        self.put(key, [value, exact])
+        return value if exact else None
+
+    def put(self, key: str, entry: list[Any]) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if self.recent is not None:
+            self.recent[key] = entry
+        self.dirty = True
+        self.evict()
+
+    def evict(self) -> None:
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.dirty = True
+
+    def take_recent(self) -> dict[str, list[Any]]:
+        recent = self.recent or {}
+        self.recent = {}
+        return recent
+
+    def merge(self, entries: dict[str, list[Any]]) -> None:
+        """Apply entries used by a pool worker, in the order the worker used them."""
+        for key, entry in entries.items():
+            if self.entries.get(key) != entry:
+                self.dirty = True
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+        self.evict()
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        # Entries stay in LRU order, so keys are not sorted.
+        write_json(self.path, {"fingerprint": self.fingerprint, "entries": self.entries}, indent=None)
+        self.dirty = False
+
+
 def to_root_relative(path: Path) -> str:
     try:
         return path.relative_to(ROOT_DIR).as_posix()
@@ -63,9 +235,18 @@ def to_root_relative(path: Path) -> str:
 
 def load_json(path: Path) -> tuple[Any | None, str | None]:
     try:
-        return json.loads(path.read_text(encoding="utf-8")), None
+        return load_json_source(path).data, None
     except json.JSONDecodeError as exc:
-        return None, f"{to_root_relative(path)} is not valid JSON: {exc}"
+        label = to_root_relative(path)
+        error = diagnostic_error(
+            "invalid-json",
+            f"is not valid JSON: {exc}",
+            file=label,
+            text=format_decode_error(label, exc),
+            line=exc.lineno,
+            column=exc.colno
+        )
+        return None, error
 
 
 def load_allowlist(path: Path) -> tuple[Allowlist, str | None]:
@@ -75,7 +256,10 @@ def load_allowlist(path: Path) -> tuple[Allowlist, str | None]:
     data, error = load_json(path)
     if error:
         return Allowlist(set(), set(DEFAULT_TECHNICAL_TERMS), DEFAULT_SHORT_TOKEN_LENGTH), error
+    return parse_allowlist(data), None
 
+
+def parse_allowlist(data: Any) -> Allowlist:
     spec_exceptions: set[str] = set()
     technical_terms = set(DEFAULT_TECHNICAL_TERMS)
     short_token_length = DEFAULT_SHORT_TOKEN_LENGTH
@@ -99,7 +283,7 @@ def load_allowlist(path: Path) -> tuple[Allowlist, str | None]:
         if isinstance(length_override, int) and length_override > 0:
             short_token_length = length_override
 
-    return Allowlist(spec_exceptions, technical_terms, short_token_length), None
+    return Allowlist(spec_exceptions, technical_terms, short_token_length)
 
 
 def tokenize(value: str) -> list[str]:
@@ -145,7 +329,8 @@ def compare_locale_pair(
     en_value: str,
     locale_value: str,
     threshold: float,
-    allowlist: Allowlist
+    allowlist: Allowlist,
+    memo: SimilarityMemo | None = None
 ) -> LintIssue | None:
     en_collapsed = collapse_whitespace(en_value)
     locale_collapsed = collapse_whitespace(locale_value)
@@ -161,8 +346,11 @@ def compare_locale_pair(
     if en_normalized == locale_normalized:
         return LintIssue(spec_path, key, locale, "identical to en")
 
-    similarity = compute_similarity(en_normalized, locale_normalized)
-    if similarity >= threshold:
+    if memo is not None:
+        similarity = memo.similarity(en_normalized, locale_normalized, threshold)
+    else:
+        similarity = similarity_at_least(en_normalized, locale_normalized, threshold)
+    if similarity is not None and similarity >= threshold:
         return LintIssue(
             spec_path,
             key,
@@ -174,162 +362,286 @@ def compare_locale_pair(
     return None
 
 
+def check_language(
+    spec_path: str,
+    key: str,
+    locale: str,
+    value: str,
+    allowlist: Allowlist,
+    languages: language_id.LanguageIdentifier
+) -> LintIssue | None:
+    mismatch = languages.mismatch(value, locale)
+    # Mismatches are rare, so the allowlist is only consulted for them.
+    if mismatch is None or is_trivial_or_allowlisted(value, allowlist):
+        return None
+    detected, margin = mismatch
+    return LintIssue(
+        spec_path,
+        key,
+        locale,
+        f"reads as {detected} (margin {margin:.2f} >= {languages.min_margin:.2f})",
+        detected=detected
+    )
+
+
 def iter_spec_paths(tests_root: Path) -> Iterable[Path]:
     return sorted(tests_root.glob("**/spec.json"))
 
 
-def lint_locales(
-    tests_root: Path,
-    required_locales: list[str],
+def lint_spec_data(
+    relative_spec_path: str,
+    data: Any,
+    target_locales: list[str],
     threshold: float,
-    allowlist_path: Path
+    allowlist: Allowlist,
+    memo: SimilarityMemo | None = None,
+    languages: language_id.LanguageIdentifier | None = None
 ) -> tuple[list[LintIssue], list[str]]:
     issues: list[LintIssue] = []
     errors: list[str] = []
 
-    allowlist, allowlist_error = load_allowlist(allowlist_path)
-    if allowlist_error:
-        errors.append(allowlist_error)
+    if not isinstance(data, dict):
+        errors.append(diagnostic_error("object", "must be a JSON object", file=relative_spec_path))
+        return issues, errors
+
+    locales = data.get("locales")
+    if not isinstance(locales, dict):
+        errors.append(
+            diagnostic_error(
+                "object",
+                "must be an object",
+                "locales",
+                relative_spec_path,
+                f"{relative_spec_path}.locales must be an object"
+            )
+        )
+        return issues, errors
+
+    en_locale = locales.get("en")
+    if not isinstance(en_locale, dict):
+        errors.append(
+            diagnostic_error(
+                "object",
+                "must be an object",
+                "locales.en",
+                relative_spec_path,
+                f"{relative_spec_path}.locales.en must be an object"
+            )
+        )
+        return issues, errors
+
+    # The language check also covers the en strings themselves.
+    slot_locales = target_locales if languages is None else ["en", *target_locales]
+    for localized in iter_localized_fields(data):
+        en_value = localized.values.get("en")
+        for locale in slot_locales:
+            locale_value = localized.values.get(locale)
+            if locale_value is None:
+                continue
+            issue = None
+            if locale != "en" and en_value is not None:
+                issue = compare_locale_pair(
+                    relative_spec_path,
+                    localized.key(locale),
+                    locale,
+                    en_value,
+                    locale_value,
+                    threshold,
+                    allowlist,
+                    memo
+                )
+            if issue is None and languages is not None:
+                issue = check_language(
+                    relative_spec_path,
+                    localized.key(locale),
+                    locale,
+                    locale_value,
+                    allowlist,
+                    languages
+                )
+            if issue:
+                issues.append(issue)
 
-    target_locales = [locale for locale in required_locales if locale != "en"]
+    return issues, errors
+
+
+def lint_spec_file(
+    spec_path: Path,
+    target_locales: list[str],
+    threshold: float,
+    allowlist: Allowlist,
+    memo: SimilarityMemo | None = None,
+    languages: language_id.LanguageIdentifier | None = None
+) -> tuple[list[LintIssue], list[str]]:
+    relative_spec_path = to_root_relative(spec_path)
+    if relative_spec_path in allowlist.spec_exceptions:
+        return [], []
+
+    data, error = load_json(spec_path)
+    if error:
+        return [], [error]
+    return lint_spec_data(relative_spec_path, data, target_locales, threshold, allowlist, memo, languages)
+
+
+def issue_diagnostic(issue: LintIssue) -> Diagnostic:
+    if issue.detected is not None:
+        code = "locale-language"
+    else:
+        code = "locale-identical" if issue.similarity is None else "locale-similar"
+    return Diagnostic(
+        code=code,
+        message=issue.reason,
+        file=issue.spec_path,
+        json_path=issue.key,
+        severity="warning",
+        text=f"- {issue.spec_path}: {issue.key} [{issue.locale}] -> {issue.reason}"
+    )
+
+
+def init_lint_worker(
+    target_locales: list[str],
+    threshold: float,
+    allowlist: Allowlist,
+    memo: SimilarityMemo | None,
+    languages: language_id.LanguageIdentifier | None
+) -> None:
+    # Sent once per worker (inherited copy-on-write under fork) instead of with every spec.
+    global WORKER_SETTINGS
+    if memo is not None:
+        memo.recent = {}
+    WORKER_SETTINGS = (target_locales, threshold, allowlist, memo, languages)
+
+
+def lint_spec_worker(spec_path: Path) -> tuple[list[LintIssue], list[str], dict[str, list[Any]]]:
+    target_locales, threshold, allowlist, memo, languages = WORKER_SETTINGS
+    issues, errors = lint_spec_file(spec_path, target_locales, threshold, allowlist, memo, languages)
+    # The worker's memo copy is discarded with the pool; the parent merges what it used.
+    return issues, errors, memo.take_recent() if memo is not None else {}
+
+
+def iter_lint_results(
+    spec_paths: list[Path],
+    target_locales: list[str],
+    threshold: float,
+    allowlist: Allowlist,
+    jobs: int = 1,
+    memo: SimilarityMemo | None = None,
+    languages: language_id.LanguageIdentifier | None = None
+) -> Iterator[tuple[list[LintIssue], list[str]]]:
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(spec_paths))
+    if jobs <= 1:
+        for spec_path in spec_paths:
+            yield lint_spec_file(spec_path, target_locales, threshold, allowlist, memo, languages)
+        return
+
+    # Executor.map yields results in submission order, so the merged output matches a serial run.
+    chunksize = max(1, len(spec_paths) // (jobs * 4))
+    executor = ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=init_lint_worker,
+        initargs=(target_locales, threshold, allowlist, memo, languages)
+    )
+    try:
+        for issues, errors, memo_entries in executor.map(lint_spec_worker, spec_paths, chunksize=chunksize):
+            if memo is not None:
+                memo.merge(memo_entries)
+            yield issues, errors
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def cluster_diagnostic(cluster: near_duplicates.NearDuplicateCluster) -> Diagnostic:
+    first, *others = cluster.members
+    others_text = ", ".join(f"{ref.spec_path}:{ref.key}" for ref in others)
+    return Diagnostic(
+        code="near-duplicate",
+        message=f"near-duplicate (jaccard >= {cluster.min_jaccard:.2f}) of {others_text}",
+        file=first.spec_path,
+        json_path=first.key,
+        severity="warning",
+        text=format_cluster(cluster)
+    )
 
-    for spec_path in iter_spec_paths(tests_root):
+
+def format_cluster(cluster: near_duplicates.NearDuplicateCluster) -> str:
+    members = ", ".join(f"{ref.spec_path}:{ref.key}" for ref in cluster.members)
+    return f"- [{cluster.locale}] jaccard >= {cluster.min_jaccard:.2f}: {members}"
+
+
+def iter_near_duplicate_specs(spec_paths: Iterable[Path], allowlist: Allowlist) -> Iterator[tuple[str, Any]]:
+    """Yield (relative path, data) for specs that parse; the per-spec lint reports the rest."""
+    for spec_path in spec_paths:
         relative_spec_path = to_root_relative(spec_path)
         if relative_spec_path in allowlist.spec_exceptions:
             continue
-
         data, error = load_json(spec_path)
-        if error:
-            errors.append(error)
-            continue
-        if not isinstance(data, dict):
-            errors.append(f"{relative_spec_path} must be a JSON object")
-            continue
+        if error is None:
+            yield relative_spec_path, data
 
-        locales = data.get("locales")
-        if not isinstance(locales, dict):
-            errors.append(f"{relative_spec_path}.locales must be an object")
-            continue
 
-        en_locale = locales.get("en")
-        if not isinstance(en_locale, dict):
-            errors.append(f"{relative_spec_path}.locales.en must be an object")
-            continue
+def changed_lint_specs(
+    ref: str,
+    tests_root: Path,
+    allowlist_path: Path,
+    allowlist: Allowlist,
+    source_files: list[Path]
+) -> tuple[set[str] | None, str | None]:
+    """Spec directories affected by changes since ref, or None when every spec is affected.
+
+    Besides changed specs, this includes specs added to or removed from the allowlist's
+    spec_exceptions. Changed terms or short-token length, or lint sources, affect all specs.
+    """
+    change_set, change_error = load_change_set(ref, tests_root)
+    if change_error:
+        return None, change_error
+    if any(change_set.touches(path) for path in source_files):
+        return None, None
+
+    affected = change_set.changed_spec_dirs(tests_root)
+    if change_set.touches(allowlist_path):
+        base_raw = change_set.read_base(allowlist_path)
+        base_allowlist = parse_allowlist(None)
+        if base_raw is not None:
+            try:
+                base_allowlist = parse_allowlist(json.loads(base_raw))
+            except ValueError:
+                return None, None
+        if (
+            base_allowlist.technical_terms != allowlist.technical_terms
+            or base_allowlist.short_token_length != allowlist.short_token_length
+        ):
+            return None, None
+        for spec in base_allowlist.spec_exceptions ^ allowlist.spec_exceptions:
+            affected.add(Path(spec).parent.name)
+    return affected, None
 
-        for field in ["title", "short_description"]:
-            en_value = en_locale.get(field)
-            if not isinstance(en_value, str):
-                continue
-            for locale in target_locales:
-                locale_block = locales.get(locale)
-                if not isinstance(locale_block, dict):
-                    continue
-                locale_value = locale_block.get(field)
-                if not isinstance(locale_value, str):
-                    continue
-                issue = compare_locale_pair(
-                    relative_spec_path,
-                    f"locales.{locale}.{field}",
-                    locale,
-                    en_value,
-                    locale_value,
-                    threshold,
-                    allowlist
-                )
-                if issue:
-                    issues.append(issue)
-
-        questions = data.get("questions")
-        if isinstance(questions, list):
-            for index, question in enumerate(questions):
-                if not isinstance(question, dict):
-                    continue
-
-                question_id = question.get("id") or question.get("question_id") or f"index-{index}"
-
-                prompt = question.get("prompt")
-                if isinstance(prompt, dict):
-                    en_prompt = prompt.get("en")
-                    if isinstance(en_prompt, str):
-                        for locale in target_locales:
-                            locale_prompt = prompt.get(locale)
-                            if not isinstance(locale_prompt, str):
-                                continue
-                            issue = compare_locale_pair(
-                                relative_spec_path,
-                                f"questions.{question_id}.prompt.{locale}",
-                                locale,
-                                en_prompt,
-                                locale_prompt,
-                                threshold,
-                                allowlist
-                            )
-                            if issue:
-                                issues.append(issue)
-
-                options = question.get("options")
-                if isinstance(options, list):
-                    for opt_index, option in enumerate(options):
-                        if not isinstance(option, dict):
-                            continue
-                        option_id = option.get("id") or f"index-{opt_index}"
-                        label = option.get("label")
-                        if not isinstance(label, dict):
-                            continue
-                        en_label = label.get("en")
-                        if not isinstance(en_label, str):
-                            continue
-                        for locale in target_locales:
-                            locale_label = label.get(locale)
-                            if not isinstance(locale_label, str):
-                                continue
-                            issue = compare_locale_pair(
-                                relative_spec_path,
-                                f"questions.{question_id}.options.{option_id}.label.{locale}",
-                                locale,
-                                en_label,
-                                locale_label,
-                                threshold,
-                                allowlist
-                            )
-                            if issue:
-                                issues.append(issue)
-
-        result_bands = data.get("result_bands")
-        if isinstance(result_bands, list):
-            for band_index, band in enumerate(result_bands):
-                if not isinstance(band, dict):
-                    continue
-                band_id = band.get("band_id") or f"index-{band_index}"
-                copy_block = band.get("copy")
-                if not isinstance(copy_block, dict):
-                    continue
-                en_copy = copy_block.get("en")
-                if not isinstance(en_copy, dict):
-                    continue
-
-                for field in ["headline", "summary"]:
-                    en_value = en_copy.get(field)
-                    if not isinstance(en_value, str):
-                        continue
-                    for locale in target_locales:
-                        locale_copy = copy_block.get(locale)
-                        if not isinstance(locale_copy, dict):
-                            continue
-                        locale_value = locale_copy.get(field)
-                        if not isinstance(locale_value, str):
-                            continue
-                        issue = compare_locale_pair(
-                            relative_spec_path,
-                            f"result_bands.{band_id}.copy.{locale}.{field}",
-                            locale,
-                            en_value,
-                            locale_value,
-                            threshold,
-                            allowlist
-                        )
-                        if issue:
-                            issues.append(issue)
+
+def lint_locales(
+    tests_root: Path,
+    required_locales: list[str],
+    threshold: float,
+    allowlist_path: Path,
+    jobs: int = 1,
+    memo: SimilarityMemo | None = None,
+    languages: language_id.LanguageIdentifier | None = None
+) -> tuple[list[LintIssue], list[str]]:
+    issues: list[LintIssue] = []
+    errors: list[str] = []
+
+    allowlist, allowlist_error = load_allowlist(allowlist_path)
+    if allowlist_error:
+        errors.append(allowlist_error)
+
+    target_locales = [locale for locale in required_locales if locale != "en"]
+
+    spec_paths = list(iter_spec_paths(tests_root))
+    for spec_issues, spec_errors in iter_lint_results(
+        spec_paths, target_locales, threshold, allowlist, jobs, memo, languages
+    ):
+        issues.extend(spec_issues)
+        errors.extend(spec_errors)
 
     return issues, errors
 
@@ -362,44 +674,234 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default=DEFAULT_ALLOWLIST_PATH,
         help=f"Path to allowlist config (default: {to_root_relative(DEFAULT_ALLOWLIST_PATH)})"
     )
-    return parser.parse_args(argv)
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help="Path to the similarity memo (default: .cache/lint_locales.json)"
+    )
+    parser.add_argument(
+        "--cache-max-entries",
+        type=int,
+        default=DEFAULT_CACHE_MAX_ENTRIES,
+        help=f"Least recently used pairs beyond this are evicted (default: {DEFAULT_CACHE_MAX_ENTRIES})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Compute every similarity without reading or writing the memo"
+    )
+    parser.add_argument(
+        "--language-id",
+        action="store_true",
+        help="Also flag strings that read as another language than their locale slot"
+    )
+    parser.add_argument(
+        "--language-profiles",
+        type=Path,
+        default=language_id.DEFAULT_PROFILES_PATH,
+        help=(
+            "Character n-gram profiles for --language-id "
+            f"(default: {to_root_relative(language_id.DEFAULT_PROFILES_PATH)})"
+        )
+    )
+    parser.add_argument(
+        "--language-margin",
+        type=float,
+        default=language_id.DEFAULT_MIN_MARGIN,
+        help=(
+            "Per-n-gram log-likelihood margin a string needs to be flagged by --language-id "
+            f"(default: {language_id.DEFAULT_MIN_MARGIN})"
+        )
+    )
+    parser.add_argument(
+        "--near-duplicates",
+        action="store_true",
+        help="Also report near-duplicate localized strings across specs (MinHash/LSH)"
+    )
+    parser.add_argument(
+        "--jaccard-threshold",
+        type=float,
+        default=near_duplicates.DEFAULT_JACCARD_THRESHOLD,
+        help=(
+            "Shingle Jaccard similarity for --near-duplicates "
+            f"(default: {near_duplicates.DEFAULT_JACCARD_THRESHOLD})"
+        )
+    )
+    parser.add_argument(
+        "--shingle-size",
+        type=int,
+        default=near_duplicates.DEFAULT_SHINGLE_SIZE,
+        help=f"Characters per shingle for --near-duplicates (default: {near_duplicates.DEFAULT_SHINGLE_SIZE})"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1, 0 uses all CPUs)"
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="GIT_REF",
+        help=(
+            "Only lint specs changed since the merge base with this ref, plus specs whose "
+            "allowlist exception changed"
+        )
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-lint specs as they or the allowlist change"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, use mtime polling even when inotify is available"
+    )
+    add_diagnostic_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    if args.cache_max_entries < 1:
+        parser.error("--cache-max-entries must be >= 1")
+    if args.language_margin <= 0:
+        parser.error("--language-margin must be > 0")
+    if not 0 < args.jaccard_threshold <= 1:
+        parser.error("--jaccard-threshold must be in (0, 1]")
+    if args.shingle_size < 1:
+        parser.error("--shingle-size must be >= 1")
+    check_diagnostic_arguments(parser, args)
+    if args.watch:
+        check_watch_arguments(parser, args, ["changed_since", "language_id", "near_duplicates"])
+    return args
 
 
 def main(argv: list[str] | None = None) -> int:
-    args = parse_args(argv or sys.argv[1:])
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.watch:
+        # content_watch imports this module, so it is only loaded for --watch.
+        import content_watch
+
+        session = content_watch.ContentSession(
+            tests_root=args.tests_root,
+            allowlist_path=args.allowlist_path,
+            required_locales=args.required_locales,
+            threshold=float(args.similarity_threshold),
+            validate=False,
+            sources=False,
+            memo_path=None if args.no_cache else args.cache_path
+        )
+        return content_watch.watch(session, force_poll=args.poll)
 
-    tests_root: Path = args.tests_root
-    if not tests_root.exists():
-        print(f"ERROR: tests root not found: {tests_root}", file=sys.stderr)
-        return 2
+    sink = DiagnosticSink.from_args("lint_locales", args)
+    # Text mode keeps the summary-first layout, so issues are printed after the run.
+    text_mode = args.output_format == "text"
 
-    issues, errors = lint_locales(
-        tests_root=tests_root,
-        required_locales=list(args.required_locales),
-        threshold=float(args.similarity_threshold),
-        allowlist_path=args.allowlist_path
-    )
+    tests_root: Path = args.tests_root
+    issues: list[LintIssue] = []
+    clusters: list[near_duplicates.NearDuplicateCluster] = []
+    spec_count = 0
+    try:
+        if not tests_root.exists():
+            sink.append(
+                diagnostic_error(
+                    "not-found",
+                    f"not found: {tests_root}",
+                    file=str(tests_root),
+                    text=f"tests root not found: {tests_root}"
+                )
+            )
+        else:
+            allowlist, allowlist_error = load_allowlist(args.allowlist_path)
+            if allowlist_error:
+                sink.append(allowlist_error)
+            target_locales = [locale for locale in args.required_locales if locale != "en"]
+            threshold = float(args.similarity_threshold)
+
+            memo = None if args.no_cache else SimilarityMemo.load(args.cache_path, args.cache_max_entries)
+            languages = None
+            if args.language_id:
+                languages, languages_error = language_id.load_identifier(
+                    args.language_profiles,
+                    args.language_margin
+                )
+                if languages_error:
+                    sink.append(languages_error)
+
+            spec_paths = list(iter_spec_paths(tests_root))
+            affected = None
+            if args.changed_since:
+                source_files = list(LINT_SOURCE_FILES)
+                if languages is not None:
+                    source_files += [Path(language_id.__file__).resolve(), args.language_profiles]
+                affected, change_error = changed_lint_specs(
+                    args.changed_since, tests_root, args.allowlist_path, allowlist, source_files
+                )
+                if change_error:
+                    sink.append(change_error)
+            lint_paths = [
+                spec_path for spec_path in spec_paths if affected is None or spec_path.parent.name in affected
+            ]
+            spec_count = len(lint_paths)
+            results = iter_lint_results(
+                lint_paths, target_locales, threshold, allowlist, args.jobs, memo, languages
+            )
+            try:
+                for spec_issues, spec_errors in results:
+                    sink.extend(spec_errors)
+                    for issue in spec_issues:
+                        issues.append(issue)
+                        sink.add(issue_diagnostic(issue), echo=not text_mode)
+            finally:
+                results.close()
+                if memo is not None:
+                    memo.save()
+
+            if args.near_duplicates:
+                for cluster in near_duplicates.find_near_duplicates(
+                    iter_near_duplicate_specs(spec_paths, allowlist),
+                    threshold=args.jaccard_threshold,
+                    shingle_size=args.shingle_size
+                ):
+                    # A changed spec can repeat an unchanged one, so clustering sees every spec.
+                    if affected is not None and not any(
+                        Path(member.spec_path).parent.name in affected for member in cluster.members
+                    ):
+                        continue
+                    clusters.append(cluster)
+                    sink.add(cluster_diagnostic(cluster), echo=not text_mode)
+    except DiagnosticLimitReached:
+        pass
 
-    if errors:
-        for error in errors:
-            print(f"ERROR: {error}", file=sys.stderr)
+    if sink.has_errors:
+        sink.close()
         return 2
 
-    if not issues:
-        print(
-            "Locale lint passed "
-            f"({len(list(iter_spec_paths(tests_root)))} specs checked, threshold={args.similarity_threshold:.2f})."
-        )
-        return 0
-
-    print(
-        "Locale lint failed "
-        f"({len(issues)} issue(s), threshold={args.similarity_threshold:.2f})."
-    )
-    for issue in issues:
-        print(f"- {issue.spec_path}: {issue.key} [{issue.locale}] -> {issue.reason}")
-
-    return 1
+    if text_mode:
+        if not issues:
+            print(
+                "Locale lint passed "
+                f"({spec_count} specs checked, threshold={args.similarity_threshold:.2f})."
+            )
+        else:
+            print(
+                "Locale lint failed "
+                f"({len(issues)} issue(s), threshold={args.similarity_threshold:.2f})."
+            )
+            for issue in issues:
+                print(f"- {issue.spec_path}: {issue.key} [{issue.locale}] -> {issue.reason}")
+        if args.near_duplicates and not clusters:
+            print(f"Near-duplicate check passed (jaccard={args.jaccard_threshold:.2f}).")
+        elif clusters:
+            print(
+                "Near-duplicate check failed "
+                f"({len(clusters)} cluster(s), jaccard={args.jaccard_threshold:.2f})."
+            )
+            for cluster in clusters:
+                print(format_cluster(cluster))
+    sink.close()
+
+    return 1 if issues or clusters else 0
 
 
 if __name__ == "__main__":
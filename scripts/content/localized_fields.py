@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+DEFAULT_FORMAT_ID = "values_compass_v1"
+
+# One line per localized field. "name" is an object key, "*" every key of an object,
+# "name[id|alt]" every list item named by its first non-empty id field (index-N
+# otherwise), "name[]" every list item by position, and "{locale}" the object keyed by
+# locale tag. List values at the end of a path are checked item by item.
+LOCALIZED_FIELDS: dict[str, list[str]] = {
+    "values_compass_v1": [
+        "locales.{locale}.title",
+        "locales.{locale}.short_description",
+        "locales.{locale}.intro",
+        "locales.{locale}.instructions",
+        "locales.{locale}.paywall_headline",
+        "locales.{locale}.report_title",
+        "questions[id|question_id].prompt.{locale}",
+        "questions[id|question_id].options[id].label.{locale}",
+        "result_bands[band_id].copy.{locale}.headline",
+        "result_bands[band_id].copy.{locale}.summary",
+        "result_bands[band_id].copy.{locale}.bullets[]",
+        "value_dimensions[value_id].name.{locale}",
+        "value_dimensions[value_id].definition.{locale}",
+        "value_profiles.*.preview.{locale}",
+        "value_profiles.*.paid.{locale}[]",
+        "conflicts[pair_id].label.{locale}",
+        "conflicts[pair_id].copy.level.{locale}",
+        "conflicts[pair_id].copy.summary.{locale}",
+        "conflicts[pair_id].copy.playbook.{locale}[]",
+        "templates.preview_template.{locale}",
+        "templates.paywall_hook.{locale}",
+        "templates.paid_report.title.{locale}",
+        "templates.paid_report.sections.{locale}[]",
+        "templates.paywall_copy.{locale}.cta",
+        "templates.paywall_copy.{locale}.short_line",
+        "templates.paywall_copy.{locale}.bullets[]"
+    ],
+    "universal_human_v1": [
+        "locales.{locale}.title",
+        "locales.{locale}.short_description",
+        "locales.{locale}.intro",
+        "locales.{locale}.instructions",
+        "locales.{locale}.paywall_hook",
+        "locales.{locale}.paid_report_structure",
+        "questions[id|question_id].prompt.{locale}"
+    ]
+}
+
+SEGMENT_RE = re.compile(r"^(?P<name>[^.\[\]]+)(?:\[(?P<ids>[^\]]*)\])?$")
+LOCALE_SEGMENT = "{locale}"
+
+
+@dataclass(frozen=True)
+class Segment:
+    # "key", "each", "items" or "locale".
+    kind: str
+    name: str = ""
+    id_fields: tuple[str, ...] = ()
+
+    def select(self, value: Any, key: str) -> Iterator[tuple[Any, str]]:
+        """Yield (child value, child key) for every node this segment matches."""
+        if self.kind == "key":
+            if isinstance(value, dict) and self.name in value:
+                yield value[self.name], f"{key}.{self.name}"
+        elif self.kind == "each":
+            if isinstance(value, dict):
+                for name, child in value.items():
+                    yield child, f"{key}.{name}"
+        elif self.kind == "items" and isinstance(value, list):
+            for index, item in enumerate(value):
+                if not self.id_fields:
+                    yield item, f"{key}[{index}]"
+                    continue
+                if not isinstance(item, dict):
+                    continue
+                item_id = next((item.get(name) for name in self.id_fields if item.get(name)), None)
+                yield item, f"{key}.{item_id or f'index-{index}'}"
+
+
+@dataclass
+class FieldNode:
+    children: dict[Segment, "FieldNode"] = field(default_factory=dict)
+    leaf: bool = False
+
+
+@dataclass(frozen=True)
+class LocalizedField:
+    """One localized field of a spec with its text per locale, in the spec's locale order."""
+
+    prefix: str
+    suffix: str
+    values: dict[str, str]
+
+    def key(self, locale: str) -> str:
+        return f"{self.prefix}.{locale}{self.suffix}" if self.prefix else f"{locale}{self.suffix}"
+
+
+def parse_field_path(path: str) -> list[Segment]:
+    segments: list[Segment] = []
+    for part in path.split("."):
+        if part.startswith(LOCALE_SEGMENT):
+            segments.append(Segment("locale"))
+            part = part[len(LOCALE_SEGMENT):]
+            if not part:
+                continue
+            if part != "[]":
+                raise ValueError(f"invalid localized field path: {path}")
+            segments.append(Segment("items"))
+            continue
+        match = SEGMENT_RE.match(part)
+        if not match:
+            raise ValueError(f"invalid localized field path: {path}")
+        name, ids = match.group("name"), match.group("ids")
+        segments.append(Segment("each") if name == "*" else Segment("key", name))
+        if ids is not None:
+            segments.append(Segment("items", id_fields=tuple(name for name in ids.split("|") if name)))
+    if sum(segment.kind == "locale" for segment in segments) != 1:
+        raise ValueError(f"localized field path needs exactly one {LOCALE_SEGMENT}: {path}")
+    return segments
+
+
+def compile_fields(paths: list[str]) -> FieldNode:
+    """Merge field paths into a prefix tree so a spec is traversed once for all of them."""
+    root = FieldNode()
+    for path in paths:
+        node = root
+        for segment in parse_field_path(path):
+            node = node.children.setdefault(segment, FieldNode())
+        node.leaf = True
+    return root
+
+
+COMPILED_FIELDS = {format_id: compile_fields(paths) for format_id, paths in LOCALIZED_FIELDS.items()}
+
+
+def walk_spec(node: FieldNode, value: Any, key: str, out: list[LocalizedField]) -> None:
+    for segment, child in node.children.items():
+        if segment.kind == "locale":
+            if isinstance(value, dict):
+                walk_locales(child, value, key.lstrip("."), "", out)
+            continue
+        for child_value, child_key in segment.select(value, key):
+            walk_spec(child, child_value, child_key, out)
+
+
+def walk_locales(
+    node: FieldNode,
+    values: dict[str, Any],
+    prefix: str,
+    suffix: str,
+    out: list[LocalizedField]
+) -> None:
+    """Walk the part of the path below {locale} for every locale at once."""
+    if node.leaf:
+        texts = {locale: value for locale, value in values.items() if isinstance(value, str)}
+        if texts:
+            out.append(LocalizedField(prefix, suffix, texts))
+    for segment, child in node.children.items():
+        selected: dict[str, dict[str, Any]] = {}
+        for locale, value in values.items():
+            for child_value, child_suffix in segment.select(value, suffix):
+                selected.setdefault(child_suffix, {})[locale] = child_value
+        for child_suffix, child_values in selected.items():
+            walk_locales(child, child_values, prefix, child_suffix, out)
+
+
+def iter_localized_fields(data: Any) -> Iterator[LocalizedField]:
+    """Yield every registered localized field of a spec, in registry order."""
+    if not isinstance(data, dict):
+        return
+    format_id = data.get("format_id")
+    if not isinstance(format_id, str) or format_id.strip() not in COMPILED_FIELDS:
+        format_id = DEFAULT_FORMAT_ID
+    # The walk itself appends to a list; nested generators cost more than the lookups.
+    fields: list[LocalizedField] = []
+    walk_spec(COMPILED_FIELDS[format_id.strip()], data, "", fields)
+    yield from fields
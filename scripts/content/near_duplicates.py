@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import hashlib
+import re
+from array import array
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+from localized_fields import iter_localized_fields
+
+DEFAULT_JACCARD_THRESHOLD = 0.8
+DEFAULT_SHINGLE_SIZE = 5
+# Shorter strings (scale labels such as "Strongly agree") repeat across tests by design.
+DEFAULT_MIN_LENGTH = 30
+DEFAULT_NUM_HASHES = 64
+# Minimum probability that a pair exactly at the threshold shares an LSH bucket.
+TARGET_RECALL = 0.99
+HASHES_PER_DIGEST = 16
+
+PUNCTUATION_RE = re.compile(r"[^\w\s]+")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True, order=True)
+class TextRef:
+    spec_path: str
+    key: str
+
+
+@dataclass(frozen=True)
+class NearDuplicateCluster:
+    locale: str
+    members: tuple[TextRef, ...]
+    min_jaccard: float
+
+
+def iter_spec_texts(data: Any) -> Iterator[tuple[str, str, str]]:
+    """Yield (key, locale, text) for every registered localized field, keyed like lint_locales."""
+    for localized in iter_localized_fields(data):
+        for locale, text in localized.values.items():
+            yield localized.key(locale), locale, text
+
+
+def normalize_for_shingles(value: str) -> str:
+    return WHITESPACE_RE.sub(" ", PUNCTUATION_RE.sub(" ", value)).strip().lower()
+
+
+def shingles(text: str, shingle_size: int) -> frozenset[str]:
+    if len(text) <= shingle_size:
+        return frozenset([text])
+    return frozenset(text[start:start + shingle_size] for start in range(len(text) - shingle_size + 1))
+
+
+def shingle_hash_values(shingle: str, num_hashes: int) -> tuple[int, ...]:
+    """num_hashes independent 32-bit hashes of one shingle, stable across runs.
+
+    Each salted BLAKE2b digest supplies HASHES_PER_DIGEST values, so MinHash needs
+    num_hashes / 16 digest calls per distinct shingle instead of num_hashes hash calls.
+    """
+    data = shingle.encode("utf-8")
+    values: list[int] = []
+    for index in range(num_hashes // HASHES_PER_DIGEST):
+        digest = hashlib.blake2b(data, digest_size=64, salt=index.to_bytes(16, "big")).digest()
+        values.extend(array("I", digest))
+    return tuple(values)
+
+
+def minhash_signature(
+    text_shingles: frozenset[str],
+    num_hashes: int,
+    hash_cache: dict[str, tuple[int, ...]]
+) -> tuple[int, ...]:
+    columns = []
+    for shingle in text_shingles:
+        values = hash_cache.get(shingle)
+        if values is None:
+            values = shingle_hash_values(shingle, num_hashes)
+            hash_cache[shingle] = values
+        columns.append(values)
+    return tuple(map(min, zip(*columns)))
+
+
+def choose_band_rows(threshold: float, num_hashes: int) -> int:
+    """Largest rows-per-band whose candidate probability at the threshold meets TARGET_RECALL."""
+    best = 1
+    for rows in range(1, num_hashes + 1):
+        bands = num_hashes // rows
+        if 1 - (1 - threshold ** rows) ** bands >= TARGET_RECALL:
+            best = rows
+    return best
+
+
+def jaccard(a: frozenset[str], b: frozenset[str]) -> float:
+    union = len(a | b)
+    return len(a & b) / union if union else 1.0
+
+
+class UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, item: int) -> int:
+        root = item
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[item] != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def cluster_locale(
+    locale: str,
+    texts: dict[str, list[TextRef]],
+    threshold: float,
+    shingle_size: int,
+    num_hashes: int
+) -> list[NearDuplicateCluster]:
+    """Cluster one locale's distinct normalized texts; identical texts start in one node."""
+    ordered = sorted(texts)
+    text_shingles = [shingles(text, shingle_size) for text in ordered]
+    rows = choose_band_rows(threshold, num_hashes)
+    hash_cache: dict[str, tuple[int, ...]] = {}
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+    for index, shingle_set in enumerate(text_shingles):
+        signature = minhash_signature(shingle_set, num_hashes, hash_cache)
+        for band in range(num_hashes // rows):
+            key = (band, signature[band * rows:(band + 1) * rows])
+            buckets.setdefault(key, []).append(index)
+
+    # LSH only proposes candidates; every merged pair is confirmed with the exact Jaccard.
+    # Jaccard is at most min(|A|, |B|) / max(|A|, |B|), which rejects most pairs for free.
+    union_find = UnionFind(len(ordered))
+    sizes = [len(shingle_set) for shingle_set in text_shingles]
+    scores: dict[tuple[int, int], float] = {}
+    for members in buckets.values():
+        for position, a in enumerate(members):
+            for b in members[position + 1:]:
+                pair = (a, b)
+                if pair in scores:
+                    continue
+                if min(sizes[a], sizes[b]) < threshold * max(sizes[a], sizes[b]):
+                    scores[pair] = 0.0
+                    continue
+                scores[pair] = jaccard(text_shingles[a], text_shingles[b])
+                if scores[pair] >= threshold:
+                    union_find.union(a, b)
+
+    groups: dict[int, list[int]] = {}
+    for index in range(len(ordered)):
+        groups.setdefault(union_find.find(index), []).append(index)
+    min_scores: dict[int, float] = {}
+    for (a, _), score in scores.items():
+        if score >= threshold:
+            root = union_find.find(a)
+            min_scores[root] = min(score, min_scores.get(root, 1.0))
+
+    clusters: list[NearDuplicateCluster] = []
+    for root, members in groups.items():
+        refs = sorted(ref for index in members for ref in texts[ordered[index]])
+        if len({ref.spec_path for ref in refs}) < 2:
+            continue
+        clusters.append(NearDuplicateCluster(locale, tuple(refs), min_scores.get(root, 1.0)))
+    return clusters
+
+
+def find_near_duplicates(
+    specs: Iterable[tuple[str, Any]],
+    threshold: float = DEFAULT_JACCARD_THRESHOLD,
+    shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    min_length: int = DEFAULT_MIN_LENGTH,
+    num_hashes: int = DEFAULT_NUM_HASHES
+) -> list[NearDuplicateCluster]:
+    """Find strings repeated with small edits across different specs, per locale.
+
+    specs yields (relative spec path, parsed spec data). Cost is linear in the number of
+    strings plus the LSH candidate pairs, instead of all pairs.
+    """
+    by_locale: dict[str, dict[str, list[TextRef]]] = {}
+    for spec_path, data in specs:
+        for key, locale, text in iter_spec_texts(data):
+            normalized = normalize_for_shingles(text)
+            if len(normalized) < min_length:
+                continue
+            by_locale.setdefault(locale, {}).setdefault(normalized, []).append(TextRef(spec_path, key))
+
+    clusters: list[NearDuplicateCluster] = []
+    for locale in sorted(by_locale):
+        clusters.extend(cluster_locale(locale, by_locale[locale], threshold, shingle_size, num_hashes))
+    clusters.sort(key=lambda cluster: (cluster.locale, cluster.members))
+    return clusters
+
@@ -7,6 +7,7 @@ import sys
 from pathlib import Path
 
 import validate_catalog
+from atomic_write import write_json
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 TESTS_ROOT = ROOT_DIR / "content" / "tests"
@@ -135,7 +136,7 @@ def create_test_spec(
         "result_bands": build_result_bands(locale_keys)
     }
 
-    spec_path.write_text(json.dumps(spec, indent=2) + "\n", encoding="utf-8")
+    write_json(spec_path, spec)
 
     validation_errors: list[str] = []
     spec_data = json.loads(spec_path.read_text(encoding="utf-8"))
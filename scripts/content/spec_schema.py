@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Union
+
+from diagnostics import diagnostic_error
+
+# A path is the root label (str) or a (parent, segment) pair. Validators receive their
+# parent path and key separately, so leaves build a pair only when they report an error
+# and the dotted string is rendered only at that point.
+PathNode = Union[str, tuple]
+Validator = Callable[[Any, PathNode, Any, dict[str, Any], list[str]], Any]
+CheckFn = Callable[[Any, PathNode, dict[str, Any], list[str]], None]
+
+
+def split_path(node: PathNode) -> tuple[str, tuple[str | int, ...]]:
+    segments: list[str | int] = []
+    while isinstance(node, tuple):
+        node, segment = node
+        segments.append(segment)
+    segments.reverse()
+    return node, tuple(segments)
+
+
+def render_segments(segments: tuple[str | int, ...]) -> str:
+    parts: list[str] = []
+    for segment in segments:
+        if isinstance(segment, int):
+            parts.append(f"[{segment}]")
+        else:
+            parts.append(f".{segment}")
+    return "".join(parts)
+
+
+def render_path(node: PathNode) -> str:
+    root, segments = split_path(node)
+    return root + render_segments(segments)
+
+
+def report(ctx: dict[str, Any], errors: list[str], path: PathNode, message: str, code: str) -> None:
+    root, segments = split_path(path)
+    json_path = render_segments(segments).lstrip(".") or None
+    locate = ctx.get("locate")
+    position = locate(segments) if locate is not None else None
+    if position is not None:
+        line, column = position
+        detail = f"{json_path} {message}" if json_path else message
+        text = f"{root}:{line}:{column}: {detail}"
+    else:
+        line = column = None
+        text = f"{render_path(path)} {message}"
+    errors.append(diagnostic_error(code, message, json_path, root, text, line, column))
+
+
+def join_path(parent: PathNode, key: Any) -> PathNode:
+    return parent if key is None else (parent, key)
+
+
+def is_non_empty_string(value: Any) -> bool:
+    # Equivalent to value.strip() != "" without allocating the stripped copy.
+    return isinstance(value, str) and bool(value) and not value.isspace()
+
+
+class Schema:
+    def compile(self) -> Validator:
+        raise NotImplementedError
+
+    def is_plain_string(self) -> bool:
+        return False
+
+
+@dataclass(frozen=True)
+class String(Schema):
+    pattern: re.Pattern[str] | None = None
+    pattern_message: str = ""
+    choices: tuple[str, ...] = ()
+    choices_message: str = ""
+    capture: str | None = None
+    collect: str | None = None
+
+    def is_plain_string(self) -> bool:
+        return (
+            self.pattern is None
+            and not self.choices
+            and self.capture is None
+            and self.collect is None
+        )
+
+    def compile(self) -> Validator:
+        pattern = self.pattern
+        pattern_message = self.pattern_message
+        choices = frozenset(self.choices)
+        choices_message = self.choices_message
+        capture = self.capture
+        collect = self.collect
+
+        if self.is_plain_string():
+            def validate_plain(
+                value: Any,
+                parent: PathNode,
+                key: Any,
+                ctx: dict[str, Any],
+                errors: list[str]
+            ) -> str | None:
+                if not isinstance(value, str) or not value or value.isspace():
+                    report(ctx, errors, join_path(parent, key), "must be a non-empty string", "non-empty-string")
+                    return None
+                return value.strip()
+
+            return validate_plain
+
+        def validate(
+            value: Any,
+            parent: PathNode,
+            key: Any,
+            ctx: dict[str, Any],
+            errors: list[str]
+        ) -> str | None:
+            if not is_non_empty_string(value):
+                report(ctx, errors, join_path(parent, key), "must be a non-empty string", "non-empty-string")
+                result = None
+            else:
+                result = value.strip()
+                if pattern is not None and not pattern.match(result):
+                    report(ctx, errors, join_path(parent, key), pattern_message, "invalid")
+                if choices and result not in choices:
+                    report(ctx, errors, join_path(parent, key), choices_message, "invalid")
+            if capture is not None:
+                ctx[capture] = result
+            if collect is not None and result:
+                ctx.setdefault(collect, set()).add(result)
+            return result
+
+        return validate
+
+
+@dataclass(frozen=True)
+class Integer(Schema):
+    minimum: int | None = None
+    capture: str | None = None
+
+    def is_plain_integer(self) -> bool:
+        return self.minimum is None and self.capture is None
+
+    def compile(self) -> Validator:
+        minimum = self.minimum
+        capture = self.capture
+
+        def validate(
+            value: Any,
+            parent: PathNode,
+            key: Any,
+            ctx: dict[str, Any],
+            errors: list[str]
+        ) -> int | None:
+            if isinstance(value, bool) or not isinstance(value, int):
+                report(ctx, errors, join_path(parent, key), "must be an integer", "integer")
+                result = None
+            else:
+                result = value
+                if minimum is not None and value < minimum:
+                    report(ctx, errors, join_path(parent, key), f"must be >= {minimum}", "invalid")
+            if capture is not None:
+                ctx[capture] = result
+            return result
+
+        return validate
+
+
+@dataclass(frozen=True)
+class Field:
+    name: str
+    schema: Schema
+    # Runs with the field's validated value when it is truthy.
+    check: CheckFn | None = None
+
+
+@dataclass(frozen=True)
+class Check:
+    # Runs with the enclosing object, between the fields it is declared among.
+    fn: CheckFn
+
+
+@dataclass(frozen=True)
+class Object(Schema):
+    members: tuple[Field | Check, ...] = ()
+
+    def compile(self) -> Validator:
+        # Plain string fields are checked inline; everything else goes through its validator.
+        plain_only = all(
+            isinstance(member, Field) and member.check is None and member.schema.is_plain_string()
+            for member in self.members
+        )
+        if plain_only:
+            names = tuple(member.name for member in self.members if isinstance(member, Field))
+
+            def validate_plain(
+                value: Any,
+                parent: PathNode,
+                key: Any,
+                ctx: dict[str, Any],
+                errors: list[str]
+            ) -> Any:
+                if not isinstance(value, dict):
+                    report(ctx, errors, join_path(parent, key), "must be an object", "object")
+                    return None
+                for name in names:
+                    item = value.get(name)
+                    if not isinstance(item, str) or not item or item.isspace():
+                        report(
+                            ctx,
+                            errors,
+                            (join_path(parent, key), name),
+                            "must be a non-empty string",
+                            "non-empty-string"
+                        )
+                return value
+
+            return validate_plain
+
+        steps: list[tuple[str | None, Any, CheckFn | None]] = []
+        for member in self.members:
+            if isinstance(member, Field):
+                steps.append((member.name, member.schema.compile(), member.check))
+            else:
+                steps.append((None, member.fn, None))
+
+        def validate(
+            value: Any,
+            parent: PathNode,
+            key: Any,
+            ctx: dict[str, Any],
+            errors: list[str]
+        ) -> Any:
+            path = join_path(parent, key)
+            if not isinstance(value, dict):
+                report(ctx, errors, path, "must be an object", "object")
+                return None
+            for name, fn, check in steps:
+                if name is None:
+                    fn(value, path, ctx, errors)
+                    continue
+                result = fn(value.get(name), path, name, ctx, errors)
+                if check is not None and result:
+                    check(result, (path, name), ctx, errors)
+            return value
+
+        return validate
+
+
+@dataclass(frozen=True)
+class Array(Schema):
+    items: Schema
+
+    def compile(self) -> Validator:
+        item_fn = self.items.compile()
+
+        def validate(
+            value: Any,
+            parent: PathNode,
+            key: Any,
+            ctx: dict[str, Any],
+            errors: list[str]
+        ) -> Any:
+            path = join_path(parent, key)
+            if not isinstance(value, list):
+                report(ctx, errors, path, "must be an array", "array")
+                return None
+            for index, item in enumerate(value):
+                item_fn(item, path, index, ctx, errors)
+            return value
+
+        return validate
+
+
+@dataclass(frozen=True)
+class Localized(Schema):
+    """Object keyed by the spec's declared locales (ctx["locale_keys"])."""
+
+    schema: Schema
+
+    def compile(self) -> Validator:
+        if self.schema.is_plain_string():
+            def validate_plain(
+                value: Any,
+                parent: PathNode,
+                key: Any,
+                ctx: dict[str, Any],
+                errors: list[str]
+            ) -> Any:
+                if not isinstance(value, dict):
+                    report(ctx, errors, join_path(parent, key), "must be an object", "object")
+                    return None
+                for locale in ctx["locale_keys"]:
+                    item = value.get(locale)
+                    if not isinstance(item, str) or not item or item.isspace():
+                        report(
+                            ctx,
+                            errors,
+                            (join_path(parent, key), locale),
+                            "must be a non-empty string",
+                            "non-empty-string"
+                        )
+                return value
+
+            return validate_plain
+
+        item_fn = self.schema.compile()
+
+        def validate(
+            value: Any,
+            parent: PathNode,
+            key: Any,
+            ctx: dict[str, Any],
+            errors: list[str]
+        ) -> Any:
+            path = join_path(parent, key)
+            if not isinstance(value, dict):
+                report(ctx, errors, path, "must be an object", "object")
+                return None
+            for locale in ctx["locale_keys"]:
+                item_fn(value.get(locale), path, locale, ctx, errors)
+            return value
+
+        return validate
+
+
+@dataclass(frozen=True)
+class Mapping(Schema):
+    """Object with free-form non-empty string keys."""
+
+    values: Schema
+
+    def compile(self) -> Validator:
+        values = self.values
+        if isinstance(values, Integer) and values.is_plain_integer():
+            def validate_integers(
+                value: Any,
+                parent: PathNode,
+                key: Any,
+                ctx: dict[str, Any],
+                errors: list[str]
+            ) -> Any:
+                path = join_path(parent, key)
+                if not isinstance(value, dict):
+                    report(ctx, errors, path, "must be an object", "object")
+                    return None
+                for item_key, item in value.items():
+                    item_path_key = item_key
+                    if not isinstance(item_key, str) or not item_key or item_key.isspace():
+                        report(ctx, errors, (path, "key"), "must be a non-empty string", "non-empty-string")
+                        item_path_key = "unknown"
+                    if item.__class__ is bool or not isinstance(item, int):
+                        report(ctx, errors, (path, item_path_key.strip()), "must be an integer", "integer")
+                return value
+
+            return validate_integers
+
+        value_fn = values.compile()
+
+        def validate(
+            value: Any,
+            parent: PathNode,
+            key: Any,
+            ctx: dict[str, Any],
+            errors: list[str]
+        ) -> Any:
+            path = join_path(parent, key)
+            if not isinstance(value, dict):
+                report(ctx, errors, path, "must be an object", "object")
+                return None
+            for item_key, item in value.items():
+                if is_non_empty_string(item_key):
+                    value_fn(item, path, item_key.strip(), ctx, errors)
+                else:
+                    report(ctx, errors, (path, "key"), "must be a non-empty string", "non-empty-string")
+                    value_fn(item, path, "unknown", ctx, errors)
+            return value
+
+        return validate
+
+
+@dataclass(frozen=True)
+class LocaleMap(Schema):
+    """The spec's locales block; records accepted locale keys in ctx["locale_keys"]."""
+
+    normalize: Callable[[object], str | None]
+    block: Schema
+    required: tuple[str, ...] = ()
+    require_any: bool = False
+
+    def compile(self) -> Validator:
+        normalize = self.normalize
+        block_fn = self.block.compile()
+        required = self.required
+        require_any = self.require_any
+
+        def validate(
+            value: Any,
+            parent: PathNode,
+            key: Any,
+            ctx: dict[str, Any],
+            errors: list[str]
+        ) -> Any:
+            path = join_path(parent, key)
+            if not isinstance(value, dict):
+                report(ctx, errors, path, "must be an object", "object")
+                return None
+
+            locale_keys: list[str] = []
+            for locale_key in value.keys():
+                canonical = normalize(locale_key)
+                if not canonical:
+                    report(ctx, errors, (path, locale_key), "is not an allowed locale tag", "invalid")
+                    continue
+                if canonical != locale_key:
+                    report(ctx, errors, (path, locale_key), f"must be {canonical}", "invalid")
+                    continue
+                locale_keys.append(locale_key)
+            ctx["locale_keys"] = locale_keys
+
+            if require_any and not locale_keys:
+                report(ctx, errors, path, "must include at least one locale", "missing")
+            for required_locale in required:
+                if required_locale not in locale_keys:
+                    report(ctx, errors, path, f"must include {required_locale}", "missing")
+
+            for locale in locale_keys:
+                block_fn(value.get(locale), path, locale, ctx, errors)
+            return value
+
+        return validate
+
+
+Locator = Callable[[tuple[str | int, ...]], "tuple[int, int] | None"]
+
+
+def compile_schema(
+    schema: Schema
+) -> Callable[[Any, str, list[str], Locator | None], dict[str, Any]]:
+    """Compile a root schema into fn(data, label, errors, locate) returning the captured context.
+
+    When a locator is given, errors are reported as "<label>:<line>:<column>: <json path> ...".
+    """
+
+    root_fn = schema.compile()
+
+    def run(data: Any, label: str, errors: list[str], locate: Locator | None = None) -> dict[str, Any]:
+        ctx: dict[str, Any] = {"locale_keys": [], "locate": locate}
+        root_fn(data, label, None, ctx, errors)
+        return ctx
+
+    return run
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any
+
+LOCALES = ["en", "es", "pt-BR"]
+CSV_LOCALE_SUFFIXES = {"en": "en", "es": "es", "pt-BR": "pt_br"}
+UNIVERSAL_SCALES = ["focus", "flexibility", "energy", "structure"]
+UNIVERSAL_LOCALE_FIELDS = [
+    "title",
+    "short_description",
+    "intro",
+    "instructions",
+    "paywall_hook",
+    "paid_report_structure"
+]
+VALUES_LOCALE_FIELDS = ["title", "short_description", "intro", "paywall_headline", "report_title"]
+OPTIONS_PER_QUESTION = 3
+
+VOCABULARY = {
+    "en": (
+        "you prefer to plan work focus team time goals task day clear choose start finish "
+        "change steady quick careful habit energy rhythm balance calm busy learn share "
+        "decide trust notice keep build move rest routine project idea people small big"
+    ).split(),
+    "es": (
+        "prefieres planear trabajo enfoque equipo tiempo metas tarea dia claro elegir empezar "
+        "terminar cambio constante rapido cuidadoso habito energia ritmo equilibrio calma "
+        "ocupado aprender compartir decidir confiar notar mantener construir mover descanso"
+    ).split(),
+    "pt-BR": (
+        "voce prefere planejar trabalho foco equipe tempo metas tarefa dia claro escolher "
+        "comecar terminar mudanca constante rapido cuidadoso habito energia ritmo equilibrio "
+        "calma ocupado aprender compartilhar decidir confiar notar manter construir mover"
+    ).split()
+}
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic content catalog for benchmarking the content scripts."
+    )
+    parser.add_argument("--out", required=True, type=Path, help="Output directory")
+    parser.add_argument("--specs", type=int, default=100, help="Number of specs (default: 100)")
+    parser.add_argument("--tenants", type=int, default=10, help="Number of tenants (default: 10)")
+    parser.add_argument("--questions", type=int, default=20, help="Questions per spec (default: 20)")
+    parser.add_argument(
+        "--tests-per-tenant",
+        type=int,
+        default=20,
+        help="Catalog entries per tenant, capped at --specs (default: 20)"
+    )
+    parser.add_argument(
+        "--untranslated-rate",
+        type=float,
+        default=0.01,
+        help="Share of localized strings left as the English text (default: 0.01)"
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1)")
+    args = parser.parse_args(argv)
+    for name in ["specs", "tenants", "questions", "tests_per_tenant"]:
+        if getattr(args, name) < 1:
+            parser.error(f"--{name.replace('_', '-')} must be >= 1")
+    if not 0 <= args.untranslated_rate <= 1:
+        parser.error("--untranslated-rate must be between 0 and 1")
+    return args
+
+
+class TextGenerator:
+    def __init__(self, rng: random.Random, untranslated_rate: float):
+        self.rng = rng
+        self.untranslated_rate = untranslated_rate
+
+    def sentence(self, locale: str, words: int) -> str:
+        picked = self.rng.choices(VOCABULARY[locale], k=words)
+        return " ".join(picked).capitalize() + "."
+
+    def localized(self, words: int) -> dict[str, str]:
+        en_text = self.sentence("en", words)
+        localized = {"en": en_text}
+        for locale in LOCALES[1:]:
+            if self.rng.random() < self.untranslated_rate:
+                localized[locale] = en_text
+            else:
+                localized[locale] = self.sentence(locale, words)
+        return localized
+
+
+def synth_test_id(index: int) -> str:
+    return f"test-synth-{index:05d}"
+
+
+def spec_format(index: int) -> str:
+    return "values_compass_v1" if index % 2 == 0 else "universal_human_v1"
+
+
+def build_locale_blocks(text: TextGenerator, fields: list[str]) -> dict[str, dict[str, str]]:
+    blocks: dict[str, dict[str, str]] = {locale: {} for locale in LOCALES}
+    for field in fields:
+        for locale, value in text.localized(8).items():
+            blocks[locale][field] = value
+    return blocks
+
+
+def build_values_spec(index: int, questions: int, text: TextGenerator) -> dict[str, Any]:
+    test_id = synth_test_id(index)
+    spec_questions: list[dict[str, Any]] = []
+    option_weights: dict[str, dict[str, int]] = {}
+    for number in range(1, questions + 1):
+        question_id = f"q{number}"
+        options = []
+        for option_index in range(OPTIONS_PER_QUESTION):
+            option_id = f"{question_id}-{chr(ord('a') + option_index)}"
+            options.append({"id": option_id, "label": text.localized(4)})
+            option_weights[option_id] = {"score": OPTIONS_PER_QUESTION - 1 - option_index}
+        spec_questions.append(
+            {
+                "id": question_id,
+                "type": "single_choice",
+                "prompt": text.localized(10),
+                "options": options
+            }
+        )
+
+    max_score = questions * (OPTIONS_PER_QUESTION - 1)
+    band_count = min(3, max_score + 1)
+    bounds = [round(max_score * step / band_count) for step in range(band_count + 1)]
+    result_bands = []
+    for band_index in range(band_count):
+        copy: dict[str, dict[str, Any]] = {locale: {} for locale in LOCALES}
+        for field, words in [("headline", 3), ("summary", 12)]:
+            for locale, value in text.localized(words).items():
+                copy[locale][field] = value
+        bullets = [text.localized(6) for _ in range(3)]
+        for locale in LOCALES:
+            copy[locale]["bullets"] = [bullet[locale] for bullet in bullets]
+        result_bands.append(
+            {
+                "band_id": f"band-{band_index + 1}",
+                "min_score_inclusive": bounds[band_index] + (1 if band_index else 0),
+                "max_score_inclusive": bounds[band_index + 1],
+                "copy": copy
+            }
+        )
+
+    return {
+        "test_id": test_id,
+        "slug": test_id[len("test-"):],
+        "version": 1,
+        "category": "synthetic",
+        "locales": build_locale_blocks(text, VALUES_LOCALE_FIELDS),
+        "questions": spec_questions,
+        "scoring": {"scales": ["score"], "option_weights": option_weights},
+        "result_bands": result_bands
+    }
+
+
+def build_universal_spec(index: int, questions: int, text: TextGenerator) -> dict[str, Any]:
+    test_id = synth_test_id(index)
+    scales = UNIVERSAL_SCALES[:2 + index % 3]
+    width = max(2, len(str(questions)))
+    return {
+        "format_id": "universal_human_v1",
+        "test_id": test_id,
+        "slug": test_id[len("test-"):],
+        "version": 1,
+        "category": "synthetic",
+        "question_count": questions,
+        "locales": build_locale_blocks(text, UNIVERSAL_LOCALE_FIELDS),
+        "scales": scales,
+        "questions": [
+            {
+                "question_id": f"q{number:0{width}d}",
+                "scale_id": scales[(number - 1) % len(scales)],
+                "prompt": text.localized(10)
+            }
+            for number in range(1, questions + 1)
+        ],
+        "scoring": {"model": "multi_scale", "missing_policy": "required_all"},
+        "price_eur_single": 0,
+        "pack_options": []
+    }
+
+
+def render_universal_source(spec: dict[str, Any], locale: str) -> str:
+    """Render one locale of a universal spec in the universal_human_v1 source layout."""
+    copy = spec["locales"][locale]
+    lines = [
+        "---",
+        "format_id: universal_human_v1",
+        f"test_id: {spec['test_id']}",
+        f"slug: {spec['slug']}",
+        f"version: {spec['version']}",
+        f"category: {spec['category']}",
+        "primary_locale: en",
+        f"locales: [{', '.join(LOCALES)}]",
+        "question_type: likert_5",
+        "scoring_model: multi_scale",
+        f"scales: [{', '.join(spec['scales'])}]",
+        "missing_policy: required_all",
+        f"question_count: {spec['question_count']}",
+        "---",
+        ""
+    ]
+    for field, heading in [
+        ("title", "Title"),
+        ("short_description", "Short description"),
+        ("intro", "Intro"),
+        ("instructions", "Instructions"),
+        ("paywall_hook", "Paywall hook"),
+        ("paid_report_structure", "Paid report structure")
+    ]:
+        lines.extend([f"## {heading}", copy[field], ""])
+    lines.append("## Questions")
+    for question in spec["questions"]:
+        lines.extend(
+            [
+                f"QID: {question['question_id']}",
+                f"Scale: {question['scale_id']}",
+                f"Prompt: {question['prompt'][locale]}",
+                ""
+            ]
+        )
+    return "\n".join(lines)
+
+
+def write_questions_csv(path: Path, questions: int, text: TextGenerator) -> None:
+    fieldnames = ["question_id", "option_id"]
+    fieldnames += [f"prompt_{CSV_LOCALE_SUFFIXES[locale]}" for locale in LOCALES]
+    fieldnames += [f"option_label_{CSV_LOCALE_SUFFIXES[locale]}" for locale in LOCALES]
+    fieldnames.append("weight")
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=fieldnames)
+        writer.writeheader()
+        for number in range(1, questions + 1):
+            prompt = text.localized(10)
+            for option_index in range(OPTIONS_PER_QUESTION):
+                label = text.localized(4)
+                row = {
+                    "question_id": f"q{number}",
+                    "option_id": f"q{number}-{chr(ord('a') + option_index)}",
+                    "weight": str(OPTIONS_PER_QUESTION - 1 - option_index)
+                }
+                for locale in LOCALES:
+                    suffix = CSV_LOCALE_SUFFIXES[locale]
+                    row[f"prompt_{suffix}"] = prompt[locale]
+                    row[f"option_label_{suffix}"] = label[locale]
+                writer.writerow(row)
+
+
+def write_json(path: Path, data: Any) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def generate_catalog(
+    out_dir: Path,
+    specs: int,
+    tenants: int,
+    questions: int,
+    tests_per_tenant: int = 20,
+    untranslated_rate: float = 0.01,
+    seed: int = 1
+) -> dict[str, Any]:
+    """Write a synthetic catalog under out_dir and return a summary of what was generated.
+
+    Layout mirrors the repository: content/tests/<test_id>/spec.json,
+    content/sources/<test_id>/source.<locale>.md for universal specs, and
+    config/tenants.json + config/catalog.json. A questions.csv sized like one spec is
+    written next to them for the CSV importer.
+    """
+    rng = random.Random(seed)
+    text = TextGenerator(rng, untranslated_rate)
+    tests_root = out_dir / "content" / "tests"
+    sources_root = out_dir / "content" / "sources"
+
+    test_ids: list[str] = []
+    counts = {"values_compass_v1": 0, "universal_human_v1": 0}
+    for index in range(specs):
+        format_id = spec_format(index)
+        if format_id == "values_compass_v1":
+            spec = build_values_spec(index, questions, text)
+        else:
+            spec = build_universal_spec(index, questions, text)
+            for locale in LOCALES:
+                source_path = sources_root / spec["test_id"] / f"source.{locale}.md"
+                source_path.parent.mkdir(parents=True, exist_ok=True)
+                source_path.write_text(render_universal_source(spec, locale), encoding="utf-8")
+        write_json(tests_root / spec["test_id"] / "spec.json", spec)
+        test_ids.append(spec["test_id"])
+        counts[format_id] += 1
+
+    tenant_entries = []
+    catalog: dict[str, list[str]] = {}
+    per_tenant = min(tests_per_tenant, specs)
+    for index in range(tenants):
+        tenant_id = f"tenant-synth-{index:04d}"
+        tenant_entries.append(
+            {
+                "tenant_id": tenant_id,
+                "domains": [f"synth-{index:04d}.example.com"],
+                "default_locale": rng.choice(LOCALES)
+            }
+        )
+        catalog[tenant_id] = rng.sample(test_ids, per_tenant)
+    write_json(out_dir / "config" / "tenants.json", {"tenants": tenant_entries})
+    write_json(out_dir / "config" / "catalog.json", {"tenants": catalog})
+
+    write_questions_csv(out_dir / "questions.csv", questions, text)
+
+    return {
+        "specs": specs,
+        "tenants": tenants,
+        "questions": questions,
+        "formats": counts,
+        "tests_root": str(tests_root),
+        "sources_root": str(sources_root)
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    summary = generate_catalog(
+        args.out,
+        specs=args.specs,
+        tenants=args.tenants,
+        questions=args.questions,
+        tests_per_tenant=args.tests_per_tenant,
+        untranslated_rate=args.untranslated_rate,
+        seed=args.seed
+    )
+    print(
+        f"Generated {summary['specs']} specs "
+        f"({summary['formats']['values_compass_v1']} values_compass_v1, "
+        f"{summary['formats']['universal_human_v1']} universal_human_v1), "
+        f"{summary['tenants']} tenants, {summary['questions']} questions per spec in {args.out}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
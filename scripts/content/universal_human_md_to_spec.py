@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 import validate_catalog
+from atomic_write import write_json
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 ALLOWED_LOCALES = ["en", "es", "pt-BR"]
@@ -436,11 +436,10 @@ def merge_questions(
     return questions
 
 
-def main() -> int:
-    args = parse_args()
+def convert(source_dir: Path) -> tuple[dict[str, object] | None, list[str]]:
+    """Build a universal_human_v1 spec from source_dir/source.<locale>.md; the spec is None on errors."""
     errors: list[str] = []
 
-    source_dir = Path(args.source_dir)
     sources = {
         "en": source_dir / "source.en.md",
         "es": source_dir / "source.es.md",
@@ -460,9 +459,7 @@ def main() -> int:
         locale_questions[locale] = questions
 
     if errors:
-        for message in errors:
-            print(f"ERROR: {message}", file=sys.stderr)
-        return 1
+        return None, errors
 
     if set(meta_by_locale.keys()) != set(ALLOWED_LOCALES):
         errors.append("missing metadata for one or more locales")
@@ -487,9 +484,7 @@ def main() -> int:
                     errors.append(f"{locale} metadata mismatch for {key}")
 
     if errors:
-        for message in errors:
-            print(f"ERROR: {message}", file=sys.stderr)
-        return 1
+        return None, errors
 
     reference_meta = meta_by_locale["en"]
     locales = reference_meta["locales"]
@@ -506,9 +501,7 @@ def main() -> int:
     )
 
     if errors:
-        for message in errors:
-            print(f"ERROR: {message}", file=sys.stderr)
-        return 1
+        return None, errors
 
     spec = {
         "format_id": reference_meta["format_id"],
@@ -528,9 +521,19 @@ def main() -> int:
         "pack_options": []
     }
 
-    output_path = Path(args.out)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(spec, indent=2) + "\n", encoding="utf-8")
+    return spec, errors
+
+
+def main() -> int:
+    args = parse_args()
+    spec, errors = convert(Path(args.source_dir))
+
+    if spec is None:
+        for message in errors:
+            print(f"ERROR: {message}", file=sys.stderr)
+        return 1
+
+    write_json(Path(args.out), spec)
     return 0
 
 
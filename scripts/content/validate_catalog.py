@@ -1,16 +1,61 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+from atomic_write import write_json
+from diagnostics import (
+    DiagnosticLimitReached,
+    DiagnosticSink,
+    add_diagnostic_arguments,
+    check_diagnostic_arguments,
+    check_watch_arguments,
+    diagnostic_error,
+    error_from_json,
+    error_to_json
+)
+from git_changes import load_change_set
+from json_source import JsonSource, format_decode_error, load_json_source
+from spec_schema import (
+    Array,
+    Check,
+    Field,
+    Integer,
+    Localized,
+    LocaleMap,
+    Mapping,
+    Object,
+    PathNode,
+    Schema,
+    String,
+    compile_schema,
+    is_non_empty_string,
+    report
+)
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 TENANTS_PATH = ROOT_DIR / "config" / "tenants.json"
 CATALOG_PATH = ROOT_DIR / "config" / "catalog.json"
 TESTS_ROOT = ROOT_DIR / "content" / "tests"
+DEFAULT_CACHE_PATH = ROOT_DIR / ".cache" / "validate_catalog.json"
+
+CATALOG_INDEX_VERSION = 1
+
+# Bump when validation rules change in a way the source fingerprint cannot see.
+VALIDATOR_VERSION = 1
+CACHE_SOURCE_FILES = [
+    Path(__file__).resolve(),
+    Path(__file__).resolve().with_name("spec_schema.py"),
+    Path(__file__).resolve().with_name("json_source.py")
+]
 
 ALLOWED_LOCALES = {
     "en": "en",
@@ -23,18 +68,37 @@ TEST_ID_PATTERN = re.compile(r"^test-[a-z0-9]+(?:-[a-z0-9]+)*$")
 SLUG_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
 
 
-def load_json(path: Path, label: str, errors: list[str]) -> Any:
-    if not path.exists():
-        errors.append(f"{label} not found: {path}")
+def load_json_file(
+    path: Path,
+    label: str,
+    errors: list[str],
+    raw: bytes | None = None
+) -> JsonSource | None:
+    if raw is None and not path.exists():
+        errors.append(diagnostic_error("not-found", f"not found: {path}", file=label))
         return None
 
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return load_json_source(path, raw)
     except json.JSONDecodeError as exc:
-        errors.append(f"{label} is not valid JSON: {exc}")
+        errors.append(
+            diagnostic_error(
+                "invalid-json",
+                f"is not valid JSON: {exc}",
+                file=label,
+                text=format_decode_error(label, exc),
+                line=exc.lineno,
+                column=exc.colno
+            )
+        )
         return None
 
 
+def load_json(path: Path, label: str, errors: list[str]) -> Any:
+    source = load_json_file(path, label, errors)
+    return source.data if source is not None else None
+
+
 def normalize_locale_tag(value: object) -> str | None:
     if not isinstance(value, str):
         return None
@@ -44,344 +108,593 @@ def normalize_locale_tag(value: object) -> str | None:
     return ALLOWED_LOCALES.get(trimmed.lower())
 
 
-def validate_string(value: object, path: str, errors: list[str]) -> str | None:
+def validate_string(
+    value: object,
+    path: str,
+    errors: list[str],
+    file: str | None = None,
+    text: str | None = None
+) -> str | None:
     if not isinstance(value, str) or not value.strip():
-        errors.append(f"{path} must be a non-empty string")
+        errors.append(diagnostic_error("non-empty-string", "must be a non-empty string", path, file, text))
         return None
     return value.strip()
 
 
-def validate_integer(value: object, path: str, errors: list[str]) -> int | None:
-    if isinstance(value, bool) or not isinstance(value, int):
-        errors.append(f"{path} must be an integer")
-        return None
-    return value
+class SpecInfo:
+    def __init__(self, test_id: str | None, slug: str | None, locales: list[str]):
+        self.test_id = test_id
+        self.slug = slug
+        self.locales = locales
+        # SHA-256 of the spec.json bytes, filled in by collect_specs.
+        self.checksum: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"test_id": self.test_id, "slug": self.slug, "locales": list(self.locales)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SpecInfo":
+        return cls(data.get("test_id"), data.get("slug"), list(data.get("locales") or []))
+
+
+def stat_key(path: Path) -> list[int]:
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def validator_fingerprint() -> str:
+    digest = hashlib.sha256(f"validator-v{VALIDATOR_VERSION}".encode("utf-8"))
+    for source_path in CACHE_SOURCE_FILES:
+        digest.update(source_path.read_bytes())
+    return digest.hexdigest()
+
+
+class ValidationCache:
+    """Per-spec validation results keyed by spec path and content hash.
+
+    Entries also record the file's (mtime_ns, size), so passes that need no checksum can
+    reuse them without reading the file.
+    """
+
+    def __init__(self, path: Path, fingerprint: str, entries: dict[str, dict[str, Any]] | None = None):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries: dict[str, dict[str, Any]] = entries or {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path) -> "ValidationCache":
+        fingerprint = validator_fingerprint()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path, fingerprint)
+        if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+            return cls(path, fingerprint)
+        entries = data.get("entries")
+        return cls(path, fingerprint, entries if isinstance(entries, dict) else None)
+
+    def get(
+        self,
+        spec_path: Path,
+        digest: str,
+        stat: list[int] | None = None
+    ) -> tuple[SpecInfo | None, list[str]] | None:
+        entry = self.entries.get(str(spec_path))
+        if not isinstance(entry, dict) or entry.get("sha256") != digest:
+            return None
+        if stat is not None and entry.get("stat") != stat:
+            # Same content with a new mtime (checkout, touch): refresh it for get_unchanged.
+            entry["stat"] = stat
+            self.dirty = True
+        spec = entry.get("spec")
+        spec_info = SpecInfo.from_dict(spec) if isinstance(spec, dict) else None
+        return spec_info, [error_from_json(error) for error in entry.get("errors") or []]
+
+    def get_unchanged(self, spec_path: Path, stat: list[int]) -> tuple[SpecInfo | None, list[str]] | None:
+        """Like get(), but matched on stat_key() instead of the content hash."""
+        entry = self.entries.get(str(spec_path))
+        if not isinstance(entry, dict) or entry.get("stat") != stat:
+            return None
+        return self.get(spec_path, entry.get("sha256"))
+
+    def put(
+        self,
+        spec_path: Path,
+        digest: str,
+        spec_info: SpecInfo | None,
+        errors: list[str],
+        stat: list[int] | None = None
+    ) -> None:
+        entry: dict[str, Any] = {
+            "sha256": digest,
+            "spec": spec_info.to_dict() if spec_info is not None else None,
+            # Structured errors keep their code and location across cache hits.
+            "errors": [error_to_json(error) for error in errors]
+        }
+        if stat is not None:
+            entry["stat"] = stat
+        self.entries[str(spec_path)] = entry
+        self.dirty = True
+
+    def retain(self, spec_paths: Iterable[Path]) -> None:
+        keep = {str(spec_path) for spec_path in spec_paths}
+        stale = [key for key in self.entries if key not in keep]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        write_json(
+            self.path,
+            {"fingerprint": self.fingerprint, "entries": self.entries},
+            indent=None,
+            sort_keys=True
+        )
+        self.dirty = False
+
+
+def check_slug_alignment(
+    spec: dict[str, Any],
+    path: PathNode,
+    ctx: dict[str, Any],
+    errors: list[str]
+) -> None:
+    test_id = ctx.get("test_id")
+    slug = ctx.get("slug")
+    if test_id and slug and test_id != f"test-{slug}":
+        report(ctx, errors, (path, "test_id"), "must align with slug", "slug-alignment")
 
 
-def validate_localized_map(
-    value: object,
-    locale_keys: list[str],
-    path: str,
+def prepare_universal_questions(
+    spec: dict[str, Any],
+    path: PathNode,
+    ctx: dict[str, Any],
     errors: list[str]
 ) -> None:
-    if not isinstance(value, dict):
-        errors.append(f"{path} must be an object")
+    questions = spec.get("questions")
+    if not isinstance(questions, list):
         return
 
-    for locale in locale_keys:
-        validate_string(value.get(locale), f"{path}.{locale}", errors)
+    question_count = ctx.get("question_count")
+    if question_count is not None and len(questions) != question_count:
+        report(ctx, errors, (path, "question_count"), "must match number of questions", "invalid")
 
+    expected_count = question_count if question_count is not None else len(questions)
+    width = max(2, len(str(expected_count))) if expected_count else 2
+    expected_ids = [f"q{index:0{width}d}" for index in range(1, expected_count + 1)]
+    ctx["expected_question_ids"] = expected_ids
+    ctx["expected_question_id_set"] = set(expected_ids)
+    ctx["seen_question_ids"] = set()
 
-def validate_locale_block(
-    value: object,
-    path: str,
+
+def check_universal_question_id(
+    question_id: str,
+    path: PathNode,
+    ctx: dict[str, Any],
     errors: list[str]
 ) -> None:
-    if not isinstance(value, dict):
-        errors.append(f"{path} must be an object")
-        return
-
-    for field in [
-        "title",
-        "short_description",
-        "intro",
-        "paywall_headline",
-        "report_title"
-    ]:
-        validate_string(value.get(field), f"{path}.{field}", errors)
+    seen: set[str] = ctx["seen_question_ids"]
+    if question_id in seen:
+        report(ctx, errors, path, f"{question_id} is duplicated", "duplicate")
+    seen.add(question_id)
+    if question_id not in ctx["expected_question_id_set"]:
+        report(ctx, errors, path, "must match q01..qNN", "invalid")
+
+
+def check_universal_scale_id(
+    scale_id: str,
+    path: PathNode,
+    ctx: dict[str, Any],
+    errors: list[str]
+) -> None:
+    if scale_id not in ctx.get("scale_ids", ()):
+        report(ctx, errors, path, "must be listed in scales", "unknown-reference")
 
 
-def validate_result_copy(
-    value: object,
-    locale_keys: list[str],
-    path: str,
+def check_universal_missing_questions(
+    spec: dict[str, Any],
+    path: PathNode,
+    ctx: dict[str, Any],
     errors: list[str]
 ) -> None:
-    if not isinstance(value, dict):
-        errors.append(f"{path} must be an object")
+    expected_ids = ctx.get("expected_question_ids")
+    if not expected_ids:
         return
+    seen: set[str] = ctx["seen_question_ids"]
+    missing = [qid for qid in expected_ids if qid not in seen]
+    if missing:
+        report(ctx, errors, (path, "questions"), f"missing ids: {', '.join(missing)}", "missing")
 
-    for locale in locale_keys:
-        locale_path = f"{path}.{locale}"
-        localized = value.get(locale)
-        if not isinstance(localized, dict):
-            errors.append(f"{locale_path} must be an object")
-            continue
-
-        validate_string(localized.get("headline"), f"{locale_path}.headline", errors)
-        validate_string(localized.get("summary"), f"{locale_path}.summary", errors)
-        bullets = localized.get("bullets")
-        if not isinstance(bullets, list):
-            errors.append(f"{locale_path}.bullets must be an array")
-        else:
-            for index, bullet in enumerate(bullets):
-                validate_string(bullet, f"{locale_path}.bullets[{index}]", errors)
 
+def start_question_options(
+    question: dict[str, Any],
+    path: PathNode,
+    ctx: dict[str, Any],
+    errors: list[str]
+) -> None:
+    option_ids: list[str] = []
+    ctx.setdefault("question_option_ids", []).append((path, option_ids))
+    ctx["current_option_ids"] = option_ids
 
-class SpecInfo:
-    def __init__(self, test_id: str | None, slug: str | None, locales: list[str]):
-        self.test_id = test_id
-        self.slug = slug
-        self.locales = locales
 
+def check_question_id(
+    question_id: str,
+    path: PathNode,
+    ctx: dict[str, Any],
+    errors: list[str]
+) -> None:
+    seen: set[str] = ctx.setdefault("question_id_set", set())
+    if question_id in seen:
+        report(ctx, errors, path, f"{question_id} is duplicated", "duplicate")
+    seen.add(question_id)
 
-def validate_spec(path: Path, data: object, errors: list[str]) -> SpecInfo:
-    prefix = str(path)
-    if not isinstance(data, dict):
-        errors.append(f"{prefix} must be a JSON object")
-        return SpecInfo(None, None, [])
 
-    format_id = data.get("format_id")
-    if format_id is None:
-        format_id = "values_compass_v1"
-    if not isinstance(format_id, str) or not format_id.strip():
-        errors.append(f"{prefix}.format_id must be a non-empty string")
-        return SpecInfo(None, None, [])
-    format_id = format_id.strip()
+def check_option_id(
+    option_id: str,
+    path: PathNode,
+    ctx: dict[str, Any],
+    errors: list[str]
+) -> None:
+    # option_weights is keyed by option id alone, so ids must be unique across the spec.
+    option_paths: dict[str, PathNode] = ctx.setdefault("option_paths", {})
+    if option_id in option_paths:
+        report(ctx, errors, path, f"{option_id} is duplicated", "duplicate")
+        return
+    option_paths[option_id] = path
+    ctx["current_option_ids"].append(option_id)
 
-    if format_id == "universal_human_v1":
-        return validate_universal_spec(path, data, errors)
-    if format_id != "values_compass_v1":
-        errors.append(f"{prefix}.format_id must be values_compass_v1 or universal_human_v1")
-        return SpecInfo(None, None, [])
 
-    test_id = validate_string(data.get("test_id"), f"{prefix}.test_id", errors)
-    if test_id and not TEST_ID_PATTERN.match(test_id):
-        errors.append(f"{prefix}.test_id must match test-<slug>")
+def check_option_weights(
+    spec: dict[str, Any],
+    path: PathNode,
+    ctx: dict[str, Any],
+    errors: list[str]
+) -> dict[str, int] | None:
+    """Cross-reference option_weights with the options and scales; returns per-option totals.
 
-    slug = validate_string(data.get("slug"), f"{prefix}.slug", errors)
-    if slug and not SLUG_PATTERN.match(slug):
-        errors.append(f"{prefix}.slug must be url-safe")
-    if test_id and slug and test_id != f"test-{slug}":
-        errors.append(f"{prefix}.test_id must align with slug")
+    Totals are None when some option cannot be scored, since the score range is then unknown.
+    """
+    scoring = spec.get("scoring")
+    if not isinstance(scoring, dict):
+        return None
+    weights_map = scoring.get("option_weights")
+    if not isinstance(weights_map, dict):
+        return None
 
-    version = validate_integer(data.get("version"), f"{prefix}.version", errors)
-    if version is not None and version < 1:
-        errors.append(f"{prefix}.version must be >= 1")
-    validate_string(data.get("category"), f"{prefix}.category", errors)
+    option_paths: dict[str, PathNode] = ctx.get("option_paths", {})
+    declared_scales: set[str] = ctx.get("scoring_scales", set())
+    weights_path = ((path, "scoring"), "option_weights")
+    weighted_ids: set[str] = set()
+    totals: dict[str, int] = {}
+    complete = True
 
-    locales_value = data.get("locales")
-    locale_keys: list[str] = []
-    if not isinstance(locales_value, dict):
-        errors.append(f"{prefix}.locales must be an object")
-    else:
-        for key in locales_value.keys():
-            canonical = normalize_locale_tag(key)
-            if not canonical:
-                errors.append(f"{prefix}.locales.{key} is not an allowed locale tag")
-                continue
-            if canonical != key:
-                errors.append(f"{prefix}.locales.{key} must be {canonical}")
+    for raw_option_id, weights in weights_map.items():
+        if not is_non_empty_string(raw_option_id):
+            continue
+        option_id = raw_option_id.strip()
+        weighted_ids.add(option_id)
+        entry_path = (weights_path, option_id)
+        if option_id not in option_paths:
+            report(ctx, errors, entry_path, "does not match any question option", "unknown-reference")
+        if not isinstance(weights, dict):
+            complete = False
+            continue
+        total = 0
+        for scale_id, weight in weights.items():
+            if is_non_empty_string(scale_id) and scale_id.strip() not in declared_scales:
+                report(
+                    ctx,
+                    errors,
+                    (entry_path, scale_id.strip()),
+                    "must be listed in scoring.scales",
+                    "unknown-reference"
+                )
+                complete = False
+            if isinstance(weight, bool) or not isinstance(weight, int):
+                complete = False
                 continue
-            locale_keys.append(key)
+            total += weight
+        totals[option_id] = total
 
-        if not locale_keys:
-            errors.append(f"{prefix}.locales must include at least one locale")
+    for option_id, option_path in option_paths.items():
+        if option_id not in weighted_ids:
+            report(ctx, errors, option_path, "has no scoring.option_weights entry", "unknown-reference")
+            complete = False
 
-        for locale in locale_keys:
-            validate_locale_block(locales_value.get(locale), f"{prefix}.locales.{locale}", errors)
+    return totals if complete else None
 
-    questions = data.get("questions")
-    if not isinstance(questions, list):
-        errors.append(f"{prefix}.questions must be an array")
-    else:
-        for index, question in enumerate(questions):
-            question_path = f"{prefix}.questions[{index}]"
-            if not isinstance(question, dict):
-                errors.append(f"{question_path} must be an object")
-                continue
 
-            validate_string(question.get("id"), f"{question_path}.id", errors)
-            question_type = validate_string(question.get("type"), f"{question_path}.type", errors)
-            if question_type and question_type != "single_choice":
-                errors.append(f"{question_path}.type must be single_choice")
+def compute_score_range(
+    option_totals: dict[str, int],
+    ctx: dict[str, Any],
+    errors: list[str]
+) -> tuple[int, int] | None:
+    """Achievable total score range: per question, the lowest and highest option total."""
+    low = 0
+    high = 0
+    complete = True
+    for question_path, option_ids in ctx.get("question_option_ids", []):
+        if not option_ids:
+            report(ctx, errors, (question_path, "options"), "must include at least one option", "missing")
+            complete = False
+            continue
+        question_totals = [option_totals[option_id] for option_id in option_ids]
+        low += min(question_totals)
+        high += max(question_totals)
+    return (low, high) if complete else None
 
-            validate_localized_map(question.get("prompt"), locale_keys, f"{question_path}.prompt", errors)
 
-            options = question.get("options")
-            if not isinstance(options, list):
-                errors.append(f"{question_path}.options must be an array")
-            else:
-                for option_index, option in enumerate(options):
-                    option_path = f"{question_path}.options[{option_index}]"
-                    if not isinstance(option, dict):
-                        errors.append(f"{option_path} must be an object")
-                        continue
+def format_score_span(start: int, end: int) -> str:
+    return f"score {start}" if start == end else f"scores {start}..{end}"
 
-                    validate_string(option.get("id"), f"{option_path}.id", errors)
-                    validate_localized_map(option.get("label"), locale_keys, f"{option_path}.label", errors)
 
-    scoring = data.get("scoring")
-    if not isinstance(scoring, dict):
-        errors.append(f"{prefix}.scoring must be an object")
-    else:
-        scales = scoring.get("scales")
-        if not isinstance(scales, list):
-            errors.append(f"{prefix}.scoring.scales must be an array")
-        else:
-            for index, scale in enumerate(scales):
-                validate_string(scale, f"{prefix}.scoring.scales[{index}]", errors)
-
-        option_weights = scoring.get("option_weights")
-        if not isinstance(option_weights, dict):
-            errors.append(f"{prefix}.scoring.option_weights must be an object")
-        else:
-            for option_id, weights in option_weights.items():
-                option_key = validate_string(option_id, f"{prefix}.scoring.option_weights.key", errors)
-                weight_path = f"{prefix}.scoring.option_weights.{option_key or 'unknown'}"
-                if not isinstance(weights, dict):
-                    errors.append(f"{weight_path} must be an object")
-                    continue
-
-                for scale_id, weight in weights.items():
-                    scale_key = validate_string(scale_id, f"{weight_path}.key", errors)
-                    numeric_path = f"{weight_path}.{scale_key or 'unknown'}"
-                    validate_integer(weight, numeric_path, errors)
-
-    result_bands = data.get("result_bands")
+def check_band_coverage(
+    spec: dict[str, Any],
+    path: PathNode,
+    ctx: dict[str, Any],
+    errors: list[str],
+    score_range: tuple[int, int] | None
+) -> None:
+    result_bands = spec.get("result_bands")
     if not isinstance(result_bands, list):
-        errors.append(f"{prefix}.result_bands must be an array")
-    else:
-        for index, band in enumerate(result_bands):
-            band_path = f"{prefix}.result_bands[{index}]"
-            if not isinstance(band, dict):
-                errors.append(f"{band_path} must be an object")
-                continue
-
-            validate_string(band.get("band_id"), f"{band_path}.band_id", errors)
-            validate_integer(band.get("min_score_inclusive"), f"{band_path}.min_score_inclusive", errors)
-            validate_integer(band.get("max_score_inclusive"), f"{band_path}.max_score_inclusive", errors)
-            validate_result_copy(band.get("copy"), locale_keys, f"{band_path}.copy", errors)
-
-    return SpecInfo(test_id, slug, locale_keys)
-
-
-def validate_universal_spec(path: Path, data: dict[str, Any], errors: list[str]) -> SpecInfo:
-    prefix = str(path)
-
-    test_id = validate_string(data.get("test_id"), f"{prefix}.test_id", errors)
-    if test_id and not TEST_ID_PATTERN.match(test_id):
-        errors.append(f"{prefix}.test_id must match test-<slug>")
+        return
+    bands_path = (path, "result_bands")
 
-    slug = validate_string(data.get("slug"), f"{prefix}.slug", errors)
-    if slug and not SLUG_PATTERN.match(slug):
-        errors.append(f"{prefix}.slug must be url-safe")
-    if test_id and slug and test_id != f"test-{slug}":
-        errors.append(f"{prefix}.test_id must align with slug")
+    intervals: list[tuple[int, int, int]] = []
+    complete = True
+    for index, band in enumerate(result_bands):
+        if not isinstance(band, dict):
+            complete = False
+            continue
+        minimum = band.get("min_score_inclusive")
+        maximum = band.get("max_score_inclusive")
+        if isinstance(minimum, bool) or not isinstance(minimum, int):
+            complete = False
+            continue
+        if isinstance(maximum, bool) or not isinstance(maximum, int):
+            complete = False
+            continue
+        if minimum > maximum:
+            report(
+                ctx,
+                errors,
+                ((bands_path, index), "min_score_inclusive"),
+                "must be <= max_score_inclusive",
+                "invalid"
+            )
+            complete = False
+            continue
+        intervals.append((minimum, maximum, index))
+    intervals.sort()
+
+    # Sweep in order of min score, tracking the band that reaches furthest so far.
+    reach_max: int | None = None
+    reach_index = -1
+    for minimum, maximum, index in intervals:
+        if reach_max is not None and minimum <= reach_max:
+            report(
+                ctx,
+                errors,
+                (bands_path, index),
+                f"overlaps result_bands[{reach_index}] on {format_score_span(minimum, min(maximum, reach_max))}",
+                "band-coverage"
+            )
+        if reach_max is None or maximum > reach_max:
+            reach_max = maximum
+            reach_index = index
 
-    version = validate_integer(data.get("version"), f"{prefix}.version", errors)
-    if version is not None and version < 1:
-        errors.append(f"{prefix}.version must be >= 1")
-    validate_string(data.get("category"), f"{prefix}.category", errors)
+    if score_range is None or not complete:
+        return
+    low, high = score_range
+    cursor = low
+    for minimum, maximum, _ in intervals:
+        if cursor > high:
+            break
+        if minimum > cursor:
+            report(
+                ctx,
+                errors,
+                bands_path,
+                f"do not cover {format_score_span(cursor, min(minimum - 1, high))}",
+                "band-coverage"
+            )
+        cursor = max(cursor, maximum + 1)
+    if cursor <= high:
+        report(ctx, errors, bands_path, f"do not cover {format_score_span(cursor, high)}", "band-coverage")
 
-    locales_value = data.get("locales")
-    locale_keys: list[str] = []
-    if not isinstance(locales_value, dict):
-        errors.append(f"{prefix}.locales must be an object")
-    else:
-        for key in locales_value.keys():
-            canonical = normalize_locale_tag(key)
-            if not canonical:
-                errors.append(f"{prefix}.locales.{key} is not an allowed locale tag")
-                continue
-            if canonical != key:
-                errors.append(f"{prefix}.locales.{key} must be {canonical}")
-                continue
-            locale_keys.append(key)
 
-        for required_locale in UNIVERSAL_REQUIRED_LOCALES:
-            if required_locale not in locale_keys:
-                errors.append(f"{prefix}.locales must include {required_locale}")
+def check_scoring_integrity(
+    spec: dict[str, Any],
+    path: PathNode,
+    ctx: dict[str, Any],
+    errors: list[str]
+) -> None:
+    option_totals = check_option_weights(spec, path, ctx, errors)
+    score_range = compute_score_range(option_totals, ctx, errors) if option_totals is not None else None
+    check_band_coverage(spec, path, ctx, errors, score_range)
+
+
+IDENTITY_FIELDS: tuple[Field | Check, ...] = (
+    Field(
+        "test_id",
+        String(pattern=TEST_ID_PATTERN, pattern_message="must match test-<slug>", capture="test_id")
+    ),
+    Field("slug", String(pattern=SLUG_PATTERN, pattern_message="must be url-safe", capture="slug")),
+    Check(check_slug_alignment),
+    Field("version", Integer(minimum=1)),
+    Field("category", String())
+)
+
+RESULT_COPY_SCHEMA = Object((
+    Field("headline", String()),
+    Field("summary", String()),
+    Field("bullets", Array(String()))
+))
+
+SPEC_SCHEMAS: dict[str, Schema] = {
+    "values_compass_v1": Object((
+        *IDENTITY_FIELDS,
+        Field(
+            "locales",
+            LocaleMap(
+                normalize=normalize_locale_tag,
+                block=Object(tuple(
+                    Field(name, String())
+                    for name in ["title", "short_description", "intro", "paywall_headline", "report_title"]
+                )),
+                require_any=True
+            )
+        ),
+        Field("questions", Array(Object((
+            Check(start_question_options),
+            Field("id", String(), check=check_question_id),
+            Field("type", String(choices=("single_choice",), choices_message="must be single_choice")),
+            Field("prompt", Localized(String())),
+            Field("options", Array(Object((
+                Field("id", String(), check=check_option_id),
+                Field("label", Localized(String()))
+            ))))
+        )))),
+        Field("scoring", Object((
+            Field("scales", Array(String(collect="scoring_scales"))),
+            Field("option_weights", Mapping(Mapping(Integer())))
+        ))),
+        Field("result_bands", Array(Object((
+            Field("band_id", String()),
+            Field("min_score_inclusive", Integer()),
+            Field("max_score_inclusive", Integer()),
+            Field("copy", Localized(RESULT_COPY_SCHEMA))
+        )))),
+        Check(check_scoring_integrity)
+    )),
+    "universal_human_v1": Object((
+        *IDENTITY_FIELDS,
+        Field(
+            "locales",
+            LocaleMap(
+                normalize=normalize_locale_tag,
+                block=Object(),
+                required=tuple(UNIVERSAL_REQUIRED_LOCALES)
+            )
+        ),
+        Field("question_count", Integer(minimum=1, capture="question_count")),
+        Field("scales", Array(String(collect="scale_ids"))),
+        Check(prepare_universal_questions),
+        Field("questions", Array(Object((
+            Field("question_id", String(), check=check_universal_question_id),
+            Field("scale_id", String(), check=check_universal_scale_id),
+            Field("prompt", Localized(String()))
+        )))),
+        Check(check_universal_missing_questions)
+    ))
+}
 
-        for locale in locale_keys:
-            if not isinstance(locales_value.get(locale), dict):
-                errors.append(f"{prefix}.locales.{locale} must be an object")
+COMPILED_SPEC_VALIDATORS = {
+    format_id: compile_schema(schema) for format_id, schema in SPEC_SCHEMAS.items()
+}
 
-    question_count = validate_integer(
-        data.get("question_count"),
-        f"{prefix}.question_count",
-        errors
-    )
-    if question_count is not None and question_count < 1:
-        errors.append(f"{prefix}.question_count must be >= 1")
 
-    scales = data.get("scales")
-    scale_ids: list[str] = []
-    if not isinstance(scales, list):
-        errors.append(f"{prefix}.scales must be an array")
-    else:
-        for index, scale in enumerate(scales):
-            scale_id = validate_string(scale, f"{prefix}.scales[{index}]", errors)
-            if scale_id:
-                scale_ids.append(scale_id)
+def validate_spec(
+    path: Path,
+    data: object,
+    errors: list[str],
+    source: JsonSource | None = None
+) -> SpecInfo:
+    prefix = str(path)
+    if not isinstance(data, dict):
+        errors.append(diagnostic_error("object", "must be a JSON object", file=prefix))
+        return SpecInfo(None, None, [])
 
-    questions = data.get("questions")
-    if not isinstance(questions, list):
-        errors.append(f"{prefix}.questions must be an array")
-    else:
-        if question_count is not None and len(questions) != question_count:
-            errors.append(
-                f"{prefix}.question_count must match number of questions"
+    format_id = data.get("format_id")
+    if format_id is None:
+        format_id = "values_compass_v1"
+    if not isinstance(format_id, str) or not format_id.strip():
+        errors.append(
+            diagnostic_error(
+                "non-empty-string",
+                "must be a non-empty string",
+                "format_id",
+                prefix,
+                f"{prefix}.format_id must be a non-empty string"
             )
+        )
+        return SpecInfo(None, None, [])
+    format_id = format_id.strip()
 
-        expected_count = question_count if question_count is not None else len(questions)
-        width = max(2, len(str(expected_count))) if expected_count else 2
-        expected_ids = [f"q{index:0{width}d}" for index in range(1, expected_count + 1)]
-        seen: set[str] = set()
-
-        for index, question in enumerate(questions):
-            question_path = f"{prefix}.questions[{index}]"
-            if not isinstance(question, dict):
-                errors.append(f"{question_path} must be an object")
-                continue
-
-            question_id = validate_string(question.get("question_id"), f"{question_path}.question_id", errors)
-            if question_id:
-                if question_id in seen:
-                    errors.append(f"{question_path}.question_id {question_id} is duplicated")
-                seen.add(question_id)
-                if question_id not in expected_ids:
-                    errors.append(f"{question_path}.question_id must match q01..qNN")
+    validator = COMPILED_SPEC_VALIDATORS.get(format_id)
+    if validator is None:
+        errors.append(
+            diagnostic_error(
+                "invalid",
+                "must be values_compass_v1 or universal_human_v1",
+                "format_id",
+                prefix,
+                f"{prefix}.format_id must be values_compass_v1 or universal_human_v1"
+            )
+        )
+        return SpecInfo(None, None, [])
 
-            scale_id = validate_string(question.get("scale_id"), f"{question_path}.scale_id", errors)
-            if scale_id and scale_id not in scale_ids:
-                errors.append(f"{question_path}.scale_id must be listed in scales")
+    ctx = validator(data, prefix, errors, source.locate if source is not None else None)
+    return SpecInfo(ctx.get("test_id"), ctx.get("slug"), ctx["locale_keys"])
 
-            validate_localized_map(question.get("prompt"), locale_keys, f"{question_path}.prompt", errors)
 
-        if expected_ids and set(expected_ids) != seen:
-            missing = [qid for qid in expected_ids if qid not in seen]
-            if missing:
-                errors.append(f"{prefix}.questions missing ids: {', '.join(missing)}")
+def spec_identity(data: object) -> SpecInfo:
+    """The test_id, slug and locales validate_spec would capture, without its other checks."""
+    if not isinstance(data, dict):
+        return SpecInfo(None, None, [])
+    format_id = data.get("format_id")
+    if format_id is None:
+        format_id = "values_compass_v1"
+    if not isinstance(format_id, str) or format_id.strip() not in COMPILED_SPEC_VALIDATORS:
+        return SpecInfo(None, None, [])
 
-    return SpecInfo(test_id, slug, locale_keys)
+    test_id, slug, locales = data.get("test_id"), data.get("slug"), data.get("locales")
+    return SpecInfo(
+        test_id.strip() if is_non_empty_string(test_id) else None,
+        slug.strip() if is_non_empty_string(slug) else None,
+        # Same rule as LocaleMap: only keys already in canonical form count as locales.
+        [key for key in locales if normalize_locale_tag(key) == key] if isinstance(locales, dict) else []
+    )
 
 
 def load_tenants(data: object, errors: list[str]) -> dict[str, str]:
     if not isinstance(data, dict):
-        errors.append("tenants.json must contain a top-level object")
+        errors.append(diagnostic_error("object", "must contain a top-level object", file="tenants.json"))
         return {}
 
     tenants = data.get("tenants")
     if not isinstance(tenants, list):
-        errors.append("tenants.json must contain a tenants array")
+        errors.append(diagnostic_error("array", "must contain a tenants array", file="tenants.json"))
         return {}
 
     tenant_locales: dict[str, str] = {}
     for index, tenant in enumerate(tenants):
         label = f"tenants[{index}]"
         if not isinstance(tenant, dict):
-            errors.append(f"{label} must be an object")
+            errors.append(diagnostic_error("object", "must be an object", label, "tenants.json"))
             continue
 
-        tenant_id = validate_string(tenant.get("tenant_id"), f"{label}.tenant_id", errors)
-        default_locale = validate_string(tenant.get("default_locale"), f"{label}.default_locale", errors)
+        tenant_id = validate_string(tenant.get("tenant_id"), f"{label}.tenant_id", errors, "tenants.json")
+        default_locale = validate_string(
+            tenant.get("default_locale"),
+            f"{label}.default_locale",
+            errors,
+            "tenants.json"
+        )
         canonical_locale = normalize_locale_tag(default_locale)
         if default_locale and not canonical_locale:
-            errors.append(f"{label}.default_locale must be one of: en, es, pt-BR")
+            errors.append(
+                diagnostic_error("invalid", "must be one of: en, es, pt-BR", f"{label}.default_locale", "tenants.json")
+            )
             continue
         if default_locale and canonical_locale and canonical_locale != default_locale:
-            errors.append(f"{label}.default_locale must be {canonical_locale}")
+            errors.append(
+                diagnostic_error("invalid", f"must be {canonical_locale}", f"{label}.default_locale", "tenants.json")
+            )
             continue
 
         if tenant_id:
@@ -392,27 +705,43 @@ def load_tenants(data: object, errors: list[str]) -> dict[str, str]:
 
 def load_catalog(data: object, errors: list[str]) -> dict[str, list[str]]:
     if not isinstance(data, dict):
-        errors.append("catalog.json must contain a top-level object")
+        errors.append(diagnostic_error("object", "must contain a top-level object", file="catalog.json"))
         return {}
 
     tenants = data.get("tenants")
     if not isinstance(tenants, dict):
-        errors.append("catalog.json must contain a tenants object")
+        errors.append(diagnostic_error("object", "must contain a tenants object", file="catalog.json"))
         return {}
 
     catalog: dict[str, list[str]] = {}
     for tenant_id, tests in tenants.items():
         if not isinstance(tenant_id, str) or not tenant_id.strip():
-            errors.append("catalog.json tenant ids must be non-empty strings")
+            errors.append(
+                diagnostic_error("non-empty-string", "tenant ids must be non-empty strings", "tenants", "catalog.json")
+            )
             continue
 
         if not isinstance(tests, list):
-            errors.append(f"catalog.json tenants.{tenant_id} must be an array")
+            errors.append(
+                diagnostic_error(
+                    "array",
+                    "must be an array",
+                    f"tenants.{tenant_id}",
+                    "catalog.json",
+                    f"catalog.json tenants.{tenant_id} must be an array"
+                )
+            )
             continue
 
         test_ids: list[str] = []
         for index, test_id in enumerate(tests):
-            value = validate_string(test_id, f"catalog.json tenants.{tenant_id}[{index}]", errors)
+            value = validate_string(
+                test_id,
+                f"tenants.{tenant_id}[{index}]",
+                errors,
+                "catalog.json",
+                f"catalog.json tenants.{tenant_id}[{index}] must be a non-empty string"
+            )
             if value:
                 test_ids.append(value)
 
@@ -421,77 +750,639 @@ def load_catalog(data: object, errors: list[str]) -> dict[str, list[str]]:
     return catalog
 
 
-def main() -> int:
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate tenants, catalog, and test specs.")
+    parser.add_argument(
+        "--tests-root",
+        type=Path,
+        default=TESTS_ROOT,
+        help="Root directory containing test specs (default: content/tests)"
+    )
+    parser.add_argument(
+        "--tenants-path",
+        type=Path,
+        default=TENANTS_PATH,
+        help="Path to tenants.json (default: config/tenants.json)"
+    )
+    parser.add_argument(
+        "--catalog-path",
+        type=Path,
+        default=CATALOG_PATH,
+        help="Path to catalog.json (default: config/catalog.json)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for spec validation (default: 1, 0 uses all CPUs)"
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help="Path to the incremental validation cache (default: .cache/validate_catalog.json)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Validate every spec without reading or writing the cache"
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="GIT_REF",
+        help=(
+            "Only validate specs changed since the merge base with this ref; "
+            "cross-references are still checked for the whole catalog"
+        )
+    )
+    parser.add_argument(
+        "--emit-index",
+        type=Path,
+        help="Write a versioned, checksummed catalog index to this path when validation passes"
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-validate specs, tenants.json and catalog.json as they change"
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, use mtime polling even when inotify is available"
+    )
+    add_diagnostic_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
+    check_diagnostic_arguments(parser, args)
+    if args.watch:
+        check_watch_arguments(parser, args, ["changed_since", "emit_index"])
+    return args
+
+
+
+def resolve_jobs(jobs: int) -> int:
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def iter_spec_paths(tests_root: Path) -> list[Path]:
+    return sorted(tests_root.glob("*/spec.json"))
+
+
+def validate_spec_file(spec_path: Path, raw: bytes | None = None) -> tuple[SpecInfo | None, list[str]]:
     errors: list[str] = []
+    source = load_json_file(spec_path, str(spec_path), errors, raw)
+    if source is None:
+        return None, errors
+    return validate_spec(spec_path, source.data, errors, source), errors
+
+
+def iter_validate_spec_files(
+    spec_paths: list[Path],
+    jobs: int = 1,
+    raws: list[bytes | None] | None = None
+) -> Iterator[tuple[SpecInfo | None, list[str]]]:
+    if raws is None:
+        raws = [None] * len(spec_paths)
+    jobs = min(resolve_jobs(jobs), len(spec_paths))
+    if jobs <= 1:
+        for spec_path, raw in zip(spec_paths, raws):
+            yield validate_spec_file(spec_path, raw)
+        return
 
-    tenants_data = load_json(TENANTS_PATH, "tenants.json", errors)
-    catalog_data = load_json(CATALOG_PATH, "catalog.json", errors)
+    # Executor.map yields results in submission order, so the merge stays deterministic.
+    chunksize = max(1, len(spec_paths) // (jobs * 4))
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        yield from executor.map(validate_spec_file, spec_paths, raws, chunksize=chunksize)
+    finally:
+        # Closing the generator early (--fail-fast) drops the chunks that have not started.
+        executor.shutdown(cancel_futures=True)
 
-    tenants = load_tenants(tenants_data, errors) if tenants_data is not None else {}
-    catalog = load_catalog(catalog_data, errors) if catalog_data is not None else {}
 
-    specs: dict[str, SpecInfo] = {}
-    if TESTS_ROOT.exists():
-        for spec_path in TESTS_ROOT.glob("*/spec.json"):
-            spec_data = load_json(spec_path, str(spec_path), errors)
-            if spec_data is None:
-                continue
-            spec_info = validate_spec(spec_path, spec_data, errors)
-            specs[spec_path.parent.name] = spec_info
+def validate_spec_files(
+    spec_paths: list[Path],
+    jobs: int = 1,
+    raws: list[bytes | None] | None = None
+) -> list[tuple[SpecInfo | None, list[str]]]:
+    return list(iter_validate_spec_files(spec_paths, jobs, raws))
+
+
+def validate_spec_data(spec_path: Path, data: Any) -> tuple[SpecInfo, list[str]]:
+    errors: list[str] = []
+    return validate_spec(spec_path, data, errors), errors
+
+
+def validate_spec_datas(
+    spec_paths: list[Path],
+    datas: list[Any],
+    jobs: int = 1
+) -> list[tuple[SpecInfo, list[str]]]:
+    """Validate in-memory spec data (before it is written), in spec_paths order."""
+    jobs = min(resolve_jobs(jobs), len(spec_paths))
+    if jobs <= 1:
+        return [validate_spec_data(spec_path, data) for spec_path, data in zip(spec_paths, datas)]
+
+    chunksize = max(1, len(spec_paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(validate_spec_data, spec_paths, datas, chunksize=chunksize))
+
+
+def iter_spec_results(
+    spec_paths: Iterable[Path],
+    jobs: int = 1,
+    cache: ValidationCache | None = None
+) -> Iterator[tuple[Path, str, tuple[SpecInfo | None, list[str]]]]:
+    """Yield (spec_path, sha256, (spec_info, errors)) in path order, merging cached and fresh results.
+
+    Fresh results are computed lazily, so a consumer that stops early (--fail-fast) also
+    stops the remaining validation work.
+    """
+    ordered_paths = list(spec_paths)
+    cached_results: dict[int, tuple[SpecInfo | None, list[str]]] = {}
+    pending: list[int] = []
+    pending_raws: list[bytes | None] = []
+    digests: list[str] = []
+    stats: list[list[int]] = []
+
+    for index, spec_path in enumerate(ordered_paths):
+        stats.append(stat_key(spec_path))
+        raw = spec_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        digests.append(digest)
+        cached = cache.get(spec_path, digest, stats[index]) if cache is not None else None
+        if cached is not None:
+            cached_results[index] = cached
+            continue
+        pending.append(index)
+        pending_raws.append(raw)
+
+    computed = iter_validate_spec_files([ordered_paths[index] for index in pending], jobs, pending_raws)
+    try:
+        for index, (spec_path, digest) in enumerate(zip(ordered_paths, digests)):
+            result = cached_results.get(index)
+            if result is None:
+                result = next(computed)
+                if cache is not None:
+                    cache.put(spec_path, digest, *result, stat=stats[index])
+            if result[0] is not None:
+                result[0].checksum = digest
+            yield spec_path, digest, result
+    finally:
+        computed.close()
+
+
+def read_spec_info(
+    spec_path: Path,
+    cache: ValidationCache | None = None,
+    checksum: bool = True
+) -> SpecInfo | None:
+    """Identity fields of a spec that is not being validated, for the cross-reference pass.
+
+    Uses the cached result when the content matches, otherwise only parses the JSON. With
+    checksum=False a cache entry whose (mtime, size) still matches is used without reading
+    the file, and spec_info.checksum is left unset.
+    """
+    if not checksum:
+        cached = cache.get_unchanged(spec_path, stat_key(spec_path)) if cache is not None else None
+        if cached is not None:
+            return cached[0]
+        raw = spec_path.read_bytes()
+        digest = None
     else:
-        errors.append(f"content/tests not found: {TESTS_ROOT}")
+        raw = spec_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        cached = cache.get(spec_path, digest) if cache is not None else None
+        if cached is not None:
+            spec_info = cached[0]
+            if spec_info is not None:
+                spec_info.checksum = digest
+            return spec_info
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return None
+    spec_info = spec_identity(data)
+    spec_info.checksum = digest
+    return spec_info
+
+
+def collect_specs(
+    spec_paths: Iterable[Path],
+    errors: list[str],
+    jobs: int = 1,
+    cache: ValidationCache | None = None,
+    changed: set[str] | None = None,
+    checksums: bool = True
+) -> dict[str, SpecInfo]:
+    """Validate specs in path order.
+
+    With changed (spec directory names), only those specs are validated and reported; the
+    rest are read for their identity fields so cross-references still see the whole catalog.
+    checksums=False lets that identity pass skip hashing (see read_spec_info).
+    """
+    ordered_paths = list(spec_paths)
+    validated = [path for path in ordered_paths if changed is None or path.parent.name in changed]
+    results = iter_spec_results(validated, jobs, cache)
+    specs: dict[str, SpecInfo] = {}
+    try:
+        for spec_path in ordered_paths:
+            if changed is None or spec_path.parent.name in changed:
+                _, _, (spec_info, spec_errors) = next(results)
+                errors.extend(spec_errors)
+            else:
+                spec_info = read_spec_info(spec_path, cache, checksums)
+            if spec_info is not None:
+                specs[spec_path.parent.name] = spec_info
+    finally:
+        results.close()
+
+    # A partial run has not seen every spec, so it must not drop the others' entries.
+    if cache is not None and changed is None:
+        cache.retain(ordered_paths)
+    return specs
+
+
+def catalog_error(code: str, tenant_id: str, message: str) -> str:
+    return diagnostic_error(
+        code,
+        message,
+        f"tenants.{tenant_id}",
+        "catalog.json",
+        f"catalog.json tenant {tenant_id} {message}"
+    )
+
 
+def check_cross_references(
+    specs: dict[str, SpecInfo],
+    tenants: dict[str, str],
+    catalog: dict[str, list[str]],
+    errors: list[str],
+    tests_root: Path = TESTS_ROOT,
+    touched: set[str] | None = None
+) -> None:
+    """Check cross-spec and tenant/catalog references.
+
+    With touched (spec directory names), only problems involving those specs are reported.
+    """
     test_id_to_path: dict[str, Path] = {}
     slug_to_path: dict[str, Path] = {}
     for directory, spec in specs.items():
         if spec.test_id:
             existing = test_id_to_path.get(spec.test_id)
             if existing:
-                errors.append(
-                    f"duplicate test_id {spec.test_id} in {existing} and {TESTS_ROOT / directory}"
-                )
+                if touched is None or directory in touched or existing.name in touched:
+                    errors.append(
+                        diagnostic_error(
+                            "duplicate",
+                            f"duplicate test_id {spec.test_id} in {existing} and {tests_root / directory}",
+                            "test_id",
+                            str(tests_root / directory / "spec.json"),
+                            f"duplicate test_id {spec.test_id} in {existing} and {tests_root / directory}"
+                        )
+                    )
             else:
-                test_id_to_path[spec.test_id] = TESTS_ROOT / directory
+                test_id_to_path[spec.test_id] = tests_root / directory
 
         if spec.slug:
             existing = slug_to_path.get(spec.slug)
             if existing:
-                errors.append(
-                    f"duplicate slug {spec.slug} in {existing} and {TESTS_ROOT / directory}"
-                )
+                if touched is None or directory in touched or existing.name in touched:
+                    errors.append(
+                        diagnostic_error(
+                            "duplicate",
+                            f"duplicate slug {spec.slug} in {existing} and {tests_root / directory}",
+                            "slug",
+                            str(tests_root / directory / "spec.json"),
+                            f"duplicate slug {spec.slug} in {existing} and {tests_root / directory}"
+                        )
+                    )
             else:
-                slug_to_path[spec.slug] = TESTS_ROOT / directory
+                slug_to_path[spec.slug] = tests_root / directory
 
     for tenant_id, tests in catalog.items():
+        if touched is not None and touched.isdisjoint(tests):
+            continue
         if tenant_id not in tenants:
-            errors.append(f"catalog.json tenant {tenant_id} does not exist in tenants.json")
+            errors.append(catalog_error("cross-reference", tenant_id, "does not exist in tenants.json"))
             continue
 
         seen: set[str] = set()
         for test_id in tests:
+            if touched is not None and test_id not in touched:
+                seen.add(test_id)
+                continue
             if test_id in seen:
-                errors.append(f"catalog.json tenant {tenant_id} has duplicate test {test_id}")
+                errors.append(catalog_error("duplicate", tenant_id, f"has duplicate test {test_id}"))
                 continue
             seen.add(test_id)
 
-            spec_path = TESTS_ROOT / test_id / "spec.json"
+            spec_path = tests_root / test_id / "spec.json"
             if not spec_path.exists():
-                errors.append(f"catalog.json tenant {tenant_id} references missing test {test_id}")
+                errors.append(catalog_error("cross-reference", tenant_id, f"references missing test {test_id}"))
                 continue
 
             spec_info = specs.get(test_id)
             default_locale = tenants.get(tenant_id)
             if spec_info and default_locale:
                 if default_locale not in spec_info.locales:
+                    message = f"missing default locale {default_locale} for tenant {tenant_id}"
                     errors.append(
-                        f"test {test_id} missing default locale {default_locale} for tenant {tenant_id}"
+                        diagnostic_error(
+                            "cross-reference",
+                            message,
+                            "locales",
+                            str(spec_path),
+                            f"test {test_id} {message}"
+                        )
                     )
 
+
+class CatalogValidator:
+    """Tenants, catalog and per-spec results for one content tree, held in memory.
+
+    load() validates the tree once (reusing a ValidationCache when given). Afterwards
+    validate_one(), validate_data() and revalidate() re-check only the specs that changed,
+    plus the cross-references that involve them.
+
+    One-shot scripts that check a few specs use load(identity_only=True): the other specs
+    are only read for their identity fields, and errors() validates them when it is called.
+    """
+
+    def __init__(
+        self,
+        tests_root: Path = TESTS_ROOT,
+        tenants_path: Path = TENANTS_PATH,
+        catalog_path: Path = CATALOG_PATH,
+        jobs: int = 1,
+        cache: ValidationCache | None = None
+    ):
+        self.tests_root = tests_root
+        self.tenants_path = tenants_path
+        self.catalog_path = catalog_path
+        self.jobs = jobs
+        self.cache = cache
+        self.config_errors: list[str] = []
+        self.tenants: dict[str, str] = {}
+        self.catalog: dict[str, list[str]] = {}
+        self.spec_results: dict[Path, tuple[SpecInfo | None, list[str]]] = {}
+        # Specs loaded with identity_only whose errors are not known yet.
+        self.unchecked: set[Path] = set()
+
+    def load(self, identity_only: bool = False) -> None:
+        self.load_config()
+        self.spec_results = {}
+        self.unchecked = set()
+        if not self.tests_root.exists():
+            return
+        spec_paths = iter_spec_paths(self.tests_root)
+        if identity_only:
+            for spec_path in spec_paths:
+                self.spec_results[spec_path] = (read_spec_info(spec_path, self.cache, checksum=False), [])
+            self.unchecked.update(spec_paths)
+            return
+        for spec_path, _, result in iter_spec_results(spec_paths, self.jobs, self.cache):
+            self.spec_results[spec_path] = result
+
+    def load_config(self) -> None:
+        errors: list[str] = []
+        tenants_data = load_json(self.tenants_path, "tenants.json", errors)
+        catalog_data = load_json(self.catalog_path, "catalog.json", errors)
+        self.tenants = load_tenants(tenants_data, errors) if tenants_data is not None else {}
+        self.catalog = load_catalog(catalog_data, errors) if catalog_data is not None else {}
+        self.config_errors = errors
+
+    def save_cache(self) -> None:
+        if self.cache is not None:
+            self.cache.save()
+
+    def spec_path(self, test_id: str) -> Path:
+        return self.tests_root / test_id / "spec.json"
+
+    def specs(self) -> dict[str, SpecInfo]:
+        specs: dict[str, SpecInfo] = {}
+        for spec_path in sorted(self.spec_results):
+            spec_info = self.spec_results[spec_path][0]
+            if spec_info is not None:
+                specs[spec_path.parent.name] = spec_info
+        return specs
+
+    def update_spec(self, spec_path: Path) -> None:
+        """Re-read one spec from disk; a deleted spec is dropped."""
+        self.unchecked.discard(spec_path)
+        if not spec_path.exists():
+            self.spec_results.pop(spec_path, None)
+            return
+        stat = stat_key(spec_path)
+        raw = spec_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        result = self.cache.get(spec_path, digest, stat) if self.cache is not None else None
+        if result is None:
+            result = validate_spec_file(spec_path, raw)
+            if self.cache is not None:
+                self.cache.put(spec_path, digest, *result, stat=stat)
+        if result[0] is not None:
+            result[0].checksum = digest
+        self.spec_results[spec_path] = result
+
+    def errors(self) -> list[str]:
+        """Every error for the tree, in the same order as validate_catalog.py reports them."""
+        for spec_path in sorted(self.unchecked):
+            self.update_spec(spec_path)
+        errors = list(self.config_errors)
+        for spec_path in sorted(self.spec_results):
+            errors.extend(self.spec_results[spec_path][1])
+        check_cross_references(self.specs(), self.tenants, self.catalog, errors, self.tests_root)
+        return errors
+
+    def touched_errors(self, touched: set[str], all_references: bool = False) -> list[str]:
+        errors: list[str] = []
+        for spec_path in sorted(self.spec_results):
+            if spec_path.parent.name in touched:
+                errors.extend(self.spec_results[spec_path][1])
+        check_cross_references(
+            self.specs(),
+            self.tenants,
+            self.catalog,
+            errors,
+            self.tests_root,
+            None if all_references else touched
+        )
+        return errors
+
+    def revalidate(self, changed_paths: Iterable[Path]) -> list[str]:
+        """Re-check changed spec/config files; returns the errors that involve them."""
+        touched: set[str] = set()
+        config_changed = False
+        for path in sorted(set(changed_paths)):
+            if path in (self.tenants_path, self.catalog_path):
+                config_changed = True
+            elif path.name == "spec.json" and path.parent.parent == self.tests_root:
+                self.update_spec(path)
+                touched.add(path.parent.name)
+
+        if config_changed:
+            # Tenant or catalog edits can change any reference, so those are all re-checked.
+            self.load_config()
+            return self.config_errors + self.touched_errors(touched, all_references=True)
+        return self.touched_errors(touched)
+
+    def validate_one(self, test_id: str) -> list[str]:
+        return self.revalidate([self.spec_path(test_id)])
+
+    def validate_data(self, test_id: str, data: Any) -> list[str]:
+        """Validate spec data before it is written; it replaces the stored result only when valid."""
+        return self.validate_many({test_id: data})
+
+    def validate_many(self, specs: dict[str, Any]) -> list[str]:
+        """validate_data for several specs, validated across jobs workers.
+
+        The stored results are replaced only when every spec and reference is valid.
+        """
+        spec_paths = [self.spec_path(test_id) for test_id in specs]
+        results = validate_spec_datas(spec_paths, list(specs.values()), self.jobs)
+        previous = {spec_path: self.spec_results.get(spec_path) for spec_path in spec_paths}
+        self.spec_results.update(zip(spec_paths, results))
+        errors = self.touched_errors(set(specs))
+        if errors:
+            for spec_path, result in previous.items():
+                if result is None:
+                    del self.spec_results[spec_path]
+                else:
+                    self.spec_results[spec_path] = result
+        else:
+            self.unchecked.difference_update(spec_paths)
+        return errors
+
+
+def to_root_relative(path: Path) -> str:
+    try:
+        return path.relative_to(ROOT_DIR).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def build_catalog_index(
+    specs: dict[str, SpecInfo],
+    tenants: dict[str, str],
+    catalog: dict[str, list[str]],
+    tests_root: Path = TESTS_ROOT
+) -> dict[str, Any]:
+    tests: dict[str, dict[str, str | None]] = {}
+    slugs: dict[str, str] = {}
+    for directory, spec in sorted(specs.items()):
+        if not spec.test_id:
+            continue
+        tests[spec.test_id] = {
+            "spec_path": to_root_relative(tests_root / directory / "spec.json"),
+            "sha256": spec.checksum
+        }
+        if spec.slug:
+            slugs[spec.slug] = spec.test_id
+
+    tenant_entries: dict[str, dict[str, Any]] = {}
+    for tenant_id in sorted(tenants):
+        tenant_entries[tenant_id] = {
+            "default_locale": tenants[tenant_id],
+            "tests": list(catalog.get(tenant_id, []))
+        }
+
+    payload = {
+        "version": CATALOG_INDEX_VERSION,
+        "tests": dict(sorted(tests.items())),
+        "slugs": dict(sorted(slugs.items())),
+        "tenants": tenant_entries
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return {**payload, "checksum": hashlib.sha256(canonical.encode("utf-8")).hexdigest()}
+
+
+def write_catalog_index(path: Path, index: dict[str, Any]) -> None:
+    write_json(path, index)
+
+
+def changed_spec_dirs(ref: str, tests_root: Path, errors: list[str]) -> set[str] | None:
+    """Spec directories to validate for --changed-since, or None to validate everything.
+
+    A change to the validator itself can change the verdict for any spec. Tenant and
+    catalog changes need no spec revalidation: the cross-reference pass covers them.
+    """
+    change_set, change_error = load_change_set(ref, tests_root)
+    if change_error:
+        errors.append(change_error)
+        return None
+    if any(change_set.touches(path) for path in CACHE_SOURCE_FILES):
+        return None
+    return change_set.changed_spec_dirs(tests_root)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.watch:
+        # content_watch imports this module, so it is only loaded for --watch.
+        import content_watch
+
+        session = content_watch.ContentSession(
+            tests_root=args.tests_root,
+            tenants_path=args.tenants_path,
+            catalog_path=args.catalog_path,
+            lint=False,
+            sources=False,
+            jobs=args.jobs,
+            cache=None if args.no_cache else ValidationCache.load(args.cache_path)
+        )
+        return content_watch.watch(session, force_poll=args.poll)
+
+    errors = DiagnosticSink.from_args("validate_catalog", args)
+
+    try:
+        tests_root: Path = args.tests_root
+        tenants_data = load_json(args.tenants_path, "tenants.json", errors)
+        catalog_data = load_json(args.catalog_path, "catalog.json", errors)
+
+        tenants = load_tenants(tenants_data, errors) if tenants_data is not None else {}
+        catalog = load_catalog(catalog_data, errors) if catalog_data is not None else {}
+
+        cache = None if args.no_cache else ValidationCache.load(args.cache_path)
+
+        specs: dict[str, SpecInfo] = {}
+        if tests_root.exists():
+            changed = None
+            if args.changed_since:
+                changed = changed_spec_dirs(args.changed_since, tests_root, errors)
+            specs = collect_specs(
+                iter_spec_paths(tests_root),
+                errors,
+                jobs=args.jobs,
+                cache=cache,
+                changed=changed,
+                checksums=args.emit_index is not None
+            )
+            if cache is not None:
+                cache.save()
+        else:
+            errors.append(
+                diagnostic_error(
+                    "not-found",
+                    f"not found: {tests_root}",
+                    file=str(tests_root),
+                    text=f"content/tests not found: {tests_root}"
+                )
+            )
+
+        check_cross_references(specs, tenants, catalog, errors, tests_root)
+    except DiagnosticLimitReached:
+        pass
+    errors.close()
+
     if errors:
-        for message in errors:
-            print(f"ERROR: {message}", file=sys.stderr)
         return 1
 
+    if args.emit_index:
+        write_catalog_index(args.emit_index, build_catalog_index(specs, tenants, catalog, tests_root))
+
     return 0
 
 
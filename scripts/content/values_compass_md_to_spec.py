@@ -2,15 +2,22 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import re
 import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
 import validate_catalog
+from atomic_write import write_json
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
+DEFAULT_CACHE_PATH = ROOT_DIR / ".cache" / "values_compass_parse.json"
+
+# Bump when parsing changes in a way the source fingerprint cannot see.
+PARSER_VERSION = 2
 
 VALUE_ID_MAP = {
     "FREEDOM": "freedom",
@@ -55,6 +62,44 @@ SECTION_HEADER_RE = re.compile(r"^\s*(\d+)\.\s+.+$")
 VALUE_LINE_RE = re.compile(r"^\s*\d+\)\s*([A-Z0-9_]+)\s*\(([^)]+)\)\s*-\s*(.+)$")
 QUESTION_LINE_RE = re.compile(r"^\s*(\d+)\.\s+(.*)$")
 PAIR_LINE_RE = re.compile(r"^\s*(?:\d+\)\s*)?([A-Z0-9_]+)\s+vs\s+([A-Z0-9_]+)\s*$")
+PROFILE_LINE_RE = re.compile(r"^\s*([A-Z0-9_]+)\s*\(([^)]+)\)\s*$")
+ITEM_LINE_RE = re.compile(r"^\s*\d+\)\s*(.+)$")
+SCORING_ROW_RE = re.compile(r"^\|\s*([A-Z0-9_]+)\s*\|\s*([0-9,\s]+)\|")
+SCALE_LABEL_RE = re.compile(r"^\s*(\d+)\s*=\s*(.+)$")
+UNDERLINE_RE = re.compile(r"^\s*[-=]{3,}\s*$")
+ID_START_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ_")
+
+# Token kinds assigned by lex_line.
+BLANK = "blank"
+UNDERLINE = "underline"
+SECTION_HEADER = "section_header"  # "3. Start screen" above an underline
+BULLET = "bullet"  # "- text" or "* text"
+NUMBERED = "numbered"  # "3. text" (questions)
+VALUE = "value"  # "1) FREEDOM (Freedom) - definition"
+PAIR = "pair"  # "FREEDOM vs SECURITY", optionally numbered
+PROFILE = "profile"  # "FREEDOM (Freedom)"
+TABLE_ROW = "table_row"  # "| FREEDOM | 1, 11, 21 |"
+ITEM = "item"  # any other "2) text"
+TEXT = "text"
+
+
+@dataclass(slots=True)
+class Token:
+    """One source line, classified once so the section parsers never re-match it."""
+
+    line: int
+    kind: str
+    text: str
+    trimmed: str
+    # Regex groups for SECTION_HEADER, VALUE, PAIR, PROFILE, NUMBERED and TABLE_ROW tokens.
+    groups: tuple[str, ...] = ()
+    # "-" or "*" for lines starting with a bullet marker, underlines made of dashes included.
+    marker: str = ""
+    bullet: str = ""
+    # (number, label) for bullets reading "N = label".
+    scale: tuple[int, str] | None = None
+    # Text after "N)" for every numbered item, value lines and numbered pairs included.
+    item: str | None = None
 
 
 class LocaleData:
@@ -76,6 +121,94 @@ class LocaleData:
         self.paid_report_sections: list[str] = []
         self.paywall_copy: dict[str, Any] = {}
 
+    def to_dict(self) -> dict[str, Any]:
+        data = dict(vars(self))
+        # JSON object keys are strings, so the numbered maps are stored as [number, text] pairs.
+        data["scale_labels"] = sorted(self.scale_labels.items())
+        data["questions"] = sorted(self.questions.items())
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LocaleData":
+        locale_data = cls(data["locale"])
+        for key, value in data.items():
+            setattr(locale_data, key, value)
+        locale_data.scale_labels = {number: text for number, text in data["scale_labels"]}
+        locale_data.questions = {number: text for number, text in data["questions"]}
+        locale_data.conflict_pairs = [(left, right) for left, right in data["conflict_pairs"]]
+        return locale_data
+
+
+def parser_fingerprint() -> str:
+    digest = hashlib.sha256(f"parser-v{PARSER_VERSION}".encode("utf-8"))
+    digest.update(Path(__file__).resolve().read_bytes())
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """Parsed LocaleData and parse errors per source file, keyed by path and content hash."""
+
+    def __init__(self, path: Path, fingerprint: str, entries: dict[str, dict[str, Any]] | None = None):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries: dict[str, dict[str, Any]] = entries or {}
+        self.dirty = False
+        # Entries parsed since the last take_added(), when tracking is on (pool workers).
+        self.added: dict[str, dict[str, Any]] | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> "ParseCache":
+        fingerprint = parser_fingerprint()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path, fingerprint)
+        if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+            return cls(path, fingerprint)
+        entries = data.get("entries")
+        return cls(path, fingerprint, entries if isinstance(entries, dict) else None)
+
+    def get(self, path: Path, locale: str, digest: str) -> tuple[LocaleData, list[str]] | None:
+        entry = self.entries.get(str(path))
+        if not isinstance(entry, dict) or entry.get("sha256") != digest or entry.get("locale") != locale:
+            return None
+        return LocaleData.from_dict(entry["data"]), list(entry["errors"])
+
+    def put(self, path: Path, digest: str, locale_data: LocaleData, errors: list[str]) -> None:
+        entry = {
+            "sha256": digest,
+            "locale": locale_data.locale,
+            "data": locale_data.to_dict(),
+            "errors": list(errors)
+        }
+        self.entries[str(path)] = entry
+        if self.added is not None:
+            self.added[str(path)] = entry
+        self.dirty = True
+
+    def take_added(self) -> dict[str, dict[str, Any]]:
+        added = self.added or {}
+        self.added = {}
+        return added
+
+    def merge(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Apply entries parsed by a pool worker."""
+        if entries:
+            self.entries.update(entries)
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        # Keys are not sorted: the parsed dicts keep source order, which the spec output follows.
+        write_json(
+            self.path,
+            {"fingerprint": self.fingerprint, "entries": self.entries},
+            indent=None,
+            ensure_ascii=False
+        )
+        self.dirty = False
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -89,125 +222,203 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--es", required=True)
     parser.add_argument("--ptbr", required=True)
     parser.add_argument("--out", required=True)
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help="Parsed source cache path (default: .cache/values_compass_parse.json)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Parse every source file")
     return parser.parse_args()
 
 
 def is_underline(line: str) -> bool:
-    return bool(re.match(r"^\s*[-=]{3,}\s*$", line))
+    return UNDERLINE_RE.match(line) is not None
+
+
+def at(label: str, token: Token) -> str:
+    return f"{label} line {token.line}"
+
+
+def lex_line(line: int, text: str, next_text: str = "") -> Token:
+    """Classify one line; next_text decides whether a "N. title" line is a section header."""
+    trimmed = text.strip()
+    if not trimmed:
+        return Token(line, BLANK, text, trimmed)
+
+    # Every pattern needs a specific first character, and most also a substring that is
+    # cheaper to look for than running the regex, so prose lines skip them all.
+    first = trimmed[0]
+    if first in "-*":
+        bullet = trimmed.lstrip("-* ").strip()
+        kind = UNDERLINE if first == "-" and UNDERLINE_RE.match(text) else BULLET
+        token = Token(line, kind, text, trimmed, (), first, bullet)
+        if bullet[:1].isdecimal():
+            scale = SCALE_LABEL_RE.match(bullet)
+            if scale:
+                token.scale = (int(scale.group(1)), scale.group(2).strip())
+        return token
+    if first == "=":
+        return Token(line, UNDERLINE if UNDERLINE_RE.match(text) else TEXT, text, trimmed)
+    if first == "|":
+        row = SCORING_ROW_RE.match(trimmed)
+        if row:
+            return Token(line, TABLE_ROW, text, trimmed, row.groups())
+        return Token(line, TEXT, text, trimmed)
+
+    numbered = first.isdecimal()
+    if not numbered and first not in ID_START_CHARS:
+        return Token(line, TEXT, text, trimmed)
+
+    if numbered and "." in trimmed and is_underline(next_text):
+        header = SECTION_HEADER_RE.match(text)
+        if header:
+            return Token(line, SECTION_HEADER, text, trimmed, header.groups())
+
+    # Value lines and numbered pairs are also "N)" items; the other kinds are exclusive.
+    match = None
+    kind = TEXT
+    if numbered and ")" in trimmed:
+        match = VALUE_LINE_RE.match(text)
+        kind = VALUE
+    if match is None and "vs" in trimmed:
+        match = PAIR_LINE_RE.match(trimmed)
+        kind = PAIR
+    if match is None and trimmed[-1] == ")":
+        match = PROFILE_LINE_RE.match(trimmed)
+        kind = PROFILE
+    if match is None and numbered and "." in trimmed:
+        match = QUESTION_LINE_RE.match(trimmed)
+        kind = NUMBERED
+    if match is None:
+        token = Token(line, TEXT, text, trimmed)
+    else:
+        token = Token(line, kind, text, trimmed, match.groups())
+
+    if numbered and ")" in trimmed:
+        item = ITEM_LINE_RE.match(trimmed)
+        if item:
+            token.item = item.group(1)
+            if token.kind == TEXT:
+                token.kind = ITEM
+    return token
+
+
+def lex_lines(lines: list[str]) -> list[Token]:
+    """Classify every line once, looking one line ahead for section header underlines."""
+    next_lines = lines[1:] + [""]
+    return [lex_line(index + 1, text, next_text) for index, (text, next_text) in enumerate(zip(lines, next_lines))]
 
 
-def parse_sections(lines: list[str], errors: list[str], label: str) -> dict[int, list[str]]:
-    sections: dict[int, list[str]] = {}
-    indices: list[tuple[int, int]] = []
-    for index in range(len(lines) - 1):
-        match = SECTION_HEADER_RE.match(lines[index])
-        if match and is_underline(lines[index + 1]):
-            number = int(match.group(1))
-            indices.append((number, index))
+def parse_sections(tokens: list[Token], errors: list[str], label: str) -> dict[int, list[Token]]:
+    sections: dict[int, list[Token]] = {}
+    headers = [index for index, token in enumerate(tokens) if token.kind == SECTION_HEADER]
 
-    if not indices:
+    if not headers:
         errors.append(f"{label} has no numbered sections")
         return sections
 
-    for position, (number, start_index) in enumerate(indices):
+    for position, start_index in enumerate(headers):
+        header = tokens[start_index]
+        number = int(header.groups[0])
         if number in sections:
-            errors.append(f"{label} has duplicate section {number}")
+            errors.append(f"{at(label, header)} has duplicate section {number}")
             continue
         start = start_index + 2
-        end = len(lines)
-        if position + 1 < len(indices):
-            end = indices[position + 1][1]
-        sections[number] = lines[start:end]
+        end = len(tokens)
+        if position + 1 < len(headers):
+            end = headers[position + 1]
+        sections[number] = tokens[start:end]
 
     return sections
 
 
-def first_paragraph(lines: list[str]) -> str:
+def first_paragraph(tokens: list[Token]) -> str:
     buffer: list[str] = []
-    for line in lines:
-        trimmed = line.strip()
-        if not trimmed:
+    for token in tokens:
+        if token.kind == BLANK:
             if buffer:
                 break
             continue
-        if trimmed.startswith("-"):
+        if token.marker == "-":
             continue
-        buffer.append(trimmed)
+        buffer.append(token.trimmed)
     return " ".join(buffer).strip()
 
 
-def parse_label_blocks(lines: list[str]) -> list[tuple[str, list[str]]]:
-    blocks: list[tuple[str, list[str]]] = []
-    label: str | None = None
-    bullets: list[str] = []
-    for line in lines:
-        trimmed = line.strip()
-        if not trimmed:
+def parse_label_blocks(tokens: list[Token]) -> list[tuple[Token, list[Token]]]:
+    """Split tokens into (label line, bullet lines) blocks; blank lines end a block."""
+    blocks: list[tuple[Token, list[Token]]] = []
+    label: Token | None = None
+    bullets: list[Token] = []
+    for token in tokens:
+        if token.kind == BLANK:
             if label:
                 blocks.append((label, bullets))
                 label = None
                 bullets = []
             continue
-        if trimmed.startswith("-") or trimmed.startswith("*"):
+        if token.marker:
             if label is None:
                 continue
-            bullets.append(trimmed.lstrip("-* ").strip())
+            bullets.append(token)
             continue
         if label:
             blocks.append((label, bullets))
-        label = trimmed
+        label = token
         bullets = []
     if label:
         blocks.append((label, bullets))
     return blocks
 
 
-def parse_start_screen(lines: list[str], errors: list[str], label: str) -> tuple[str, str, str, dict[int, str]]:
-    blocks = parse_label_blocks(lines)
+def bullet_texts(bullets: list[Token]) -> list[str]:
+    return [token.bullet for token in bullets if token.bullet]
+
+
+def parse_start_screen(tokens: list[Token], errors: list[str], label: str) -> tuple[str, str, str, dict[int, str]]:
+    blocks = parse_label_blocks(tokens)
     if len(blocks) < 3:
         errors.append(f"{label} section 3 must include title, short promise, and instructions")
         return "", "", "", {}
 
-    title = " ".join(blocks[0][1]).strip()
-    short_description = " ".join(blocks[1][1]).strip()
-    instructions_lines = blocks[2][1]
-    instructions = "\n".join(line.strip() for line in instructions_lines if line.strip()).strip()
+    title = " ".join(token.bullet for token in blocks[0][1]).strip()
+    short_description = " ".join(token.bullet for token in blocks[1][1]).strip()
+    instructions_label, instructions_bullets = blocks[2]
+    instructions = "\n".join(bullet_texts(instructions_bullets)).strip()
     if not title:
-        errors.append(f"{label} section 3 missing title")
+        errors.append(f"{at(label, blocks[0][0])} section 3 missing title")
     if not short_description:
-        errors.append(f"{label} section 3 missing short promise")
+        errors.append(f"{at(label, blocks[1][0])} section 3 missing short promise")
     if not instructions:
-        errors.append(f"{label} section 3 missing instructions")
+        errors.append(f"{at(label, instructions_label)} section 3 missing instructions")
 
     scale_labels: dict[int, str] = {}
-    for line in instructions_lines:
-        match = re.match(r"^\s*(\d+)\s*=\s*(.+)$", line)
-        if not match:
-            continue
-        number = int(match.group(1))
-        scale_labels[number] = match.group(2).strip()
+    for token in instructions_bullets:
+        if token.scale is not None:
+            number, scale_label = token.scale
+            scale_labels[number] = scale_label
 
     missing = [str(num) for num in range(1, 6) if num not in scale_labels]
     if missing:
-        errors.append(f"{label} instructions missing scale labels for: {', '.join(missing)}")
+        errors.append(f"{at(label, instructions_label)} instructions missing scale labels for: {', '.join(missing)}")
 
     return title, short_description, instructions, scale_labels
 
 
-def parse_values(lines: list[str], errors: list[str], label: str) -> dict[str, dict[str, str]]:
+def parse_values(tokens: list[Token], errors: list[str], label: str) -> dict[str, dict[str, str]]:
     values: dict[str, dict[str, str]] = {}
-    for line in lines:
-        match = VALUE_LINE_RE.match(line)
-        if not match:
+    for token in tokens:
+        if token.kind != VALUE:
             continue
-        raw_id = match.group(1)
+        raw_id, name, definition = token.groups
         if raw_id not in VALUE_ID_MAP:
-            errors.append(f"{label} has unknown value id {raw_id}")
+            errors.append(f"{at(label, token)} has unknown value id {raw_id}")
             continue
         value_id = VALUE_ID_MAP[raw_id]
         values[value_id] = {
-            "name": match.group(2).strip(),
-            "definition": match.group(3).strip()
+            "name": name.strip(),
+            "definition": definition.strip()
         }
 
     for value_id in VALUE_ORDER:
@@ -217,7 +428,7 @@ def parse_values(lines: list[str], errors: list[str], label: str) -> dict[str, d
     return values
 
 
-def parse_questions(lines: list[str], errors: list[str], label: str) -> dict[int, str]:
+def parse_questions(tokens: list[Token], errors: list[str], label: str) -> dict[int, str]:
     questions: dict[int, str] = {}
     current_num: int | None = None
     current_text: list[str] = []
@@ -229,18 +440,15 @@ def parse_questions(lines: list[str], errors: list[str], label: str) -> dict[int
         current_num = None
         current_text = []
 
-    for line in lines:
-        trimmed = line.strip()
-        if not trimmed:
+    for token in tokens:
+        if token.kind == BLANK:
             continue
-        match = QUESTION_LINE_RE.match(trimmed)
-        if match:
+        if token.kind == NUMBERED:
             flush()
-            current_num = int(match.group(1))
-            current_text = [match.group(2).strip()]
-        else:
-            if current_num is not None:
-                current_text.append(trimmed)
+            current_num = int(token.groups[0])
+            current_text = [token.groups[1].strip()]
+        elif current_num is not None:
+            current_text.append(token.trimmed)
 
     flush()
 
@@ -254,36 +462,42 @@ def parse_questions(lines: list[str], errors: list[str], label: str) -> dict[int
     return questions
 
 
-def parse_scoring_map(lines: list[str], errors: list[str], label: str) -> None:
-    table_values: dict[str, list[int]] = {}
-    for line in lines:
-        match = re.match(r"^\|\s*([A-Z0-9_]+)\s*\|\s*([0-9,\s]+)\|", line.strip())
-        if not match:
+def parse_scoring_map(tokens: list[Token], errors: list[str], label: str) -> None:
+    table_values: dict[str, tuple[list[int], Token]] = {}
+    for token in tokens:
+        if token.kind != TABLE_ROW:
             continue
-        raw_id = match.group(1)
-        numbers = [int(value.strip()) for value in match.group(2).split(",") if value.strip()]
-        table_values[raw_id] = numbers
+        raw_id, numbers_text = token.groups
+        numbers = [int(value.strip()) for value in numbers_text.split(",") if value.strip()]
+        table_values[raw_id] = (numbers, token)
 
     for raw_id, value_id in VALUE_ID_MAP.items():
         expected = VALUE_QUESTION_MAP[value_id]
-        actual = table_values.get(raw_id)
-        if actual is None:
+        row = table_values.get(raw_id)
+        if row is None:
             errors.append(f"{label} missing scoring map for {raw_id}")
             continue
+        actual, token = row
         if actual != expected:
-            errors.append(f"{label} scoring map for {raw_id} must be {expected}")
+            errors.append(f"{at(label, token)} scoring map for {raw_id} must be {expected}")
+
+
+def is_known_pair(token: Token) -> bool:
+    return token.kind == PAIR and token.groups[0] in VALUE_ID_MAP and token.groups[1] in VALUE_ID_MAP
+
+
+def is_known_profile(token: Token) -> bool:
+    return token.kind == PROFILE and token.groups[0] in VALUE_ID_MAP
 
 
-def parse_conflict_pairs(lines: list[str], errors: list[str], label: str) -> list[tuple[str, str]]:
+def parse_conflict_pairs(tokens: list[Token], errors: list[str], label: str) -> list[tuple[str, str]]:
     pairs: list[tuple[str, str]] = []
-    for line in lines:
-        match = PAIR_LINE_RE.match(line.strip())
-        if not match:
+    for token in tokens:
+        if token.kind != PAIR:
             continue
-        left = match.group(1)
-        right = match.group(2)
+        left, right = token.groups
         if left not in VALUE_ID_MAP or right not in VALUE_ID_MAP:
-            errors.append(f"{label} has unknown conflict pair {left} vs {right}")
+            errors.append(f"{at(label, token)} has unknown conflict pair {left} vs {right}")
             continue
         pairs.append((VALUE_ID_MAP[left], VALUE_ID_MAP[right]))
 
@@ -293,42 +507,38 @@ def parse_conflict_pairs(lines: list[str], errors: list[str], label: str) -> lis
     return pairs
 
 
-def parse_profiles(lines: list[str], errors: list[str], label: str) -> dict[str, dict[str, Any]]:
+def iter_headed_blocks(
+    tokens: list[Token],
+    is_heading: Callable[[Token], bool]
+) -> Iterator[tuple[Token, list[tuple[Token, list[Token]]]]]:
+    """Yield each heading with the label blocks up to the next heading; an underline below it is skipped."""
+    headings = [index for index, token in enumerate(tokens) if is_heading(token)]
+    for position, index in enumerate(headings):
+        start = index + 1
+        if start < len(tokens) and tokens[start].kind == UNDERLINE:
+            start += 1
+        end = headings[position + 1] if position + 1 < len(headings) else len(tokens)
+        yield tokens[index], parse_label_blocks(tokens[start:end])
+
+
+def parse_profiles(tokens: list[Token], errors: list[str], label: str) -> dict[str, dict[str, Any]]:
     profiles: dict[str, dict[str, Any]] = {}
-    index = 0
-    while index < len(lines):
-        line = lines[index].strip()
-        match = re.match(r"^\s*([A-Z0-9_]+)\s*\(([^)]+)\)\s*$", line)
-        if match and match.group(1) in VALUE_ID_MAP:
-            raw_id = match.group(1)
-            value_id = VALUE_ID_MAP[raw_id]
-            start = index + 1
-            if start < len(lines) and is_underline(lines[start]):
-                start += 1
-            end = start
-            while end < len(lines):
-                next_line = lines[end].strip()
-                next_match = re.match(r"^\s*([A-Z0-9_]+)\s*\(([^)]+)\)\s*$", next_line)
-                if next_match and next_match.group(1) in VALUE_ID_MAP:
-                    break
-                end += 1
-            blocks = parse_label_blocks(lines[start:end])
-            if len(blocks) < 2:
-                errors.append(f"{label} profile for {raw_id} missing preview or paid blocks")
-            else:
-                preview = " ".join(blocks[0][1]).strip()
-                paid = [line.strip() for line in blocks[1][1] if line.strip()]
-                if not preview:
-                    errors.append(f"{label} profile preview missing for {raw_id}")
-                if not paid:
-                    errors.append(f"{label} profile paid copy missing for {raw_id}")
-                profiles[value_id] = {
-                    "preview": preview,
-                    "paid": paid
-                }
-            index = end
+    for heading, blocks in iter_headed_blocks(tokens, is_known_profile):
+        raw_id = heading.groups[0]
+        value_id = VALUE_ID_MAP[raw_id]
+        if len(blocks) < 2:
+            errors.append(f"{at(label, heading)} profile for {raw_id} missing preview or paid blocks")
             continue
-        index += 1
+        preview = " ".join(token.bullet for token in blocks[0][1]).strip()
+        paid = bullet_texts(blocks[1][1])
+        if not preview:
+            errors.append(f"{at(label, heading)} profile preview missing for {raw_id}")
+        if not paid:
+            errors.append(f"{at(label, heading)} profile paid copy missing for {raw_id}")
+        profiles[value_id] = {
+            "preview": preview,
+            "paid": paid
+        }
 
     for value_id in VALUE_ORDER:
         if value_id not in profiles:
@@ -337,47 +547,29 @@ def parse_profiles(lines: list[str], errors: list[str], label: str) -> dict[str,
     return profiles
 
 
-def parse_conflict_library(lines: list[str], errors: list[str], label: str) -> dict[str, dict[str, Any]]:
+def parse_conflict_library(tokens: list[Token], errors: list[str], label: str) -> dict[str, dict[str, Any]]:
     conflict_library: dict[str, dict[str, Any]] = {}
-    index = 0
-    while index < len(lines):
-        line = lines[index].strip()
-        match = PAIR_LINE_RE.match(line)
-        if match and match.group(1) in VALUE_ID_MAP and match.group(2) in VALUE_ID_MAP:
-            left = VALUE_ID_MAP[match.group(1)]
-            right = VALUE_ID_MAP[match.group(2)]
-            pair_id = f"{left}_vs_{right}"
-            start = index + 1
-            if start < len(lines) and is_underline(lines[start]):
-                start += 1
-            end = start
-            while end < len(lines):
-                next_line = lines[end].strip()
-                next_match = PAIR_LINE_RE.match(next_line)
-                if next_match and next_match.group(1) in VALUE_ID_MAP and next_match.group(2) in VALUE_ID_MAP:
-                    break
-                end += 1
-            blocks = parse_label_blocks(lines[start:end])
-            if not blocks:
-                errors.append(f"{label} conflict block missing for {pair_id}")
-            else:
-                level = blocks[0][0].strip()
-                summary = " ".join(blocks[0][1]).strip()
-                playbook: list[str] = []
-                if len(blocks) > 1:
-                    playbook = [line.strip() for line in blocks[1][1] if line.strip()]
-                if not summary:
-                    errors.append(f"{label} conflict summary missing for {pair_id}")
-                if not playbook:
-                    errors.append(f"{label} conflict playbook missing for {pair_id}")
-                conflict_library[pair_id] = {
-                    "level": level,
-                    "summary": summary,
-                    "playbook": playbook
-                }
-            index = end
+    for heading, blocks in iter_headed_blocks(tokens, is_known_pair):
+        left = VALUE_ID_MAP[heading.groups[0]]
+        right = VALUE_ID_MAP[heading.groups[1]]
+        pair_id = f"{left}_vs_{right}"
+        if not blocks:
+            errors.append(f"{at(label, heading)} conflict block missing for {pair_id}")
             continue
-        index += 1
+        level = blocks[0][0].trimmed
+        summary = " ".join(token.bullet for token in blocks[0][1]).strip()
+        playbook: list[str] = []
+        if len(blocks) > 1:
+            playbook = bullet_texts(blocks[1][1])
+        if not summary:
+            errors.append(f"{at(label, heading)} conflict summary missing for {pair_id}")
+        if not playbook:
+            errors.append(f"{at(label, heading)} conflict playbook missing for {pair_id}")
+        conflict_library[pair_id] = {
+            "level": level,
+            "summary": summary,
+            "playbook": playbook
+        }
 
     if not conflict_library:
         errors.append(f"{label} conflict library is empty")
@@ -385,102 +577,90 @@ def parse_conflict_library(lines: list[str], errors: list[str], label: str) -> d
     return conflict_library
 
 
-def parse_subsections(lines: list[str]) -> list[tuple[str, list[str]]]:
-    subsections: list[tuple[str, list[str]]] = []
-    index = 0
-    while index < len(lines) - 1:
-        heading = lines[index].strip()
-        if heading and is_underline(lines[index + 1]):
-            start = index + 2
-            end = start
-            while end < len(lines) - 1:
-                if lines[end].strip() and is_underline(lines[end + 1]):
-                    break
-                end += 1
-            subsections.append((heading, lines[start:end]))
-            index = end
+def parse_subsections(tokens: list[Token]) -> list[tuple[Token, list[Token]]]:
+    """Underlined headings within a section and the tokens below each, up to the next heading."""
+    headings = [
+        index
+        for index in range(len(tokens) - 1)
+        if tokens[index].kind != BLANK and tokens[index + 1].kind == UNDERLINE
+    ]
+    subsections: list[tuple[Token, list[Token]]] = []
+    next_start = 0
+    for position, index in enumerate(headings):
+        # An underline followed by another underline reads as a heading too; it is skipped.
+        if index < next_start:
             continue
-        index += 1
+        start = index + 2
+        end = next((later for later in headings[position + 1:] if later >= start), len(tokens) - 1)
+        subsections.append((tokens[index], tokens[start:end]))
+        next_start = end
     return subsections
 
 
-def extract_paywall_hook(lines: list[str]) -> tuple[str, list[str]]:
-    cleaned_lines: list[str] = []
+def extract_paywall_hook(tokens: list[Token]) -> tuple[str, list[Token]]:
+    cleaned: list[Token] = []
     hook_lines: list[str] = []
-    skip_until = -1
-    for index, line in enumerate(lines):
-        if index <= skip_until:
-            continue
-        trimmed = line.strip()
-        if "paywall" in trimmed.lower():
-            hook_lines = []
-            end = index + 1
-            while end < len(lines):
-                bullet = lines[end].strip()
-                if not bullet:
-                    break
-                if bullet.startswith("-") or bullet.startswith("*"):
-                    hook_lines.append(bullet.lstrip("-* ").strip())
-                    end += 1
-                    continue
-                break
-            skip_until = end - 1
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        index += 1
+        if "paywall" not in token.trimmed.lower():
+            cleaned.append(token)
             continue
-        cleaned_lines.append(line)
+        hook_lines = []
+        while index < len(tokens) and tokens[index].marker:
+            hook_lines.append(tokens[index].bullet)
+            index += 1
 
     hook = " ".join(hook_lines).strip()
-    return hook, cleaned_lines
+    return hook, cleaned
 
 
-def parse_result_templates(lines: list[str], errors: list[str], label: str) -> tuple[str, str, list[str]]:
-    subsections = parse_subsections(lines)
+def parse_result_templates(tokens: list[Token], errors: list[str], label: str) -> tuple[str, str, list[str]]:
+    subsections = parse_subsections(tokens)
     if len(subsections) < 2:
         errors.append(f"{label} section 9 must include free preview and paid report structure")
         return "", "", []
 
-    free_preview_lines = subsections[0][1]
-    paywall_hook, preview_lines = extract_paywall_hook(free_preview_lines)
-    preview_template = "\n".join(line.rstrip() for line in preview_lines if line.strip()).strip()
+    preview_heading, free_preview_tokens = subsections[0]
+    paywall_hook, preview_tokens = extract_paywall_hook(free_preview_tokens)
+    preview_template = "\n".join(token.text.rstrip() for token in preview_tokens if token.kind != BLANK).strip()
     if not preview_template:
-        errors.append(f"{label} free preview template is empty")
+        errors.append(f"{at(label, preview_heading)} free preview template is empty")
     if not paywall_hook:
-        errors.append(f"{label} paywall hook missing")
+        errors.append(f"{at(label, preview_heading)} paywall hook missing")
 
-    paid_lines = subsections[1][1]
+    paid_heading, paid_tokens = subsections[1]
     title = ""
     sections: list[str] = []
-    for line in paid_lines:
-        trimmed = line.strip()
-        if not trimmed:
-            continue
-        if not title and trimmed.startswith("-"):
-            title = trimmed.lstrip("-* ").strip()
-        match = re.match(r"^\s*\d+\)\s*(.+)$", trimmed)
-        if match:
-            sections.append(match.group(1).strip())
+    for token in paid_tokens:
+        if not title and token.marker == "-":
+            title = token.bullet
+        if token.item is not None:
+            sections.append(token.item.strip())
 
     if not title:
-        errors.append(f"{label} paid report title missing")
+        errors.append(f"{at(label, paid_heading)} paid report title missing")
     if not sections:
-        errors.append(f"{label} paid report sections missing")
+        errors.append(f"{at(label, paid_heading)} paid report sections missing")
 
     return preview_template, paywall_hook, [title] + sections
 
 
-def parse_paywall_copy(lines: list[str], errors: list[str], label: str) -> dict[str, Any]:
-    blocks = parse_label_blocks(lines)
+def parse_paywall_copy(tokens: list[Token], errors: list[str], label: str) -> dict[str, Any]:
+    blocks = parse_label_blocks(tokens)
     if len(blocks) < 3:
         errors.append(f"{label} section 10 must include CTA, bullets, and short line")
         return {}
-    cta = " ".join(blocks[0][1]).strip()
-    bullets = [line.strip() for line in blocks[1][1] if line.strip()]
-    short_line = " ".join(blocks[2][1]).strip()
+    cta = " ".join(token.bullet for token in blocks[0][1]).strip()
+    bullets = bullet_texts(blocks[1][1])
+    short_line = " ".join(token.bullet for token in blocks[2][1]).strip()
     if not cta:
-        errors.append(f"{label} paywall CTA missing")
+        errors.append(f"{at(label, blocks[0][0])} paywall CTA missing")
     if not bullets:
-        errors.append(f"{label} paywall bullets missing")
+        errors.append(f"{at(label, blocks[1][0])} paywall bullets missing")
     if not short_line:
-        errors.append(f"{label} paywall short line missing")
+        errors.append(f"{at(label, blocks[2][0])} paywall short line missing")
     return {
         "cta": cta,
         "bullets": bullets,
@@ -488,14 +668,37 @@ def parse_paywall_copy(lines: list[str], errors: list[str], label: str) -> dict[
     }
 
 
-def parse_locale_file(path: Path, locale: str, errors: list[str]) -> LocaleData:
+def parse_locale_file(
+    path: Path,
+    locale: str,
+    errors: list[str],
+    cache: ParseCache | None = None
+) -> LocaleData:
     label = f"{locale} ({path})"
     if not path.exists():
         errors.append(f"{label} source file not found")
         return LocaleData(locale)
 
-    lines = path.read_text(encoding="utf-8").splitlines()
-    sections = parse_sections(lines, errors, label)
+    raw = path.read_bytes()
+    if cache is None:
+        return parse_locale_text(raw.decode("utf-8"), locale, label, errors)
+
+    digest = hashlib.sha256(raw).hexdigest()
+    cached = cache.get(path, locale, digest)
+    if cached is not None:
+        locale_data, cached_errors = cached
+        errors.extend(cached_errors)
+        return locale_data
+    parse_errors: list[str] = []
+    locale_data = parse_locale_text(raw.decode("utf-8"), locale, label, parse_errors)
+    cache.put(path, digest, locale_data, parse_errors)
+    errors.extend(parse_errors)
+    return locale_data
+
+
+def parse_locale_text(text: str, locale: str, label: str, errors: list[str]) -> LocaleData:
+    tokens = lex_lines(text.splitlines())
+    sections = parse_sections(tokens, errors, label)
 
     locale_data = LocaleData(locale)
     section1 = sections.get(1, [])
@@ -748,13 +951,23 @@ def validate_locale_data(locales: dict[str, LocaleData], errors: list[str]) -> N
             errors.append(f"{locale} missing conflict pairs")
 
 
-def main() -> int:
-    args = parse_args()
+def convert(
+    test_id: str,
+    slug: str,
+    category: str,
+    version: int,
+    sources: dict[str, Path],
+    cache: ParseCache | None = None
+) -> tuple[dict[str, Any] | None, list[str]]:
+    """Build a values_compass_v1 spec from the en, es and pt-BR sources; the spec is None on errors.
+
+    With a cache, only source files whose content changed are parsed again.
+    """
     errors: list[str] = []
 
-    test_id = args.test_id.strip()
-    slug = args.slug.strip()
-    category = args.category.strip()
+    test_id = test_id.strip()
+    slug = slug.strip()
+    category = category.strip()
 
     if not validate_catalog.TEST_ID_PATTERN.match(test_id):
         errors.append("test_id must match test-<slug>")
@@ -764,18 +977,12 @@ def main() -> int:
         errors.append("test_id must align with slug")
     if not category:
         errors.append("category must be a non-empty string")
-    if args.version < 1:
+    if version < 1:
         errors.append("version must be >= 1")
 
-    locale_paths = {
-        "en": Path(args.en),
-        "es": Path(args.es),
-        "pt-BR": Path(args.ptbr)
-    }
-
     locales: dict[str, LocaleData] = {}
-    for locale, path in locale_paths.items():
-        locales[locale] = parse_locale_file(path, locale, errors)
+    for locale in ("en", "es", "pt-BR"):
+        locales[locale] = parse_locale_file(sources[locale], locale, errors, cache)
 
     validate_locale_data(locales, errors)
 
@@ -785,9 +992,7 @@ def main() -> int:
             errors.append(f"{locale} conflict pairs do not match")
 
     if errors:
-        for message in errors:
-            print(f"ERROR: {message}", file=sys.stderr)
-        return 1
+        return None, errors
 
     locales_output: dict[str, dict[str, str]] = {}
     for locale, data in locales.items():
@@ -803,7 +1008,7 @@ def main() -> int:
     spec = {
         "test_id": test_id,
         "slug": slug,
-        "version": args.version,
+        "version": version,
         "category": category,
         "locales": locales_output,
         "questions": build_questions(locales),
@@ -814,11 +1019,27 @@ def main() -> int:
         "conflicts": build_conflicts(locales, base_pairs),
         "templates": build_templates(locales)
     }
+    return spec, errors
 
-    output_path = Path(args.out)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(spec, indent=2) + "\n", encoding="utf-8")
 
+def main() -> int:
+    args = parse_args()
+    sources = {
+        "en": Path(args.en),
+        "es": Path(args.es),
+        "pt-BR": Path(args.ptbr)
+    }
+    cache = None if args.no_cache else ParseCache.load(args.cache_path)
+    spec, errors = convert(args.test_id, args.slug, args.category, args.version, sources, cache)
+    if cache is not None:
+        cache.save()
+
+    if spec is None:
+        for message in errors:
+            print(f"ERROR: {message}", file=sys.stderr)
+        return 1
+
+    write_json(Path(args.out), spec)
     return 0
 
 
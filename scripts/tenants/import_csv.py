@@ -8,6 +8,10 @@ from pathlib import Path
 
 from tenant_utils import build_registry, normalize_domain, normalize_locale, serialize_registry
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "content"))
+
+from atomic_write import write_text  # noqa: E402
+
 REQUIRED_COLUMNS = {"tenant_id", "domains", "default_locale"}
 
 
@@ -141,7 +145,7 @@ def main() -> int:
     if args.check_only:
         return 0
 
-    output_path.write_text(output_json, encoding="utf-8")
+    write_text(output_path, output_json)
     return 0
 
 
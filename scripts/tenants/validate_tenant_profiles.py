@@ -7,6 +7,17 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "content"))
+
+from diagnostics import (  # noqa: E402
+    DiagnosticLimitReached,
+    DiagnosticSink,
+    add_diagnostic_arguments,
+    check_diagnostic_arguments,
+    diagnostic_error
+)
+from json_source import JsonSource  # noqa: E402
+
 EXPECTED_TOP_LEVEL_KEYS = {"profiles"}
 EXPECTED_PROFILE_KEYS = {
     "tenant_id",
@@ -20,7 +31,7 @@ ALLOWED_TENANT_KINDS = {"hub", "niche"}
 SLUG_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Validate config/tenant_profiles.json")
     parser.add_argument(
         "--file",
@@ -32,46 +43,72 @@ def parse_args() -> argparse.Namespace:
         default="config/tenants.json",
         help="Path to tenants.json (default: config/tenants.json)"
     )
-    return parser.parse_args()
+    add_diagnostic_arguments(parser)
+    args = parser.parse_args(argv)
+    check_diagnostic_arguments(parser, args)
+    return args
 
 
 def load_json(path: Path, label: str) -> tuple[str | None, object | None, list[str]]:
     if not path.exists():
-        return None, None, [f"{label} not found: {path}"]
+        message = f"not found: {path}"
+        return None, None, [diagnostic_error("not-found", message, file=str(path), text=f"{label} {message}")]
 
     raw_text = path.read_text(encoding="utf-8")
     try:
         return raw_text, json.loads(raw_text), []
     except json.JSONDecodeError as exc:
-        return raw_text, None, [f"{label} is not valid JSON: {exc}"]
+        message = f"is not valid JSON: {exc}"
+        error = diagnostic_error(
+            "invalid-json",
+            message,
+            file=str(path),
+            text=f"{label} {message}",
+            line=exc.lineno,
+            column=exc.colno
+        )
+        return raw_text, None, [error]
 
 
-def load_tenant_ids(tenants_data: object) -> tuple[set[str], list[str]]:
-    errors: list[str] = []
+def load_tenant_ids(
+    tenants_data: object,
+    errors: list[str] | None = None
+) -> tuple[set[str], list[str]]:
+    errors = [] if errors is None else errors
     if not isinstance(tenants_data, dict):
-        errors.append("tenants.json must contain a top-level object")
+        errors.append(
+            diagnostic_error(
+                "object",
+                "must contain a top-level object",
+                text="tenants.json must contain a top-level object"
+            )
+        )
         return set(), errors
 
     tenants = tenants_data.get("tenants")
     if not isinstance(tenants, list):
-        errors.append("tenants.json must contain a tenants array")
+        errors.append(
+            diagnostic_error("array", "must contain a tenants array", text="tenants.json must contain a tenants array")
+        )
         return set(), errors
 
     tenant_ids: set[str] = set()
     for index, tenant in enumerate(tenants):
         label = f"tenants[{index}]"
         if not isinstance(tenant, dict):
-            errors.append(f"{label} must be an object")
+            errors.append(diagnostic_error("object", "must be an object", label))
             continue
 
         tenant_id = tenant.get("tenant_id")
         if not isinstance(tenant_id, str) or not tenant_id.strip():
-            errors.append(f"{label}.tenant_id must be a non-empty string")
+            errors.append(diagnostic_error("non-empty-string", "must be a non-empty string", f"{label}.tenant_id"))
             continue
 
         normalized = tenant_id.strip()
         if normalized != tenant_id:
-            errors.append(f"{label}.tenant_id must not include leading or trailing spaces")
+            errors.append(
+                diagnostic_error("invalid", "must not include leading or trailing spaces", f"{label}.tenant_id")
+            )
             continue
 
         tenant_ids.add(normalized)
@@ -81,12 +118,12 @@ def load_tenant_ids(tenants_data: object) -> tuple[set[str], list[str]]:
 
 def expect_non_empty_string(value: object, path: str, errors: list[str]) -> str | None:
     if not isinstance(value, str) or not value.strip():
-        errors.append(f"{path} must be a non-empty string")
+        errors.append(diagnostic_error("non-empty-string", "must be a non-empty string", path))
         return None
 
     normalized = value.strip()
     if normalized != value:
-        errors.append(f"{path} must not include leading or trailing spaces")
+        errors.append(diagnostic_error("invalid", "must not include leading or trailing spaces", path))
         return None
 
     return normalized
@@ -112,12 +149,22 @@ def serialize_profiles(profiles: list[dict[str, object]]) -> str:
     return json.dumps({"profiles": canonical_profiles}, indent=2, ensure_ascii=True) + "\n"
 
 
-def validate_profiles(data: object, tenant_ids: set[str]) -> tuple[list[dict[str, object]], list[str]]:
-    errors: list[str] = []
+def validate_profiles(
+    data: object,
+    tenant_ids: set[str],
+    errors: list[str] | None = None
+) -> tuple[list[dict[str, object]], list[str]]:
+    errors = [] if errors is None else errors
     profiles: list[dict[str, object]] = []
 
     if not isinstance(data, dict):
-        errors.append("tenant_profiles.json must contain a top-level object")
+        errors.append(
+            diagnostic_error(
+                "object",
+                "must contain a top-level object",
+                text="tenant_profiles.json must contain a top-level object"
+            )
+        )
         return profiles, errors
 
     top_level_keys = set(data.keys())
@@ -125,20 +172,29 @@ def validate_profiles(data: object, tenant_ids: set[str]) -> tuple[list[dict[str
         missing = EXPECTED_TOP_LEVEL_KEYS - top_level_keys
         extra = top_level_keys - EXPECTED_TOP_LEVEL_KEYS
         if missing:
-            errors.append(f"tenant_profiles.json is missing keys: {', '.join(sorted(missing))}")
+            message = f"is missing keys: {', '.join(sorted(missing))}"
+            errors.append(diagnostic_error("missing", message, text=f"tenant_profiles.json {message}"))
         if extra:
-            errors.append(f"tenant_profiles.json has unexpected keys: {', '.join(sorted(extra))}")
+            message = f"has unexpected keys: {', '.join(sorted(extra))}"
+            errors.append(diagnostic_error("unexpected-key", message, text=f"tenant_profiles.json {message}"))
 
     raw_profiles = data.get("profiles")
     if not isinstance(raw_profiles, list):
-        errors.append("tenant_profiles.json.profiles must be an array")
+        errors.append(
+            diagnostic_error(
+                "array",
+                "must be an array",
+                "profiles",
+                text="tenant_profiles.json.profiles must be an array"
+            )
+        )
         return profiles, errors
 
     seen_tenant_ids: set[str] = set()
     for index, raw_profile in enumerate(raw_profiles):
         label = f"profiles[{index}]"
         if not isinstance(raw_profile, dict):
-            errors.append(f"{label} must be an object")
+            errors.append(diagnostic_error("object", "must be an object", label))
             continue
 
         profile_keys = set(raw_profile.keys())
@@ -146,21 +202,29 @@ def validate_profiles(data: object, tenant_ids: set[str]) -> tuple[list[dict[str
             missing = EXPECTED_PROFILE_KEYS - profile_keys
             extra = profile_keys - EXPECTED_PROFILE_KEYS
             if missing:
-                errors.append(f"{label} is missing keys: {', '.join(sorted(missing))}")
+                errors.append(diagnostic_error("missing", f"is missing keys: {', '.join(sorted(missing))}", label))
             if extra:
-                errors.append(f"{label} has unexpected keys: {', '.join(sorted(extra))}")
+                errors.append(
+                    diagnostic_error("unexpected-key", f"has unexpected keys: {', '.join(sorted(extra))}", label)
+                )
 
         tenant_id = expect_non_empty_string(raw_profile.get("tenant_id"), f"{label}.tenant_id", errors)
         if tenant_id:
             if tenant_id not in tenant_ids:
-                errors.append(f"{label}.tenant_id {tenant_id} does not exist in tenants.json")
+                errors.append(
+                    diagnostic_error(
+                        "cross-reference",
+                        f"{tenant_id} does not exist in tenants.json",
+                        f"{label}.tenant_id"
+                    )
+                )
             if tenant_id in seen_tenant_ids:
-                errors.append(f"{label}.tenant_id {tenant_id} is duplicated")
+                errors.append(diagnostic_error("duplicate", f"{tenant_id} is duplicated", f"{label}.tenant_id"))
             seen_tenant_ids.add(tenant_id)
 
         tenant_kind = expect_non_empty_string(raw_profile.get("tenant_kind"), f"{label}.tenant_kind", errors)
         if tenant_kind and tenant_kind not in ALLOWED_TENANT_KINDS:
-            errors.append(f"{label}.tenant_kind must be one of: hub, niche")
+            errors.append(diagnostic_error("invalid", "must be one of: hub, niche", f"{label}.tenant_kind"))
 
         profile_label = expect_non_empty_string(raw_profile.get("label"), f"{label}.label", errors)
         home_headline = expect_non_empty_string(
@@ -177,26 +241,26 @@ def validate_profiles(data: object, tenant_ids: set[str]) -> tuple[list[dict[str
         featured_raw = raw_profile.get("featured_test_slugs")
         featured_test_slugs: list[str] = []
         if not isinstance(featured_raw, list):
-            errors.append(f"{label}.featured_test_slugs must be an array")
+            errors.append(diagnostic_error("array", "must be an array", f"{label}.featured_test_slugs"))
         else:
             seen_slugs: set[str] = set()
             for slug_index, slug_value in enumerate(featured_raw):
                 slug_path = f"{label}.featured_test_slugs[{slug_index}]"
                 if not isinstance(slug_value, str) or not slug_value.strip():
-                    errors.append(f"{slug_path} must be a non-empty string")
+                    errors.append(diagnostic_error("non-empty-string", "must be a non-empty string", slug_path))
                     continue
 
                 normalized_slug = slug_value.strip().lower()
                 if slug_value != normalized_slug:
-                    errors.append(f"{slug_path} must be normalized, use {normalized_slug}")
+                    errors.append(diagnostic_error("invalid", f"must be normalized, use {normalized_slug}", slug_path))
                     continue
 
                 if not SLUG_PATTERN.match(normalized_slug):
-                    errors.append(f"{slug_path} must be a normalized slug")
+                    errors.append(diagnostic_error("invalid", "must be a normalized slug", slug_path))
                     continue
 
                 if normalized_slug in seen_slugs:
-                    errors.append(f"{slug_path} duplicates slug {normalized_slug}")
+                    errors.append(diagnostic_error("duplicate", f"duplicates slug {normalized_slug}", slug_path))
                     continue
 
                 seen_slugs.add(normalized_slug)
@@ -223,45 +287,56 @@ def validate_profiles(data: object, tenant_ids: set[str]) -> tuple[list[dict[str
     return profiles, errors
 
 
-def main() -> int:
-    args = parse_args()
-    profiles_path = Path(args.file)
-    tenants_path = Path(args.tenants_file)
-
+def validate_files(profiles_path: Path, tenants_path: Path, errors: DiagnosticSink) -> int:
+    # Errors go straight to the sink, so --fail-fast stops before the next tenant or profile.
+    # Load errors for both files come first (they name their file), then tenant validation,
+    # then profile validation.
     _, tenants_data, tenant_load_errors = load_json(tenants_path, "tenants.json")
     raw_profiles_text, profiles_data, profile_load_errors = load_json(
         profiles_path,
         "tenant_profiles.json"
     )
-
-    errors = [*tenant_load_errors, *profile_load_errors]
+    errors.extend(tenant_load_errors)
+    errors.extend(profile_load_errors)
 
     tenant_ids: set[str] = set()
     if tenants_data is not None:
-        tenant_ids, tenant_validation_errors = load_tenant_ids(tenants_data)
-        errors.extend(tenant_validation_errors)
+        errors.default_file = str(tenants_path)
+        errors.locate = JsonSource(tenants_path, tenants_data).locate
+        tenant_ids, _ = load_tenant_ids(tenants_data, errors)
 
     parsed_profiles: list[dict[str, object]] = []
+    errors.default_file = str(profiles_path)
+    errors.locate = None
     if profiles_data is not None:
-        parsed_profiles, profile_validation_errors = validate_profiles(profiles_data, tenant_ids)
-        errors.extend(profile_validation_errors)
+        errors.locate = JsonSource(profiles_path, profiles_data).locate
+        parsed_profiles, _ = validate_profiles(profiles_data, tenant_ids, errors)
 
     if errors:
-        for message in errors:
-            print(f"ERROR: {message}", file=sys.stderr)
         return 1
 
     canonical = serialize_profiles(parsed_profiles)
     if canonical != raw_profiles_text:
-        print(
-            "ERROR: tenant_profiles.json is not deterministically sorted or formatted. "
-            "Sort profiles by tenant_id and keep featured_test_slugs in intended order.",
-            file=sys.stderr
+        message = (
+            "is not deterministically sorted or formatted. "
+            "Sort profiles by tenant_id and keep featured_test_slugs in intended order."
         )
+        errors.append(diagnostic_error("not-canonical", message, text=f"tenant_profiles.json {message}"))
         return 1
 
     return 0
 
 
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    errors = DiagnosticSink.from_args("validate_tenant_profiles", args)
+    try:
+        exit_code = validate_files(Path(args.file), Path(args.tenants_file), errors)
+    except DiagnosticLimitReached:
+        exit_code = 1
+    errors.close()
+    return exit_code
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
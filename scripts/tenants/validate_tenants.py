@@ -8,25 +8,38 @@ from pathlib import Path
 
 from tenant_utils import build_registry, normalize_domain, normalize_locale, serialize_registry
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "content"))
+
+from diagnostics import (  # noqa: E402
+    DiagnosticLimitReached,
+    DiagnosticSink,
+    add_diagnostic_arguments,
+    check_diagnostic_arguments,
+    diagnostic_error
+)
+from json_source import JsonSource  # noqa: E402
+
 EXPECTED_KEYS = {"tenant_id", "domains", "default_locale"}
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Validate config/tenants.json")
     parser.add_argument(
         "--file",
         default="config/tenants.json",
         help="Path to tenants.json (default: config/tenants.json)"
     )
-    return parser.parse_args()
+    add_diagnostic_arguments(parser)
+    args = parser.parse_args(argv)
+    check_diagnostic_arguments(parser, args)
+    return args
 
 
-def main() -> int:
-    args = parse_args()
-    file_path = Path(args.file)
-
+def validate_tenants_file(file_path: Path, errors: DiagnosticSink) -> int:
     if not file_path.exists():
-        print(f"ERROR: tenants.json not found: {file_path}", file=sys.stderr)
+        errors.append(
+            diagnostic_error("not-found", f"not found: {file_path}", text=f"tenants.json not found: {file_path}")
+        )
         return 1
 
     raw_text = file_path.read_text(encoding="utf-8")
@@ -34,26 +47,42 @@ def main() -> int:
     try:
         data = json.loads(raw_text)
     except json.JSONDecodeError as exc:
-        print(f"ERROR: tenants.json is not valid JSON: {exc}", file=sys.stderr)
+        errors.append(
+            diagnostic_error(
+                "invalid-json",
+                f"is not valid JSON: {exc}",
+                text=f"tenants.json is not valid JSON: {exc}",
+                line=exc.lineno,
+                column=exc.colno
+            )
+        )
         return 1
 
     if not isinstance(data, dict):
-        print("ERROR: tenants.json must contain a top-level object", file=sys.stderr)
+        errors.append(
+            diagnostic_error(
+                "object",
+                "must contain a top-level object",
+                text="tenants.json must contain a top-level object"
+            )
+        )
         return 1
 
     tenants = data.get("tenants")
     if not isinstance(tenants, list):
-        print("ERROR: tenants.json must contain a tenants array", file=sys.stderr)
+        errors.append(
+            diagnostic_error("array", "must contain a tenants array", text="tenants.json must contain a tenants array")
+        )
         return 1
 
-    errors: list[str] = []
+    errors.locate = JsonSource(file_path, data).locate
     tenant_records: dict[str, dict[str, object]] = {}
     domain_to_tenant: dict[str, str] = {}
 
     for index, tenant in enumerate(tenants):
         label = f"tenants[{index}]"
         if not isinstance(tenant, dict):
-            errors.append(f"{label} must be an object")
+            errors.append(diagnostic_error("object", "must be an object", label))
             continue
 
         tenant_keys = set(tenant.keys())
@@ -61,66 +90,74 @@ def main() -> int:
             missing = EXPECTED_KEYS - tenant_keys
             extra = tenant_keys - EXPECTED_KEYS
             if missing:
-                errors.append(
-                    f"{label} is missing keys: {', '.join(sorted(missing))}"
-                )
+                errors.append(diagnostic_error("missing", f"is missing keys: {', '.join(sorted(missing))}", label))
             if extra:
                 errors.append(
-                    f"{label} has unexpected keys: {', '.join(sorted(extra))}"
+                    diagnostic_error("unexpected-key", f"has unexpected keys: {', '.join(sorted(extra))}", label)
                 )
 
         tenant_id = tenant.get("tenant_id")
         if not isinstance(tenant_id, str) or not tenant_id.strip():
-            errors.append(f"{label}.tenant_id must be a non-empty string")
+            errors.append(diagnostic_error("non-empty-string", "must be a non-empty string", f"{label}.tenant_id"))
             continue
 
         if tenant_id != tenant_id.strip():
-            errors.append(f"{label}.tenant_id must not include leading or trailing spaces")
+            errors.append(
+                diagnostic_error("invalid", "must not include leading or trailing spaces", f"{label}.tenant_id")
+            )
 
         if tenant_id in tenant_records:
-            errors.append(f"{label}.tenant_id {tenant_id} is duplicated")
+            errors.append(diagnostic_error("duplicate", f"{tenant_id} is duplicated", f"{label}.tenant_id"))
             continue
 
         default_locale = tenant.get("default_locale")
         if not isinstance(default_locale, str) or not default_locale.strip():
-            errors.append(f"{label}.default_locale must be a non-empty string")
+            errors.append(
+                diagnostic_error("non-empty-string", "must be a non-empty string", f"{label}.default_locale")
+            )
             continue
 
         try:
             canonical_locale = normalize_locale(default_locale)
         except ValueError as exc:
-            errors.append(f"{label}.default_locale {exc}")
+            errors.append(diagnostic_error("invalid", str(exc), f"{label}.default_locale"))
             continue
 
         if canonical_locale != default_locale:
-            errors.append(f"{label}.default_locale must be {canonical_locale}")
+            errors.append(diagnostic_error("invalid", f"must be {canonical_locale}", f"{label}.default_locale"))
 
         domains = tenant.get("domains")
         if not isinstance(domains, list) or not domains:
-            errors.append(f"{label}.domains must be a non-empty array")
+            errors.append(diagnostic_error("array", "must be a non-empty array", f"{label}.domains"))
             continue
 
         normalized_domains: set[str] = set()
         for domain in domains:
             if not isinstance(domain, str) or not domain.strip():
-                errors.append(f"{label}.domains entries must be non-empty strings")
+                errors.append(
+                    diagnostic_error("non-empty-string", "entries must be non-empty strings", f"{label}.domains")
+                )
                 continue
 
             try:
                 normalized = normalize_domain(domain)
             except ValueError as exc:
-                errors.append(f"{label}.domains {exc}")
+                errors.append(diagnostic_error("invalid", str(exc), f"{label}.domains"))
                 continue
 
             if normalized != domain:
                 errors.append(
-                    f"{label}.domains {domain} is not normalized, use {normalized}"
+                    diagnostic_error("invalid", f"{domain} is not normalized, use {normalized}", f"{label}.domains")
                 )
 
             if normalized in domain_to_tenant:
                 existing_tenant = domain_to_tenant[normalized]
                 errors.append(
-                    f"{label}.domains {normalized} already assigned to {existing_tenant}"
+                    diagnostic_error(
+                        "duplicate",
+                        f"{normalized} already assigned to {existing_tenant}",
+                        f"{label}.domains"
+                    )
                 )
                 continue
 
@@ -133,21 +170,28 @@ def main() -> int:
         }
 
     if errors:
-        for message in errors:
-            print(f"ERROR: {message}", file=sys.stderr)
         return 1
 
     canonical = serialize_registry(build_registry(tenant_records))
     if canonical != raw_text:
-        print(
-            "ERROR: tenants.json is not deterministically sorted or formatted. "
-            "Run the tenant import script to regenerate it.",
-            file=sys.stderr
-        )
+        message = "is not deterministically sorted or formatted. Run the tenant import script to regenerate it."
+        errors.append(diagnostic_error("not-canonical", message, text=f"tenants.json {message}"))
         return 1
 
     return 0
 
 
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    file_path = Path(args.file)
+    errors = DiagnosticSink.from_args("validate_tenants", args, default_file=str(file_path))
+    try:
+        exit_code = validate_tenants_file(file_path, errors)
+    except DiagnosticLimitReached:
+        exit_code = 1
+    errors.close()
+    return exit_code
+
+
 if __name__ == "__main__":
     raise SystemExit(main())